@@ -1,3 +1,4 @@
+from django.conf import settings
 from rest_framework import serializers
 from app.models.booking import Booking
 from app.models.customer import Customer
@@ -19,6 +20,8 @@ class CreateBookingRequest(serializers.Serializer):
     def validate(self, attrs):
         ticket = attrs.get('ticket')
         quantity = attrs.get('quantity')
+        if ticket and attrs.get('event') and ticket.event_id != attrs['event'].id:
+            raise serializers.ValidationError({'ticket': "Ticket does not belong to this event."})
         if ticket and quantity:
             attrs['total_amount'] = ticket.price * quantity
         return attrs
@@ -39,11 +42,32 @@ class AdminCreateBookingRequest(serializers.Serializer):
     def validate(self, attrs):
         ticket = attrs.get('ticket')
         quantity = attrs.get('quantity')
+        if ticket and attrs.get('event') and ticket.event_id != attrs['event'].id:
+            raise serializers.ValidationError({'ticket': "Ticket does not belong to this event."})
         if ticket and quantity:
             attrs['total_amount'] = ticket.price * quantity
         return attrs
 
 
+class BatchBookingLineRequest(serializers.Serializer):
+    """One line of a batch booking. Ids are resolved in bulk by the service."""
+    customer = serializers.IntegerField(min_value=1)
+    event = serializers.IntegerField(min_value=1)
+    ticket = serializers.IntegerField(min_value=1)
+    quantity = serializers.IntegerField(min_value=1, max_value=10)
+
+
+class AdminBatchBookingRequest(serializers.Serializer):
+    """Serializer for admin creating many Bookings in one call."""
+    bookings = serializers.ListField(child=BatchBookingLineRequest(), allow_empty=False)
+
+    def validate_bookings(self, value):
+        max_lines = getattr(settings, 'BATCH_BOOKING_MAX_LINES', 500)
+        if len(value) > max_lines:
+            raise serializers.ValidationError(f"At most {max_lines} bookings per batch.")
+        return value
+
+
 class UpdateBookingRequest(serializers.Serializer):
     """Serializer for updating a Booking. All fields optional for partial updates."""
     customer = serializers.PrimaryKeyRelatedField(queryset=Customer.objects.all(), required=False)
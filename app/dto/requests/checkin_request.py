@@ -31,3 +31,11 @@ class ConfirmCheckinRequest(serializers.Serializer):
     Serializer for confirming a check-in.
     """
     ticket_code = serializers.CharField(max_length=255)
+
+
+class ScanTicketRequest(serializers.Serializer):
+    """
+    Serializer for a gate scan; event_id, when sent, rejects tickets for other events.
+    """
+    ticket_code = serializers.CharField(max_length=255)
+    event_id = serializers.IntegerField(required=False)
@@ -15,6 +15,7 @@ class CreateEventRequest(serializers.Serializer):
     venue_id = serializers.IntegerField()
     image = serializers.ImageField(required=False, allow_null=True)
     status = serializers.ChoiceField(choices=['upcoming', 'ongoing', 'completed', 'cancelled'], default='upcoming')
+    admission_rate = serializers.IntegerField(min_value=0, default=0, help_text="Waiting-room admissions per second (0 = no waiting room)")
 
 class UpdateEventRequest(serializers.Serializer):
     """
@@ -30,4 +31,5 @@ class UpdateEventRequest(serializers.Serializer):
     category_id = serializers.IntegerField(required=False)
     venue_id = serializers.IntegerField(required=False)
     image = serializers.ImageField(required=False, allow_null=True)
-    status = serializers.ChoiceField(choices=['upcoming', 'ongoing', 'completed', 'cancelled'], required=False)
\ No newline at end of file
+    status = serializers.ChoiceField(choices=['upcoming', 'ongoing', 'completed', 'cancelled'], required=False)
+    admission_rate = serializers.IntegerField(min_value=0, required=False, help_text="Waiting-room admissions per second (0 = no waiting room)")
\ No newline at end of file
@@ -12,7 +12,7 @@ class CreateEventTicketRequest(serializers.ModelSerializer):
     class Meta:
         model = EventTicket
         fields = [
-            'booking', 'ticket_code', 'qr_code', 'status'
+            'booking', 'ticket_code', 'status'
         ]
 
 
@@ -22,7 +22,6 @@ class UpdateEventTicketRequest(serializers.Serializer):
     """
     ticket_code = serializers.CharField(required=False, allow_blank=False)
     booking = serializers.PrimaryKeyRelatedField(queryset=Booking.objects.all(), required=False)
-    qr_code = serializers.CharField(required=False, allow_blank=True, allow_null=True)
     status = serializers.ChoiceField(choices=EventTicket.STATUS_CHOICES, required=False)
 
     def validate(self, attrs):
@@ -7,3 +7,6 @@ class PaginationRequest(serializers.Serializer):
     sort_order = serializers.ChoiceField(choices=['asc', 'desc'], required=False, default='asc', help_text="Sort order (asc/desc)")
     search = serializers.CharField(required=False, allow_blank=True, default=None, help_text="Search term")
     filters = serializers.JSONField(required=False, default=dict, help_text="JSON object for additional filter parameters")
+    pagination_mode = serializers.ChoiceField(choices=['offset', 'cursor'], required=False, default='offset', help_text="'offset' (page numbers) or 'cursor' (keyset seek, fast on deep pages)")
+    cursor = serializers.CharField(required=False, allow_blank=True, allow_null=True, default=None, help_text="Opaque next_cursor from the previous page (cursor mode)")
+    include_total = serializers.BooleanField(required=False, default=True, help_text="Set false to skip the exact total COUNT(*)")
@@ -10,6 +10,7 @@ class CreateTicketRequest(serializers.Serializer):
     price = serializers.DecimalField(max_digits=10, decimal_places=2)
     quantity = serializers.IntegerField()
     sold = serializers.IntegerField(default=0)
+    counter_slots = serializers.IntegerField(default=0, min_value=0, max_value=64, help_text="Sharded sold-counter slots for flash sales (0 = off)")
 
 
 class UpdateTicketRequest(serializers.Serializer):
@@ -20,4 +21,5 @@ class UpdateTicketRequest(serializers.Serializer):
     ticket_type = serializers.ChoiceField(choices=['VIP', 'Standard', 'Regular'], required=False)
     price = serializers.DecimalField(max_digits=10, decimal_places=2, required=False)
     quantity = serializers.IntegerField(required=False)
-    sold = serializers.IntegerField(required=False)
\ No newline at end of file
+    sold = serializers.IntegerField(required=False)
+    counter_slots = serializers.IntegerField(required=False, min_value=0, max_value=64, help_text="Sharded sold-counter slots for flash sales (0 = off)")
\ No newline at end of file
@@ -15,5 +15,5 @@ class BookingResponse(serializers.ModelSerializer):
         model = Booking
         fields = [
             'id', 'customer', 'event', 'ticket', 'quantity', 'total_amount', 
-            'status', 'booking_date', 'created_at', 'updated_at'
+            'status', 'hold_expires_at', 'booking_date', 'created_at', 'updated_at'
         ]
@@ -23,6 +23,6 @@ class EventResponse(serializers.ModelSerializer):
         model = Event
         fields = [
             'id', 'event_name', 'description', 'location', 'event_date',
-            'start_time', 'end_time', 'organizer', 'status', 'category', 'venue', 'image',
+            'start_time', 'end_time', 'organizer', 'status', 'admission_rate', 'category', 'venue', 'image',
             'created_at', 'updated_at'
         ]
@@ -1,5 +1,7 @@
+from django.urls import reverse
 from rest_framework import serializers
 from app.dto.responses.booking_response import BookingResponse
+from app.utils.ticket_qr import ticket_qr_key
 
 
 class EventTicketResponse(serializers.ModelSerializer):
@@ -7,10 +9,14 @@ class EventTicketResponse(serializers.ModelSerializer):
     Serializer for the EventTicket model, including related Booking details.
     """
     booking = BookingResponse(read_only=True)
+    qr_image_url = serializers.SerializerMethodField()
 
     class Meta:
         from app.models.event_ticket import EventTicket
         model = EventTicket
         fields = [
-            'id', 'booking', 'ticket_code', 'qr_code', 'status', 'created_at', 'updated_at'
+            'id', 'booking', 'ticket_code', 'qr_image_url', 'status', 'created_at', 'updated_at'
         ]
+
+    def get_qr_image_url(self, obj):
+        return reverse('event-ticket-qr-image', args=[obj.id, ticket_qr_key(obj.ticket_code)])
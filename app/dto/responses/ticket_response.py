@@ -12,6 +12,6 @@ class TicketResponse(serializers.ModelSerializer):
         from app.models.ticket import Ticket
         model = Ticket
         fields = [
-            'id', 'event', 'ticket_type', 'price', 'quantity', 'sold',
+            'id', 'event', 'ticket_type', 'price', 'quantity', 'sold', 'counter_slots',
             'created_at', 'updated_at'
         ]
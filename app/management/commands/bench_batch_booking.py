@@ -0,0 +1,75 @@
+import time
+from datetime import date, time as dt_time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+
+from app.models.category import Category
+from app.models.customer import Customer
+from app.models.event import Event
+from app.models.ticket import Ticket
+from app.models.venue import Venue
+from app.services.booking_service import BookingService
+
+BENCH_ORGANIZER = 'bench-batch-booking'
+BENCH_EMAIL = 'bench-batch-{index}@example.com'
+
+
+class Command(BaseCommand):
+    help = 'Compares bookings/sec for one create_booking call per line against create_bookings_batch'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--lines', type=int, default=500, help='Booking lines per run')
+        parser.add_argument('--customers', type=int, default=50, help='Distinct customers across the lines')
+        parser.add_argument('--ticket-types', type=int, default=5, help='Distinct tickets across the lines')
+
+    def handle(self, *args, **options):
+        lines_count = options['lines']
+        category, _ = Category.objects.get_or_create(category_name='Benchmark')
+        venue, _ = Venue.objects.get_or_create(name='Benchmark Hall', defaults={'address': '-', 'capacity': 0})
+        customers = [
+            Customer.objects.get_or_create(email=BENCH_EMAIL.format(index=index))[0]
+            for index in range(options['customers'])
+        ]
+        event = Event.objects.create(
+            event_name='Batch booking benchmark', description='-', location='-',
+            event_date=date(2026, 1, 1), start_time=dt_time(9, 0), end_time=dt_time(17, 0),
+            organizer=BENCH_ORGANIZER, category=category, venue=venue,
+        )
+
+        try:
+            tickets = [
+                Ticket.objects.create(event=event, ticket_type=f'Type {index}', price=Decimal('1.00'), quantity=10_000_000)
+                for index in range(options['ticket_types'])
+            ]
+            lines = [
+                {
+                    'customer': customers[index % len(customers)].id,
+                    'event': event.id,
+                    'ticket': tickets[index % len(tickets)].id,
+                    'quantity': 1 + index % 3,
+                }
+                for index in range(lines_count)
+            ]
+
+            started = time.perf_counter()
+            for line in lines:
+                BookingService.create_booking({
+                    **line,
+                    'total_amount': tickets[0].price * line['quantity'],
+                })
+            single = time.perf_counter() - started
+
+            started = time.perf_counter()
+            results = BookingService.create_bookings_batch(lines)
+            batch = time.perf_counter() - started
+            failed = sum(1 for result in results if not result['success'])
+
+            self.stdout.write(self.style.SUCCESS(f'single calls: {lines_count / single:.0f} bookings/sec ({single:.2f}s)'))
+            self.stdout.write(self.style.SUCCESS(
+                f'batch:        {lines_count / batch:.0f} bookings/sec ({batch:.2f}s, {failed} failed lines)'
+            ))
+            self.stdout.write(f'speedup: {single / batch:.1f}x')
+        finally:
+            event.delete()
+            Customer.objects.filter(email__in=[customer.email for customer in customers]).delete()
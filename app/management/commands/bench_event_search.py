@@ -0,0 +1,88 @@
+import random
+import time
+from datetime import date, time as dt_time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Max
+
+from app.models.category import Category
+from app.models.event import Event
+from app.models.venue import Venue
+from app.services.event_search_service import EventSearchService
+
+BENCH_ORGANIZER = 'bench-search'
+WORDS = (
+    'music festival rock jazz summit tech conference workshop startup art gallery film '
+    'comedy theatre food wine market charity marathon football concert opera dance '
+    'science robotics cloud security design photography yoga wellness fashion book'
+).split()
+
+
+class Command(BaseCommand):
+    help = 'Compares event search latency (icontains vs inverted index vs FULLTEXT) at several catalogue sizes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000], help='Catalogue sizes to test')
+        parser.add_argument('--queries', type=int, default=20, help='Queries to time per backend and size')
+        parser.add_argument('--batch-size', type=int, default=5000, help='bulk_create batch size')
+
+    def _sentence(self, rng, words):
+        return ' '.join(rng.choice(WORDS) for _ in range(words))
+
+    def _grow_catalogue(self, rng, target, category, venue, batch_size):
+        existing = Event.objects.filter(organizer=BENCH_ORGANIZER).count()
+        while existing < target:
+            batch = [
+                Event(
+                    event_name=self._sentence(rng, 3).title(),
+                    description=self._sentence(rng, 40),
+                    location=self._sentence(rng, 2).title(),
+                    event_date=date(2026, 1, 1),
+                    start_time=dt_time(9, 0),
+                    end_time=dt_time(17, 0),
+                    organizer=BENCH_ORGANIZER,
+                    category=category,
+                    venue=venue,
+                )
+                for _ in range(min(batch_size, target - existing))
+            ]
+            # MySQL does not return ids from bulk_create, so re-read the new rows for indexing
+            last_id = Event.objects.aggregate(last_id=Max('id'))['last_id'] or 0
+            Event.objects.bulk_create(batch, batch_size=batch_size)
+            EventSearchService.rebuild_index(
+                Event.objects.filter(id__gt=last_id, organizer=BENCH_ORGANIZER).iterator(),
+                batch_size=batch_size,
+            )
+            existing += len(batch)
+
+    def _time_backend(self, backend, queries):
+        base = Event.objects.filter(is_deleted=False)
+        started = time.perf_counter()
+        for query in queries:
+            qs = EventSearchService.search(base, query, backend=backend)
+            if backend != 'icontains':
+                qs = qs.order_by('-search_rank')
+            list(qs.values_list('id', flat=True)[:10])
+        return (time.perf_counter() - started) / len(queries) * 1000
+
+    def handle(self, *args, **options):
+        rng = random.Random(42)
+        backends = ['icontains', 'index']
+        if connection.vendor == 'mysql':
+            backends.append('fulltext')
+
+        category, _ = Category.objects.get_or_create(category_name='Benchmark')
+        venue, _ = Venue.objects.get_or_create(name='Benchmark Hall', defaults={'address': '-', 'capacity': 0})
+        queries = [f'{rng.choice(WORDS)[:4]} {rng.choice(WORDS)}' for _ in range(options['queries'])]
+
+        try:
+            for size in sorted(options['sizes']):
+                self.stdout.write(self.style.HTTP_INFO(f'Growing catalogue to {size} events...'))
+                self._grow_catalogue(rng, size, category, venue, options['batch_size'])
+                for backend in backends:
+                    latency = self._time_backend(backend, queries)
+                    self.stdout.write(self.style.SUCCESS(f'size={size} backend={backend}: {latency:.1f} ms/query'))
+        finally:
+            self.stdout.write(self.style.HTTP_INFO('Removing benchmark events...'))
+            Event.objects.filter(organizer=BENCH_ORGANIZER).delete()
@@ -0,0 +1,74 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand
+
+from app.utils.bakong_client import get_bakong_client
+from app.utils.khqr_images import QRImageCache, render_qr_png
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares KHQR generations/sec and response sizes for building the QR, md5 and base64 image on '
+        'every request against the stored KHQR with a lazily rendered, LRU-cached PNG'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help='QR requests per run')
+        parser.add_argument('--payments', type=int, default=20, help='Distinct payments the requests are spread over')
+
+    def _create_qr(self, khqr, account: str, bill_number: str) -> str:
+        return khqr.create_qr(
+            bank_account=account,
+            merchant_name="EMS App",
+            merchant_city="Battambang",
+            amount=1.50,
+            currency="USD",
+            store_label="EMS",
+            phone_number="",
+            bill_number=bill_number,
+            terminal_label="EMS Terminal",
+        )
+
+    def handle(self, *args, **options):
+        client = get_bakong_client()
+        khqr = client.khqr
+        account = client.account or 'bench@bank'
+        requests, payments = options['requests'], options['payments']
+
+        # Before: every GET rebuilt the QR string, md5 and base64 image and embedded it in JSON
+        started = time.perf_counter()
+        for index in range(requests):
+            qr_string = self._create_qr(khqr, account, str(index % payments))
+            md5 = khqr.generate_md5(qr_string)
+            qr_image = khqr.qr_image(qr_string, format='base64_uri')
+            before_body = json.dumps({'qr_data': qr_string, 'md5': md5, 'qr_image': qr_image, 'payment_id': index})
+        before = time.perf_counter() - started
+
+        # After: the QR string and md5 are built once per payment; GETs return them plus an image URL,
+        # and the PNG is rendered once per md5 and then served from the LRU
+        stored = {}
+        image_cache = QRImageCache(capacity=payments)
+        png_bytes = 0
+        started = time.perf_counter()
+        for index in range(requests):
+            payment = index % payments
+            if payment not in stored:
+                qr_string = self._create_qr(khqr, account, str(payment))
+                stored[payment] = (qr_string, khqr.generate_md5(qr_string))
+            qr_string, md5 = stored[payment]
+            after_body = json.dumps({
+                'qr_data': qr_string, 'md5': md5, 'qr_image_url': f'/api/v1/payments/qr/{md5}.png', 'payment_id': index,
+            })
+            png = image_cache.get(md5)
+            if png is None:
+                png = render_qr_png(qr_string)
+                image_cache.put(md5, png)
+            png_bytes = len(png)
+        after = time.perf_counter() - started
+
+        self.stdout.write(self.style.SUCCESS(f'before: {requests / before:.0f} QR requests/sec, JSON body {len(before_body)} bytes'))
+        self.stdout.write(self.style.SUCCESS(
+            f'after:  {requests / after:.0f} QR requests/sec, JSON body {len(after_body)} bytes + PNG {png_bytes} bytes (cacheable)'
+        ))
+        self.stdout.write(f'speedup: {before / after:.1f}x, image cache {image_cache.stats()}')
@@ -0,0 +1,77 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings
+
+from app.models.user import User
+from app.services.user_service import UserService
+from app.utils.bycrypt import hash_password
+
+BENCH_EMAIL = 'bench-login@example.com'
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures login throughput per bcrypt cost level through UserService.authenticate_user '
+        'against a seeded user, including the one-off rehash after a cost change'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--costs', type=int, nargs='+', default=[10, 11, 12, 13], help='bcrypt cost levels to test')
+        parser.add_argument('--logins', type=int, default=50, help='Logins to run per cost level')
+        parser.add_argument('--concurrency', type=int, default=8, help='Concurrent login threads')
+
+    def _login(self, password: str) -> bool:
+        try:
+            return UserService.authenticate_user(BENCH_EMAIL, password) is not None
+        finally:
+            connection.close()
+
+    def handle(self, *args, **options):
+        password = 'benchmark-password'
+        logins = options['logins']
+        concurrency = options['concurrency']
+        # Every check runs on the process-wide bcrypt pool, so it bounds the parallelism
+        pool_size = getattr(settings, 'BCRYPT_MAX_WORKERS', 4)
+
+        self.stdout.write(self.style.HTTP_INFO(
+            f'Running {logins} logins per cost with {concurrency} request threads on a bcrypt pool of '
+            f'{pool_size} (effective concurrency {min(concurrency, pool_size)}; raise BCRYPT_MAX_WORKERS to go higher)...'
+        ))
+
+        user = User.all_objects.filter(email=BENCH_EMAIL).first()
+        created = user is None
+        if created:
+            user = User.objects.create_user(BENCH_EMAIL)
+
+        try:
+            for cost in options['costs']:
+                with override_settings(BCRYPT_ROUNDS=cost):
+                    # First login after a cost change verifies with the old cost and rehashes
+                    User.all_objects.filter(pk=user.pk).update(
+                        password=hash_password(password, rounds=cost - 1 if cost > 4 else cost + 1), is_deleted=False,
+                    )
+                    started = time.perf_counter()
+                    if not self._login(password):
+                        raise CommandError(f'cost={cost}: login failed')
+                    rehash = time.perf_counter() - started
+
+                    started = time.perf_counter()
+                    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                        results = list(pool.map(lambda _: self._login(password), range(logins)))
+                    elapsed = time.perf_counter() - started
+
+                if not all(results):
+                    self.stdout.write(self.style.ERROR(f'cost={cost}: login failed'))
+                    continue
+
+                self.stdout.write(self.style.SUCCESS(
+                    f'cost={cost}: {logins / elapsed:.1f} logins/sec ({elapsed / logins * 1000:.1f} ms/login), '
+                    f'first login with rehash {rehash * 1000:.1f} ms'
+                ))
+        finally:
+            if created:
+                User.all_objects.filter(pk=user.pk).delete()
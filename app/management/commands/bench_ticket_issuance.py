@@ -0,0 +1,73 @@
+import time
+from concurrent.futures import wait
+from datetime import date, time as dt_time
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from app.models.booking import Booking
+from app.models.category import Category
+from app.models.customer import Customer
+from app.models.event import Event
+from app.models.ticket import Ticket
+from app.models.venue import Venue
+from app.services.event_ticket_service import EventTicketService
+from app.utils.ticket_qr import ticket_qr_png, warm_ticket_qrs
+
+BENCH_ORGANIZER = 'bench-ticket-issuance'
+BENCH_EMAIL = 'bench-ticket-issuance@example.com'
+
+
+class Command(BaseCommand):
+    help = 'Measures event tickets issued and QR-rendered per second for a large confirmed booking at several QR worker counts'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tickets', type=int, default=500, help='Seats on the booking')
+        parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 8], help='QR renderer process counts')
+
+    def handle(self, *args, **options):
+        if not getattr(settings, 'TICKET_QR_CACHE_DIR', ''):
+            raise CommandError('Set TICKET_QR_CACHE_DIR: QR pre-rendering writes to the disk cache.')
+        count = options['tickets']
+        category, _ = Category.objects.get_or_create(category_name='Benchmark')
+        venue, _ = Venue.objects.get_or_create(name='Benchmark Hall', defaults={'address': '-', 'capacity': 0})
+        customer, _ = Customer.objects.get_or_create(email=BENCH_EMAIL)
+        event = Event.objects.create(
+            event_name='Ticket issuance benchmark', description='-', location='-',
+            event_date=date(2026, 1, 1), start_time=dt_time(9, 0), end_time=dt_time(17, 0),
+            organizer=BENCH_ORGANIZER, category=category, venue=venue,
+        )
+        ticket = Ticket.objects.create(event=event, ticket_type='Group', price=Decimal('1.00'), quantity=count * len(options['workers']))
+
+        try:
+            for workers in options['workers']:
+                if workers > 1:
+                    # Start the pool outside the timing; servers keep it for their lifetime
+                    warmup = Booking(id=1, event_id=event.id, ticket_id=ticket.id)
+                    wait(warm_ticket_qrs(EventTicketService._bulk_ticket_codes(warmup, max(workers * 4, 64)), workers=workers))
+
+                booking = Booking.objects.create(
+                    customer=customer, event=event, ticket=ticket, quantity=count,
+                    total_amount=ticket.price * count, status='confirmed',
+                )
+                started = time.perf_counter()
+                result = EventTicketService.issue_tickets_for_booking(booking.id, workers=0)
+                issued = time.perf_counter() - started
+
+                codes = [row['ticket_code'] for row in result['tickets']]
+                started = time.perf_counter()
+                if workers > 1:
+                    wait(warm_ticket_qrs(codes, workers=workers))
+                else:
+                    for code in codes:
+                        ticket_qr_png(code)
+                rendered = time.perf_counter() - started
+
+                self.stdout.write(self.style.SUCCESS(
+                    f'workers={workers}: {len(codes) / (issued + rendered):.0f} tickets/sec issued and rendered '
+                    f'(insert {issued:.2f}s, QR render {rendered:.2f}s = {len(codes) / rendered:.0f} QR/sec)'
+                ))
+        finally:
+            event.delete()
+            customer.delete()
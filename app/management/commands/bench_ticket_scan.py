@@ -0,0 +1,46 @@
+import secrets
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from app.services.checkin_service import CheckinService
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures invalid-scan throughput: forged and garbage codes rejected by signature '
+        'against the database lookup of validate_ticket'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scans', type=int, default=100_000, help='Scans per in-memory run')
+        parser.add_argument('--db-scans', type=int, default=2_000, help='Scans for the database baseline')
+
+    def _run(self, label: str, scan, codes: list):
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            rejected = sum(1 for code in codes if scan(code)['status'] == 'INVALID')
+            elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f'{label}: {len(codes) / elapsed:,.0f} scans/sec, {elapsed / len(codes) * 1_000_000:.1f} us/scan, '
+            f'{rejected}/{len(codes)} rejected, {len(queries)} queries'
+        ))
+        return elapsed / len(codes)
+
+    def handle(self, *args, **options):
+        scans, db_scans = options['scans'], options['db_scans']
+        # Right shape, wrong signature: what a forger copying the format produces
+        forged = [
+            f'TKT-1-1-{index + 1}-{secrets.token_hex(4).upper()}-{secrets.token_hex(8).upper()}'
+            for index in range(scans)
+        ]
+        garbage = [secrets.token_urlsafe(24) for _ in range(scans)]
+
+        forged_cost = self._run('forged signed codes', CheckinService.scan_ticket, forged)
+        with override_settings(TICKET_ACCEPT_UNSIGNED_CODES=False):
+            self._run('garbage codes', CheckinService.scan_ticket, garbage)
+        db_cost = self._run('database lookup (validate_ticket)', CheckinService.validate_ticket, garbage[:db_scans])
+
+        self.stdout.write(f'signature check is {db_cost / forged_cost:,.0f}x faster than the database lookup')
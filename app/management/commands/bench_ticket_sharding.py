@@ -0,0 +1,90 @@
+import threading
+import time
+from datetime import date, time as dt_time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from app.models.category import Category
+from app.models.customer import Customer
+from app.models.event import Event
+from app.models.ticket import Ticket
+from app.models.venue import Venue
+from app.services.booking_service import BookingService
+from app.services.ticket_counter_service import TicketCounterService
+
+BENCH_ORGANIZER = 'bench-sharding'
+BENCH_EMAIL = 'bench-sharding@example.com'
+
+
+class Command(BaseCommand):
+    help = 'Measures bookings/sec on one hot ticket with sharded sold-counters off and on'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=64, help='Concurrent buyer threads')
+        parser.add_argument('--duration', type=float, default=10, help='Seconds per run')
+        parser.add_argument('--slots', type=int, nargs='+', default=[0, 8, 32], help='counter_slots values to compare (0 = off)')
+
+    def _run(self, ticket, customer, event, threads, duration):
+        counts = [0] * threads
+        errors = []
+        barrier = threading.Barrier(threads)
+
+        def buyer(index):
+            try:
+                barrier.wait()
+                deadline = time.perf_counter() + duration
+                while time.perf_counter() < deadline:
+                    BookingService.create_booking({
+                        'customer': customer.id,
+                        'event': event.id,
+                        'ticket': ticket.id,
+                        'quantity': 1,
+                        'total_amount': ticket.price,
+                    })
+                    counts[index] += 1
+            except Exception as e:
+                errors.append(repr(e))
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=buyer, args=(i,)) for i in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return sum(counts), errors
+
+    def handle(self, *args, **options):
+        if connection.vendor == 'sqlite':
+            raise CommandError('SQLite serializes writers; run this against MySQL or PostgreSQL.')
+
+        threads, duration = options['threads'], options['duration']
+        category, _ = Category.objects.get_or_create(category_name='Benchmark')
+        venue, _ = Venue.objects.get_or_create(name='Benchmark Hall', defaults={'address': '-', 'capacity': 0})
+        customer, _ = Customer.objects.get_or_create(email=BENCH_EMAIL)
+        event = Event.objects.create(
+            event_name='Sharding benchmark', description='-', location='-',
+            event_date=date(2026, 1, 1), start_time=dt_time(9, 0), end_time=dt_time(17, 0),
+            organizer=BENCH_ORGANIZER, category=category, venue=venue,
+        )
+
+        try:
+            for slots in options['slots']:
+                ticket = Ticket.objects.create(event=event, ticket_type='Standard', price=Decimal('1.00'), quantity=10_000_000)
+                if slots:
+                    ticket = TicketCounterService.enable(ticket.id, slots)
+                booked, errors = self._run(ticket, customer, event, threads, duration)
+                TicketCounterService.reconcile([ticket.id])
+                ticket.refresh_from_db()
+
+                label = f'slots={slots}' if slots else 'sharding off'
+                self.stdout.write(self.style.SUCCESS(
+                    f'{label}: {booked / duration:.0f} bookings/sec ({booked} booked, sold={ticket.sold}, {len(errors)} errors)'
+                ))
+                for error in errors[:3]:
+                    self.stdout.write(self.style.WARNING(f'  {error}'))
+        finally:
+            event.delete()
+            customer.delete()
@@ -0,0 +1,61 @@
+import time
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from app.models.role_permission import RolePermission
+from app.utils.permission_cache import PermissionCache
+from app.utils.permissions import CheckPermission
+from app.utils.principal import AuthPrincipal
+
+
+class Command(BaseCommand):
+    help = (
+        'Checks that CheckPermission answers from PermissionCache: after one cold load of '
+        'a role, granted and denied checks must run no database queries'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--role', type=int, help='Role to check (default: the first role with permissions)')
+        parser.add_argument('--checks', type=int, default=10_000, help='Warm checks to run and time')
+
+    def handle(self, *args, **options):
+        grants = RolePermission.objects.select_related('permission')
+        if options['role']:
+            grants = grants.filter(role_id=options['role'])
+        grant = grants.first()
+        if grant is None:
+            raise CommandError('No role permissions found; seed roles and permissions first.')
+
+        user = AuthPrincipal('user', {'id': 0, 'email': '', 'role_id': grant.role_id})
+        checker = CheckPermission()
+        granted_view = SimpleNamespace(method_permissions={'GET': grant.permission.name})
+        denied_view = SimpleNamespace(method_permissions={'GET': 'check-permission-queries:not-granted'})
+        request = SimpleNamespace(user=user, method='GET')
+
+        PermissionCache.invalidate()
+        with CaptureQueriesContext(connection) as cold:
+            if not checker.has_permission(request, granted_view):
+                raise CommandError(f'Role {grant.role_id} was denied {grant.permission.name}.')
+        self.stdout.write(f'cold check of role {grant.role_id}: {len(cold)} queries')
+        # A role holding all_permissions is granted the unknown permission too
+        denied_expected = 'all_permissions' in PermissionCache.get_role_permissions(grant.role_id)
+
+        checks = options['checks']
+        with CaptureQueriesContext(connection) as warm:
+            started = time.perf_counter()
+            for index in range(checks):
+                view, expected = (denied_view, denied_expected) if index % 2 else (granted_view, True)
+                if checker.has_permission(request, view) != expected:
+                    raise CommandError(f'Wrong answer for {view.method_permissions["GET"]}.')
+            elapsed = time.perf_counter() - started
+
+        if len(warm):
+            for query in warm.captured_queries[:5]:
+                self.stdout.write(self.style.WARNING(f"  {query['sql']}"))
+            raise CommandError(f'{checks} warm checks ran {len(warm)} queries; expected none.')
+        self.stdout.write(self.style.SUCCESS(
+            f'{checks} warm checks: 0 queries, {elapsed / checks * 1_000_000:.2f} us/check'
+        ))
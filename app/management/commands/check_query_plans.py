@@ -0,0 +1,140 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from app.dto.requests.pagination_request import PaginationRequest
+from app.services.booking_service import BookingService
+from app.services.checkin_service import CheckinService
+from app.services.event_registration_service import EventRegistrationService
+from app.services.event_service import EventService
+from app.services.event_ticket_service import EventTicketService
+from app.services.payment_service import PaymentService
+from app.services.ticket_service import TicketService
+
+SAMPLE_ID = 1
+SAMPLE_MD5 = '0' * 32
+SAMPLE_CODE = 'TKT-00000000000000-000000'
+
+
+def list_params(**overrides) -> dict:
+    """Paginated-list params as a request would validate them (PaginationRequest defaults)."""
+    serializer = PaginationRequest(data=overrides)
+    serializer.is_valid(raise_exception=True)
+    return serializer.validated_data
+
+
+def service_calls():
+    """
+    The hot service reads as (name, call). Each call runs the service itself, so
+    the checked SQL is exactly what the service sends (its FilterSchema, joins and
+    paginate_queryset defaults), not a copy of it.
+    """
+    return [
+        ('events: list', lambda: EventService.get_paginated_events(list_params())),
+        ('events: upcoming by date', lambda: EventService.get_paginated_events(
+            list_params(filters={'event_date__gte': '2000-01-01'}, sort_by='event_date'))),
+        ('events: by id', lambda: EventService.get_event_by_id(SAMPLE_ID)),
+        ('tickets: by event', lambda: TicketService.get_paginated_tickets(list_params(filters={'event_id': SAMPLE_ID}))),
+        ('bookings: list', lambda: BookingService.get_paginated_bookings(list_params())),
+        ('bookings: by event', lambda: BookingService.get_paginated_bookings(list_params(filters={'event_id': SAMPLE_ID}))),
+        ('bookings: by customer', lambda: BookingService.get_paginated_bookings(list_params(filters={'customer_id': SAMPLE_ID}))),
+        ('payments: list', lambda: PaymentService.get_paginated_payments(list_params())),
+        ('payments: by md5', lambda: PaymentService.get_khqr_png(SAMPLE_MD5)),
+        ('payments: revenue window', lambda: PaymentService.get_paginated_payments(
+            list_params(filters={'status': 'completed', 'paid_at__gte': '2000-01-01'}, sort_by='paid_at'))),
+        ('checkins: list', lambda: CheckinService.get_paginated_checkins(list_params())),
+        ('checkins: by ticket code', lambda: CheckinService.validate_ticket(SAMPLE_CODE)),
+        ('event tickets: by booking', lambda: EventTicketService.get_paginated_event_tickets(
+            list_params(filters={'booking_id': SAMPLE_ID}))),
+        ('registrations: by event', lambda: EventRegistrationService.get_paginated_event_registrations(
+            list_params(filters={'event_id': SAMPLE_ID}))),
+    ]
+
+
+def captured_selects(call) -> list:
+    """
+    Runs a service call and returns the distinct SELECTs it sent. Anything it
+    writes (e.g. the log row of an invalid scan) is rolled back.
+    """
+    with transaction.atomic():
+        with CaptureQueriesContext(connection) as captured:
+            call()
+        transaction.set_rollback(True)
+    selects = []
+    for query in captured.captured_queries:
+        sql = query['sql']
+        if sql.lstrip().upper().startswith('SELECT') and sql not in selects:
+            selects.append(sql)
+    return selects
+
+
+def _rows(sql: str) -> list:
+    with connection.cursor() as cursor:
+        cursor.execute(sql)
+        columns = [col[0].lower() for col in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def explain(sql: str):
+    """
+    Returns (plan lines, full-scanned tables) for an executed SELECT on the current backend.
+    """
+    vendor = connection.vendor
+
+    if vendor == 'mysql':
+        rows = _rows(f'EXPLAIN {sql}')
+        lines = [
+            f"{row['table']}: type={row['type']} key={row['key']} rows={row['rows']} {row.get('extra') or ''}".rstrip()
+            for row in rows
+        ]
+        scans = [row['table'] for row in rows if row['type'] == 'ALL']
+    elif vendor == 'sqlite':
+        rows = _rows(f'EXPLAIN QUERY PLAN {sql}')
+        lines = [row['detail'] for row in rows]
+        scans = [
+            line.split()[1] for line in lines
+            if line.startswith('SCAN ') and 'USING' not in line
+        ]
+    elif vendor == 'postgresql':
+        rows = _rows(f'EXPLAIN {sql}')
+        lines = [next(iter(row.values())) for row in rows]
+        scans = [line.split('Seq Scan on ')[1].split()[0] for line in lines if 'Seq Scan on ' in line]
+    else:
+        raise CommandError(f'Query plan checks are not supported on {vendor}.')
+
+    return lines, scans
+
+
+class Command(BaseCommand):
+    help = (
+        'Runs the hot service reads, captures EXPLAIN output for every SELECT they send and '
+        'fails when any of them full-scans a table. Run against a migrated database with realistic row counts; '
+        'on near-empty tables the optimizer may legitimately prefer a scan.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--verbose-plans', action='store_true', help='Print the plan of every query, not only failures')
+        parser.add_argument('--allow', nargs='*', default=[], help='Query names allowed to full-scan')
+
+    def handle(self, *args, **options):
+        failures = []
+
+        for name, call in service_calls():
+            lines, scans = [], []
+            for sql in captured_selects(call):
+                plan, scanned = explain(sql)
+                lines.extend(plan)
+                scans.extend(table for table in scanned if table not in scans)
+            if scans and name not in options['allow']:
+                failures.append(name)
+                self.stdout.write(self.style.ERROR(f'FULL SCAN  {name} ({", ".join(scans)})'))
+            else:
+                self.stdout.write(self.style.SUCCESS(f'ok         {name}'))
+
+            if options['verbose_plans'] or (scans and name not in options['allow']):
+                for line in lines:
+                    self.stdout.write(f'           {line}')
+
+        if failures:
+            raise CommandError(f'{len(failures)} query plan(s) contain a full table scan: {", ".join(failures)}')
+        self.stdout.write(self.style.SUCCESS('No full table scans.'))
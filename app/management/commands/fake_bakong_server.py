@@ -0,0 +1,125 @@
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.core.management.base import BaseCommand
+
+
+class FakeBakong:
+    """
+    In-memory stand-in for the Bakong transaction API. A hash counts as paid once
+    `pay_after` seconds have passed since it was first checked (with probability
+    `paid_ratio`), or as soon as it is posted to /_fake/pay.
+    """
+
+    def __init__(self, pay_after: float, paid_ratio: float, latency: float):
+        self.pay_after = pay_after
+        self.paid_ratio = paid_ratio
+        self.latency = latency
+        self.first_seen = {}
+        self.paid = set()
+        self.calls = {'single': 0, 'list': 0, 'hashes': 0}
+        self.lock = threading.Lock()
+
+    def is_paid(self, md5: str) -> bool:
+        with self.lock:
+            seen = self.first_seen.setdefault(md5, time.monotonic())
+            if md5 not in self.paid and self.pay_after >= 0 and time.monotonic() - seen >= self.pay_after:
+                if random.random() < self.paid_ratio:
+                    self.paid.add(md5)
+                else:
+                    self.first_seen[md5] = time.monotonic()
+            return md5 in self.paid
+
+    @staticmethod
+    def transaction(md5: str) -> dict:
+        return {
+            'hash': md5[:8] + 'fake',
+            'fromAccountId': 'payer@fake',
+            'toAccountId': 'merchant@fake',
+            'currency': 'USD',
+            'createdDateMs': int(time.time() * 1000),
+        }
+
+
+class Command(BaseCommand):
+    help = (
+        'Runs a local fake of the Bakong check_transaction_by_md5(_list) API for development and '
+        'load testing; set BAKONG_PROD_BASE_API_URL=http://HOST:PORT to use it'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8765)
+        parser.add_argument('--pay-after', type=float, default=10, help='Seconds after the first check that a hash becomes paid; -1 never')
+        parser.add_argument('--paid-ratio', type=float, default=1.0, help='Share of hashes that get paid')
+        parser.add_argument('--latency', type=float, default=0.05, help='Seconds added to every response')
+
+    def handle(self, *args, **options):
+        fake = FakeBakong(options['pay_after'], options['paid_ratio'], options['latency'])
+        stdout = self.stdout
+
+        class Handler(BaseHTTPRequestHandler):
+            def _send(self, status: int, body: dict) -> None:
+                payload = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                try:
+                    body = json.loads(self.rfile.read(length) or b'null')
+                except ValueError:
+                    return self._send(400, {'responseCode': 1, 'responseMessage': 'Invalid JSON', 'errorCode': 400})
+                if not self.headers.get('Authorization', '').startswith('Bearer '):
+                    return self._send(401, {'responseCode': 1, 'responseMessage': 'Unauthorized', 'errorCode': 6})
+                time.sleep(fake.latency)
+
+                path = self.path.rstrip('/').rsplit('/', 1)[-1]
+                if path == 'check_transaction_by_md5':
+                    fake.calls['single'] += 1
+                    md5 = (body or {}).get('md5', '')
+                    if fake.is_paid(md5):
+                        return self._send(200, {'responseCode': 0, 'responseMessage': 'Success', 'data': fake.transaction(md5)})
+                    return self._send(200, {'responseCode': 1, 'responseMessage': 'Transaction could not be found.', 'errorCode': 1})
+
+                if path == 'check_transaction_by_md5_list':
+                    if not isinstance(body, list) or len(body) > 50:
+                        return self._send(400, {'responseCode': 1, 'responseMessage': 'Expected a list of at most 50 hashes', 'errorCode': 400})
+                    fake.calls['list'] += 1
+                    fake.calls['hashes'] += len(body)
+                    items = [
+                        {'md5': md5, 'status': 'SUCCESS', 'message': None, 'data': fake.transaction(md5)}
+                        if fake.is_paid(md5) else
+                        {'md5': md5, 'status': 'NOT_FOUND', 'message': 'Transaction could not be found.', 'data': None}
+                        for md5 in body
+                    ]
+                    if not any(item['status'] == 'SUCCESS' for item in items):
+                        return self._send(200, {'responseCode': 1, 'responseMessage': 'Transaction could not be found.', 'errorCode': 1, 'data': items})
+                    return self._send(200, {'responseCode': 0, 'responseMessage': 'Success', 'data': items})
+
+                if path == 'pay':
+                    with fake.lock:
+                        fake.paid.add((body or {}).get('md5', ''))
+                    return self._send(200, {'responseCode': 0, 'responseMessage': 'Marked as paid'})
+
+                return self._send(404, {'responseCode': 1, 'responseMessage': 'Not found', 'errorCode': 404})
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((options['host'], options['port']), Handler)
+        stdout.write(self.style.SUCCESS(f"Fake Bakong listening on http://{options['host']}:{options['port']}"))
+        stdout.write("  POST /check_transaction_by_md5, /check_transaction_by_md5_list, /_fake/pay {\"md5\": ...}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            stdout.write(f"Calls: {fake.calls['single']} single, {fake.calls['list']} bulk ({fake.calls['hashes']} hashes)")
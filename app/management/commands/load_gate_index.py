@@ -0,0 +1,88 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from app.models.event import Event
+from app.models.event_ticket import EventTicket
+from app.utils.gate_index import GateIndex, code_hash, find_ticket, load_gate_index
+from app.utils.ticket_codes import sign_ticket_code
+
+
+def _percentiles(samples: list) -> str:
+    samples = sorted(samples)
+    pick = lambda q: samples[min(int(len(samples) * q), len(samples) - 1)] * 1_000_000
+    return f'p50 {pick(0.5):.1f} us, p99 {pick(0.99):.1f} us'
+
+
+class Command(BaseCommand):
+    help = (
+        "Preloads an event's tickets into the in-memory gate index (server workers pick it up "
+        "within GATE_INDEX_SYNC_INTERVAL) and reports its memory and scan latency; --synthetic "
+        "measures an index of generated tickets instead"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--event', type=int, help='Event to preload')
+        parser.add_argument('--synthetic', type=int, default=0, help='Generated tickets to index instead of an event')
+        parser.add_argument('--samples', type=int, default=10_000, help='Scans to time')
+        parser.add_argument('--db-samples', type=int, default=500, help='Database lookups to time for comparison')
+
+    def handle(self, *args, **options):
+        if options['synthetic']:
+            index, codes = self._synthetic(options['synthetic'])
+            lookup = lambda code: index.position(code_hash(code)) >= 0
+        elif options['event']:
+            try:
+                index = load_gate_index(options['event'])
+            except Event.DoesNotExist as e:
+                raise CommandError(str(e))
+            codes = list(
+                EventTicket.objects.filter(booking__event_id=index.event_id, is_deleted=False)
+                .values_list('ticket_code', flat=True)[:options['samples']]
+            )
+            lookup = lambda code: find_ticket(code) is not None
+            self.stdout.write(self.style.SUCCESS(f'Loaded and registered the gate index of event {index.event_id}.'))
+        else:
+            raise CommandError('Pass --event or --synthetic.')
+
+        stats = index.stats()
+        self.stdout.write(
+            f"{stats['tickets']} tickets in {stats['bytes'] / 1024 / 1024:.2f} MiB "
+            f"({stats['bytes_per_100k_tickets'] / 1024 / 1024:.2f} MiB per 100k tickets), built in {stats['build_seconds']}s"
+        )
+        if not codes:
+            return
+
+        hits = [random.choice(codes) for _ in range(options['samples'])]
+        misses = [sign_ticket_code(index.event_id, 1, 1) for _ in range(options['samples'])]
+        for label, sample in (('hit', hits), ('miss', misses)):
+            timings = []
+            for code in sample:
+                started = time.perf_counter()
+                lookup(code)
+                timings.append(time.perf_counter() - started)
+            self.stdout.write(self.style.SUCCESS(f'index {label}: {_percentiles(timings)}'))
+
+        if options['event'] and options['db_samples']:
+            timings = []
+            for code in hits[:options['db_samples']]:
+                started = time.perf_counter()
+                EventTicket.objects.select_related(
+                    'booking__customer', 'booking__event', 'booking__ticket',
+                ).filter(ticket_code=code).first()
+                timings.append(time.perf_counter() - started)
+            self.stdout.write(f'database lookup: {_percentiles(timings)}')
+
+    def _synthetic(self, count: int):
+        started = time.perf_counter()
+        customers = [f'Customer {number}' for number in range(max(count // 4, 1))]
+        codes, rows = [], []
+        for number in range(count):
+            booking_id = number // 4 + 1
+            code = sign_ticket_code(1, 1 + number % 3, booking_id)
+            codes.append(code)
+            rows.append((code_hash(code), 0, booking_id, number % 3, (booking_id - 1) % len(customers)))
+        index = GateIndex(0, 'Synthetic event', rows, ['VIP', 'Standard', 'Regular'], customers)
+        index.build_seconds = time.perf_counter() - started
+        return index, codes
@@ -0,0 +1,113 @@
+import threading
+import time
+from collections import Counter
+from datetime import date, time as dt_time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from app.models.category import Category
+from app.models.customer import Customer
+from app.models.event import Event
+from app.models.ticket import Ticket
+from app.models.venue import Venue
+from app.services.booking_service import BookingService
+from app.services.waiting_room_service import WaitingRoomService
+
+LOADTEST_ORGANIZER = 'loadtest-waiting-room'
+LOADTEST_EMAIL = 'loadtest-waiting-room@example.com'
+
+
+class Command(BaseCommand):
+    help = (
+        'Load-test scenario for the event waiting room: N clients rush one on-sale with the '
+        'waiting room off and on, and the database queries per second are printed for both'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--clients', type=int, default=300, help='Concurrent clients')
+        parser.add_argument('--rate', type=int, default=25, help='Admissions per second when the waiting room is on')
+        parser.add_argument('--mode', choices=['off', 'on', 'both'], default='both')
+
+    def _scenario(self, event, ticket, customer, clients, gated):
+        lock = threading.Lock()
+        queries = Counter()
+        bookings = Counter()
+        errors = []
+        barrier = threading.Barrier(clients)
+        started = []
+
+        def count_query(execute, sql, params, many, context):
+            with lock:
+                queries[int(time.perf_counter() - started[0])] += 1
+            return execute(sql, params, many, context)
+
+        def client(index):
+            principal = f'loadtest:{index}'
+            try:
+                barrier.wait()
+                with connection.execute_wrapper(count_query):
+                    if gated:
+                        state = WaitingRoomService.join(event.id, principal)
+                        token = state['token']
+                        while state['status'] != 'admitted':
+                            time.sleep(min(state['poll_after_seconds'], 1))
+                            state = WaitingRoomService.status(event.id, token, principal)
+                        WaitingRoomService.admit(event.id, state['admission_pass'], principal)
+
+                    BookingService.create_booking({
+                        'customer': customer.id,
+                        'event': event.id,
+                        'ticket': ticket.id,
+                        'quantity': 1,
+                        'total_amount': ticket.price,
+                    })
+                    with lock:
+                        bookings[int(time.perf_counter() - started[0])] += 1
+            except Exception as e:
+                with lock:
+                    errors.append(repr(e))
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+        started.append(time.perf_counter())
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return queries, bookings, errors, time.perf_counter() - started[0]
+
+    def handle(self, *args, **options):
+        clients, rate = options['clients'], options['rate']
+        modes = {'off': [False], 'on': [True], 'both': [False, True]}[options['mode']]
+
+        category, _ = Category.objects.get_or_create(category_name='Benchmark')
+        venue, _ = Venue.objects.get_or_create(name='Benchmark Hall', defaults={'address': '-', 'capacity': 0})
+        customer, _ = Customer.objects.get_or_create(email=LOADTEST_EMAIL)
+
+        try:
+            for gated in modes:
+                event = Event.objects.create(
+                    event_name='Waiting room load test', description='-', location='-',
+                    event_date=date(2026, 1, 1), start_time=dt_time(9, 0), end_time=dt_time(17, 0),
+                    organizer=LOADTEST_ORGANIZER, category=category, venue=venue,
+                    admission_rate=rate if gated else 0,
+                )
+                ticket = Ticket.objects.create(event=event, ticket_type='Standard', price=Decimal('1.00'), quantity=clients)
+
+                queries, bookings, errors, elapsed = self._scenario(event, ticket, customer, clients, gated)
+
+                label = f'waiting room on ({rate}/s)' if gated else 'waiting room off'
+                self.stdout.write(self.style.HTTP_INFO(
+                    f'{label}: {sum(bookings.values())} bookings, {len(errors)} errors in {elapsed:.1f}s, '
+                    f'peak {max(queries.values(), default=0)} queries/s'
+                ))
+                for second in range(int(elapsed) + 1):
+                    self.stdout.write(f'  t={second:>3}s  queries={queries[second]:>6}  bookings={bookings[second]:>5}')
+                for error in errors[:3]:
+                    self.stdout.write(self.style.WARNING(f'  {error}'))
+        finally:
+            Event.objects.filter(organizer=LOADTEST_ORGANIZER).delete()
+            customer.delete()
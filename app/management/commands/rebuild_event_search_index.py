@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+from app.services.event_search_service import EventSearchService
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the event_search_terms inverted index from all active events'
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.HTTP_INFO('Rebuilding event search index...'))
+        count = EventSearchService.rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f'Indexed {count} events.'))
@@ -0,0 +1,28 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from app.services.bakong_reconcile_service import BakongReconcileService
+
+
+class Command(BaseCommand):
+    help = 'Checks pending Bakong payments against Bakong in bulk and completes the paid ones (once, or every --interval seconds)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=None, help='Hashes per Bakong call (default: BAKONG_RECONCILE_BATCH, max 50)')
+        parser.add_argument('--interval', type=float, default=0, help='Repeat every N seconds; 0 runs once')
+
+    def handle(self, *args, **options):
+        interval = options['interval']
+        while True:
+            metrics = BakongReconcileService.reconcile(batch_size=options['batch_size'])
+            self.stdout.write(
+                f"Completed {metrics['completed']} of {metrics['checked']} pending payments, confirmed "
+                f"{metrics['bookings']} bookings in {metrics['batches']} batches "
+                f"({metrics['errors']} failed, {metrics['seconds']}s)"
+            )
+            if not interval:
+                break
+            connection.close_if_unusable_or_obsolete()
+            time.sleep(interval)
@@ -0,0 +1,23 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from app.services.ticket_counter_service import TicketCounterService
+
+
+class Command(BaseCommand):
+    help = 'Reconciles Ticket.sold from the sharded counters (once, or every --interval seconds)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interval', type=float, default=0, help='Repeat every N seconds; 0 runs once')
+
+    def handle(self, *args, **options):
+        interval = options['interval']
+        while True:
+            count = TicketCounterService.reconcile()
+            self.stdout.write(f'Reconciled {count} sharded ticket(s)')
+            if not interval:
+                break
+            connection.close_if_unusable_or_obsolete()
+            time.sleep(interval)
@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from app.services.seat_hold_service import SeatHoldService
+
+
+class Command(BaseCommand):
+    help = 'Releases the seats of pending bookings whose hold has expired (once, or every --interval seconds)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=None, help='Bookings per batch (default: SEAT_HOLD_SWEEP_BATCH)')
+        parser.add_argument('--interval', type=float, default=0, help='Repeat every N seconds; 0 runs once')
+
+    def handle(self, *args, **options):
+        interval = options['interval']
+        while True:
+            metrics = SeatHoldService.release_expired(batch_size=options['batch_size'])
+            self.stdout.write(
+                f"Released {metrics['seats']} seats from {metrics['bookings']} expired holds on "
+                f"{metrics['tickets']} tickets in {metrics['batches']} batches ({metrics['seconds']}s)"
+            )
+            if not interval:
+                break
+            connection.close_if_unusable_or_obsolete()
+            time.sleep(interval)
@@ -0,0 +1,119 @@
+import threading
+import time
+from datetime import date, time as dt_time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+
+from app.models.booking import Booking
+from app.models.category import Category
+from app.models.checkin import Checkin
+from app.models.customer import Customer
+from app.models.event import Event
+from app.models.event_ticket import EventTicket
+from app.models.ticket import Ticket
+from app.models.venue import Venue
+from app.services.checkin_service import CheckinService
+from app.services.event_ticket_service import EventTicketService
+
+SIMULATION_ORGANIZER = 'simulate-gate-checkins'
+SIMULATION_EMAIL = 'simulate-gate-checkins@example.com'
+
+
+class Command(BaseCommand):
+    help = (
+        'Gate simulation for check-in: for every ticket, many scanner threads confirm it at the '
+        'same moment (alternating confirm_checkin and scan_ticket) and the command fails unless '
+        'exactly one scan wins and exactly one SUCCESS row is logged. Needs a server database '
+        '(MySQL/PostgreSQL) with max_connections above --scanners.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scanners', type=int, default=32, help='Concurrent scans of each ticket')
+        parser.add_argument('--tickets', type=int, default=20, help='Tickets scanned, one after another')
+
+    def handle(self, *args, **options):
+        if connection.vendor == 'sqlite':
+            raise CommandError('SQLite serializes writers; run this against MySQL or PostgreSQL.')
+
+        scanners, count = options['scanners'], options['tickets']
+
+        category, _ = Category.objects.get_or_create(category_name='Benchmark')
+        venue, _ = Venue.objects.get_or_create(name='Benchmark Hall', defaults={'address': '-', 'capacity': 0})
+        customer, _ = Customer.objects.get_or_create(email=SIMULATION_EMAIL)
+        event = Event.objects.create(
+            event_name='Gate check-in simulation', description='-', location='-',
+            event_date=date(2026, 1, 1), start_time=dt_time(9, 0), end_time=dt_time(17, 0),
+            organizer=SIMULATION_ORGANIZER, category=category, venue=venue,
+        )
+
+        try:
+            ticket = Ticket.objects.create(event=event, ticket_type='Standard', price=Decimal('1.00'), quantity=count)
+            booking = Booking.objects.create(
+                customer=customer, event=event, ticket=ticket, quantity=count,
+                total_amount=ticket.price * count, status='confirmed',
+            )
+            codes = [row['ticket_code'] for row in EventTicketService.issue_tickets_for_booking(booking.id, workers=0)['tickets']]
+
+            failures = []
+            started = time.perf_counter()
+            for code in codes:
+                wins = self._race(code, scanners, event.id)
+                if wins != 1:
+                    failures.append(f'{code}: {wins} scans succeeded')
+            elapsed = time.perf_counter() - started
+
+            logged = {
+                row['status']: row['total']
+                for row in Checkin.objects.filter(ticket_code__in=codes).values('status').annotate(total=Count('id'))
+            }
+            used = EventTicket.objects.filter(ticket_code__in=codes, status='USED').count()
+            self.stdout.write(
+                f'{len(codes)} tickets x {scanners} concurrent scans in {elapsed:.2f}s; '
+                f'{used} tickets USED, check-in log {logged}'
+            )
+            if logged.get('SUCCESS', 0) != len(codes) or logged.get('ALREADY_USED', 0) != len(codes) * (scanners - 1):
+                failures.append(f'unexpected check-in log {logged}')
+            if used != len(codes):
+                failures.append(f'{used} of {len(codes)} tickets marked USED')
+            for failure in failures[:5]:
+                self.stdout.write(self.style.WARNING(f'  {failure}'))
+            if failures:
+                raise CommandError(f'{len(failures)} check-in anomalies.')
+            self.stdout.write(self.style.SUCCESS('Every ticket was admitted exactly once.'))
+        finally:
+            event.delete()
+            customer.delete()
+
+    def _race(self, ticket_code: str, scanners: int, event_id: int) -> int:
+        """Runs `scanners` simultaneous scans of one ticket and returns how many were admitted."""
+        barrier = threading.Barrier(scanners)
+        lock = threading.Lock()
+        results = {'wins': 0, 'errors': []}
+
+        def scanner(index: int):
+            try:
+                barrier.wait()
+                if index % 2:
+                    won = CheckinService.scan_ticket(ticket_code, event_id=event_id)['status'] == 'CHECKED_IN'
+                else:
+                    won = CheckinService.confirm_checkin(ticket_code)['success']
+                if won:
+                    with lock:
+                        results['wins'] += 1
+            except Exception as e:
+                with lock:
+                    results['errors'].append(repr(e))
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=scanner, args=(index,)) for index in range(scanners)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        if results['errors']:
+            raise CommandError(f'Scanner errors: {results["errors"][:3]}')
+        return results['wins']
@@ -0,0 +1,106 @@
+import threading
+import time
+from datetime import date, time as dt_time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from app.models.booking import Booking
+from app.models.category import Category
+from app.models.customer import Customer
+from app.models.event import Event
+from app.models.ticket import Ticket
+from app.models.venue import Venue
+from app.services.booking_service import BookingService
+
+STRESS_ORGANIZER = 'stress-reservation'
+STRESS_EMAIL = 'stress-reservation@example.com'
+
+
+class Command(BaseCommand):
+    help = (
+        'Concurrency stress test for ticket reservation: many threads race to buy the last '
+        'seats through BookingService.create_booking and the command fails on any oversell '
+        'or lost update. Needs a server database (MySQL/PostgreSQL) with max_connections '
+        'above --threads.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=200, help='Concurrent buyer threads')
+        parser.add_argument('--seats', type=int, default=50, help='Seats on sale')
+        parser.add_argument('--attempts', type=int, default=2, help='Purchases attempted per thread')
+        parser.add_argument('--quantity', type=int, default=1, help='Seats per purchase')
+
+    def handle(self, *args, **options):
+        if connection.vendor == 'sqlite':
+            raise CommandError('SQLite serializes writers; run this against MySQL or PostgreSQL.')
+
+        threads, seats = options['threads'], options['seats']
+        attempts, quantity = options['attempts'], options['quantity']
+
+        category, _ = Category.objects.get_or_create(category_name='Benchmark')
+        venue, _ = Venue.objects.get_or_create(name='Benchmark Hall', defaults={'address': '-', 'capacity': 0})
+        customer, _ = Customer.objects.get_or_create(email=STRESS_EMAIL)
+        event = Event.objects.create(
+            event_name='Reservation stress test', description='-', location='-',
+            event_date=date(2026, 1, 1), start_time=dt_time(9, 0), end_time=dt_time(17, 0),
+            organizer=STRESS_ORGANIZER, category=category, venue=venue,
+        )
+        ticket = Ticket.objects.create(event=event, ticket_type='Standard', price=Decimal('1.00'), quantity=seats)
+
+        barrier = threading.Barrier(threads)
+        lock = threading.Lock()
+        results = {'ok': 0, 'sold_out': 0, 'errors': []}
+
+        def buyer():
+            try:
+                barrier.wait()
+                for _ in range(attempts):
+                    try:
+                        BookingService.create_booking({
+                            'customer': customer.id,
+                            'event': event.id,
+                            'ticket': ticket.id,
+                            'quantity': quantity,
+                            'total_amount': ticket.price * quantity,
+                        })
+                        outcome = 'ok'
+                    except ValueError:
+                        outcome = 'sold_out'
+                    with lock:
+                        results[outcome] += 1
+            except Exception as e:
+                with lock:
+                    results['errors'].append(repr(e))
+            finally:
+                connection.close()
+
+        self.stdout.write(self.style.HTTP_INFO(
+            f'{threads} threads x {attempts} attempts buying {quantity} of {seats} seats...'
+        ))
+        started = time.perf_counter()
+        workers = [threading.Thread(target=buyer) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - started
+
+        try:
+            ticket.refresh_from_db()
+            booked = Booking.objects.filter(ticket=ticket).count() * quantity
+            self.stdout.write(
+                f'{results["ok"]} bookings, {results["sold_out"]} sold out, {len(results["errors"])} errors '
+                f'in {elapsed:.2f}s; sold={ticket.sold} booked={booked} quantity={ticket.quantity}'
+            )
+            for error in results['errors'][:5]:
+                self.stdout.write(self.style.WARNING(f'  {error}'))
+
+            expected = min(seats // quantity, threads * attempts) * quantity
+            if ticket.sold != booked or ticket.sold > ticket.quantity or ticket.sold != expected:
+                raise CommandError(f'Inventory mismatch: expected sold={expected}, got sold={ticket.sold}, booked={booked}.')
+            self.stdout.write(self.style.SUCCESS('No oversell and no lost updates.'))
+        finally:
+            event.delete()
+            customer.delete()
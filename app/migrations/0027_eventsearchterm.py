@@ -0,0 +1,42 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+FULLTEXT_INDEX = 'events_fulltext'
+
+
+def add_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'mysql':
+        schema_editor.execute(
+            f"ALTER TABLE events ADD FULLTEXT INDEX {FULLTEXT_INDEX} (event_name, description, location, organizer)"
+        )
+
+
+def drop_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'mysql':
+        schema_editor.execute(f"ALTER TABLE events DROP INDEX {FULLTEXT_INDEX}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0026_alter_checkin_booking_alter_checkin_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventSearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64)),
+                ('weight', models.PositiveSmallIntegerField(default=1)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_terms', to='app.event')),
+            ],
+            options={
+                'db_table': 'event_search_terms',
+                'unique_together': {('term', 'event')},
+            },
+        ),
+        migrations.RunPython(add_fulltext_index, drop_fulltext_index),
+    ]
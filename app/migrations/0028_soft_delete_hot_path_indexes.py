@@ -0,0 +1,73 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0027_eventsearchterm'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['is_deleted', 'event', 'booking_date'], name='bookings_del_event_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['is_deleted', 'customer', 'booking_date'], name='bookings_del_cust_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['is_deleted', 'booking_date'], name='bookings_del_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['md5'], name='payments_md5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['is_deleted', 'created_at'], name='payments_del_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['status', 'is_deleted', 'paid_at'], name='payments_status_paid_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='checkin',
+            index=models.Index(fields=['ticket_code'], name='checkins_ticket_code_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='checkin',
+            index=models.Index(fields=['is_deleted', 'checkin_time'], name='checkins_del_time_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['is_deleted', 'created_at'], name='events_del_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['is_deleted', 'event_date'], name='events_del_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['is_deleted', 'event', 'created_at'], name='tickets_del_event_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventticket',
+            index=models.Index(fields=['is_deleted', 'booking', 'created_at'], name='evtickets_del_booking_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventticket',
+            index=models.Index(fields=['is_deleted', 'created_at'], name='evtickets_del_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventregistration',
+            index=models.Index(fields=['is_deleted', 'event', 'registered_at'], name='evregs_del_event_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventregistration',
+            index=models.Index(fields=['is_deleted', 'registered_at'], name='evregs_del_reg_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:00
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def clamp_sold(apps, schema_editor):
+    """Repairs rows oversold before the constraint existed so it can be added."""
+    Ticket = apps.get_model('app', 'Ticket')
+    Ticket.objects.filter(sold__lt=0).update(sold=0)
+    # Keep the recorded sales; raise capacity to match what was actually sold
+    Ticket.objects.filter(sold__gt=F('quantity')).update(quantity=F('sold'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0028_soft_delete_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(clamp_sold, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='ticket',
+            constraint=models.CheckConstraint(
+                condition=models.Q(('sold__gte', 0), ('sold__lte', models.F('quantity'))),
+                name='tickets_sold_within_quantity',
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0029_ticket_sold_within_quantity'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='counter_slots',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='TicketCounterShard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('slot', models.PositiveSmallIntegerField()),
+                ('remaining', models.IntegerField(default=0)),
+                ('ticket', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='counter_shards', to='app.ticket')),
+            ],
+            options={
+                'db_table': 'ticket_counter_shards',
+                'unique_together': {('ticket', 'slot')},
+                'constraints': [models.CheckConstraint(condition=models.Q(('remaining__gte', 0)), name='ticket_shards_remaining_gte_0')],
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 6.0.1 on 2026-10-18 10:00
+
+from django.db import migrations, transaction
+
+BATCH_SIZE = 5000
+
+
+def strip_qr_blobs(apps, schema_editor):
+    """Drops the stored base64 QR images; they are now rendered on demand from ticket_code."""
+    EventTicket = apps.get_model('app', 'EventTicket')
+    # Walk primary-key ranges, committing each one, so no long UPDATE or transaction
+    # holds the table; only the id range (not the unindexed TEXT column) is scanned
+    last_id = 0
+    while True:
+        # Last id of the next range; None once fewer than BATCH_SIZE rows are left
+        upper = next(iter(
+            EventTicket.objects.filter(id__gt=last_id).order_by('id')
+            .values_list('id', flat=True)[BATCH_SIZE - 1:BATCH_SIZE]
+        ), None)
+        with transaction.atomic():
+            batch = EventTicket.objects.filter(id__gt=last_id, qr_code__isnull=False)
+            if upper is not None:
+                batch = batch.filter(id__lte=upper)
+            batch.update(qr_code=None)
+        if upper is None:
+            break
+        last_id = upper
+
+
+class Migration(migrations.Migration):
+    # Each batch commits on its own (see strip_qr_blobs)
+    atomic = False
+
+    dependencies = [
+        ('app', '0032_event_admission_rate'),
+    ]
+
+    operations = [
+        migrations.RunPython(strip_qr_blobs, migrations.RunPython.noop),
+    ]
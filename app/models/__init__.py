@@ -13,3 +13,5 @@ from .checkin import Checkin
 from .event_registration import EventRegistration
 from .user_profile import UserProfile
 from .customer import Customer
+from .event_search_term import EventSearchTerm
+from .ticket_counter_shard import TicketCounterShard
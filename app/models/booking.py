@@ -17,6 +17,7 @@ class Booking(models.Model):
         ('pending', 'Pending'),
         ('confirmed', 'Confirmed'),
         ('cancelled', 'Cancelled'),
+        ('expired', 'Expired'),
     ]
 
     # Custom managers for soft delete
@@ -30,6 +31,8 @@ class Booking(models.Model):
     total_amount = models.DecimalField(max_digits=10, decimal_places=2)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     booking_date = models.DateTimeField(auto_now_add=True)
+    # Pending bookings hold their seats until this time (see SeatHoldService)
+    hold_expires_at = models.DateTimeField(null=True, blank=True)
     is_deleted = models.BooleanField(default=False)
     deleted_at = models.DateTimeField(null=True, blank=True)
 
@@ -41,4 +44,10 @@ class Booking(models.Model):
 
     class Meta:
         db_table = "bookings"
-        ordering = ['-booking_date']
\ No newline at end of file
+        ordering = ['-booking_date']
+        indexes = [
+            models.Index(fields=['is_deleted', 'event', 'booking_date'], name='bookings_del_event_date_idx'),
+            models.Index(fields=['is_deleted', 'customer', 'booking_date'], name='bookings_del_cust_date_idx'),
+            models.Index(fields=['is_deleted', 'booking_date'], name='bookings_del_date_idx'),
+            models.Index(fields=['status', 'hold_expires_at'], name='bookings_status_hold_idx'),
+        ]
@@ -28,4 +28,8 @@ class Checkin(models.Model):
 
     class Meta:
         db_table = "checkins"
-        ordering = ['-checkin_time']
\ No newline at end of file
+        ordering = ['-checkin_time']
+        indexes = [
+            models.Index(fields=['ticket_code'], name='checkins_ticket_code_idx'),
+            models.Index(fields=['is_deleted', 'checkin_time'], name='checkins_del_time_idx'),
+        ]
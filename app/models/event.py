@@ -28,6 +28,8 @@ class Event(models.Model):
     venue = models.ForeignKey(Venue, on_delete=models.CASCADE, related_name='events')
     image = models.CharField(max_length=255, null=True, blank=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='upcoming')
+    # Clients admitted to booking per second through the waiting room; 0 disables it
+    admission_rate = models.PositiveIntegerField(default=0)
     is_deleted = models.BooleanField(default=False)
     deleted_at = models.DateTimeField(null=True, blank=True)
     deleted_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True)
@@ -40,3 +42,9 @@ class Event(models.Model):
     class Meta:
         db_table = "events"
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['is_deleted', 'created_at'], name='events_del_created_idx'),
+            models.Index(fields=['is_deleted', 'event_date'], name='events_del_date_idx'),
+            models.Index(fields=['is_deleted', 'status', 'event_date'], name='events_del_status_date_idx'),
+            models.Index(fields=['is_deleted', 'event_name'], name='events_del_name_idx'),
+        ]
@@ -29,4 +29,8 @@ class EventRegistration(models.Model):
     class Meta:
         db_table = "event_registrations"
         ordering = ['-registered_at']
-        unique_together = ('user', 'event')
\ No newline at end of file
+        indexes = [
+            models.Index(fields=['is_deleted', 'event', 'registered_at'], name='evregs_del_event_idx'),
+            models.Index(fields=['is_deleted', 'registered_at'], name='evregs_del_reg_idx'),
+        ]
+        unique_together = ('user', 'event')
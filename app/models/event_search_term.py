@@ -0,0 +1,19 @@
+from django.db import models
+from app.models.event import Event
+
+
+class EventSearchTerm(models.Model):
+    """
+    Inverted-index entry mapping a search term to an event, with a relevance weight.
+    Maintained by EventSearchService on event writes; used where FULLTEXT is unavailable.
+    """
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='search_terms')
+    term = models.CharField(max_length=64)
+    weight = models.PositiveSmallIntegerField(default=1)
+
+    def __str__(self):
+        return f"{self.term} -> Event {self.event_id}"
+
+    class Meta:
+        db_table = "event_search_terms"
+        unique_together = ('term', 'event')
@@ -15,6 +15,7 @@ class EventTicket(models.Model):
     id = models.AutoField(primary_key=True)
     booking = models.ForeignKey(Booking, on_delete=models.CASCADE, related_name='event_tickets')
     ticket_code = models.CharField(max_length=255, unique=True)
+    # No longer written: QR images are rendered on demand from ticket_code (see app.utils.ticket_qr)
     qr_code = models.TextField(blank=True, null=True)
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='UNUSED')
     
@@ -29,4 +30,8 @@ class EventTicket(models.Model):
 
     class Meta:
         db_table = "event_tickets"
-        ordering = ['-created_at']
\ No newline at end of file
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['is_deleted', 'booking', 'created_at'], name='evtickets_del_booking_idx'),
+            models.Index(fields=['is_deleted', 'created_at'], name='evtickets_del_created_idx'),
+        ]
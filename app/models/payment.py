@@ -63,4 +63,9 @@ class Payment(models.Model):
 
     class Meta:
         db_table = "payments"
-        ordering = ['paid_at']
\ No newline at end of file
+        ordering = ['paid_at']
+        indexes = [
+            models.Index(fields=['md5'], name='payments_md5_idx'),
+            models.Index(fields=['is_deleted', 'created_at'], name='payments_del_created_idx'),
+            models.Index(fields=['status', 'is_deleted', 'paid_at'], name='payments_status_paid_idx'),
+        ]
@@ -18,6 +18,8 @@ class Ticket(models.Model):
     price = models.DecimalField(max_digits=10, decimal_places=2)
     quantity = models.IntegerField(default=0)
     sold = models.IntegerField(default=0)
+    # > 0 while sales run on sharded counters (TicketCounterService); sold is then reconciled periodically
+    counter_slots = models.PositiveSmallIntegerField(default=0)
     is_deleted = models.BooleanField(default=False)
     deleted_at = models.DateTimeField(null=True, blank=True)
 
@@ -29,4 +31,14 @@ class Ticket(models.Model):
 
     class Meta:
         db_table = "tickets"
-        ordering = ['-created_at']
\ No newline at end of file
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['is_deleted', 'event', 'created_at'], name='tickets_del_event_idx'),
+            models.Index(fields=['is_deleted', 'created_at'], name='tickets_del_created_idx'),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(sold__gte=0) & models.Q(sold__lte=models.F('quantity')),
+                name='tickets_sold_within_quantity',
+            ),
+        ]
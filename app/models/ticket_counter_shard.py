@@ -0,0 +1,22 @@
+from django.db import models
+from app.models.ticket import Ticket
+
+
+class TicketCounterShard(models.Model):
+    """
+    One slot of a sharded sold-counter: holds a slice of a ticket's remaining capacity.
+    Only present while the ticket has counter_slots > 0 (see TicketCounterService).
+    """
+    ticket = models.ForeignKey(Ticket, on_delete=models.CASCADE, related_name='counter_shards')
+    slot = models.PositiveSmallIntegerField()
+    remaining = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"Ticket {self.ticket_id} slot {self.slot}: {self.remaining} left"
+
+    class Meta:
+        db_table = "ticket_counter_shards"
+        unique_together = ('ticket', 'slot')
+        constraints = [
+            models.CheckConstraint(condition=models.Q(remaining__gte=0), name='ticket_shards_remaining_gte_0'),
+        ]
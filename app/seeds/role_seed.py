@@ -48,8 +48,12 @@ def seed_roles():
             else:
                 print(f"Permission '{permission.name}' already assigned to role '{role.name}'")
 
+    # Step 5: Drop cached role permission sets so running workers pick up the changes
+    from app.utils.permission_cache import PermissionCache
+    PermissionCache.invalidate()
 
-# Step 5: Setup Django environment and run the seeder
+
+# Step 6: Setup Django environment and run the seeder
 if __name__ == '__main__':
     import os
     import django
@@ -3,6 +3,7 @@ from app.models.customer import Customer
 from app.models.role import Role
 from app.services.google_oauth_service import GoogleOAuthService
 from app.utils.jwt import JWTUtil
+from app.utils.principal import PrincipalCache
 from rest_framework.exceptions import AuthenticationFailed
 
 class AuthenticationService:
@@ -26,18 +27,28 @@ class AuthenticationService:
         except Role.DoesNotExist:
             default_role = None
 
-        customer, created = Customer.objects.update_or_create(
+        profile = {
+            'first_name': google_user_data.get('first_name', ''),
+            'last_name': google_user_data.get('last_name', ''),
+            'picture': google_user_data.get('picture', ''),
+            'email_verified': True,
+            'is_deleted': False,
+            'role': default_role
+        }
+        customer, created = Customer.objects.select_related('role').get_or_create(
             email=email,
-            defaults={
-                'first_name': google_user_data.get('first_name', ''),
-                'last_name': google_user_data.get('last_name', ''),
-                'picture': google_user_data.get('picture', ''),
-                'email_verified': True,
-                'is_deleted': False,
-                'role': default_role
-            }
+            defaults=profile
         )
 
+        # 3. Only write back when the Google profile actually changed
+        if not created:
+            changed = [field for field, value in profile.items() if getattr(customer, field) != value]
+            if changed:
+                for field in changed:
+                    setattr(customer, field, profile[field])
+                customer.save(update_fields=changed + ['updated_at'])
+                PrincipalCache.evict_customer(customer.id)
+
         # 4. Generate JWT tokens (Unified)
         tokens = JWTUtil.generate_tokens(customer)
         
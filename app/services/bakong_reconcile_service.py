@@ -0,0 +1,214 @@
+import logging
+import secrets
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from app.models.booking import Booking
+from app.models.payment import Payment
+from app.services.seat_hold_service import SeatHoldService
+from app.utils.bakong_client import get_bakong_client
+from app.utils.payment_events import get_payment_event_hub
+
+logger = logging.getLogger(__name__)
+
+STATUS_KEY = 'bakong:status:{md5}'
+RUN_LOCK_KEY = 'bakong:reconcile:lock'
+# Upper bound on one run holding RUN_LOCK_KEY; only reached if a worker dies mid-run
+RUN_LOCK_TIMEOUT = 600
+# Bakong accepts at most 50 hashes per check_transaction_by_md5_list call
+MAX_BULK_MD5 = 50
+
+
+class BakongReconcileService:
+    """
+    Confirms Bakong payments in the background instead of on client polls.
+
+    reconcile() collects the md5 of every pending, unexpired Bakong payment and
+    asks Bakong about them in batches through check_transaction_by_md5_list.
+    Paid ones are completed, and their bookings confirmed, in bulk. The result of
+    each check is written to the cache, so status polls read local state only.
+    """
+
+    @staticmethod
+    def local_status(payment: Payment) -> dict:
+        """Status of a payment as this server knows it, without calling Bakong."""
+        if payment.status == 'completed':
+            return {"status": "COMPLETED", "message": "Payment confirmed", "payment": payment}
+        if payment.status == 'failed':
+            return {"status": "FAILED", "message": "Payment failed"}
+
+        grace = timedelta(seconds=getattr(settings, 'BAKONG_RECONCILE_GRACE', 120))
+        if payment.expire_at and payment.expire_at + grace <= timezone.now():
+            return {"status": "FAILED", "message": "Payment QR code has expired"}
+        return {"status": "PENDING", "message": "Payment is pending"}
+
+    @staticmethod
+    def cached_status(md5: str):
+        return cache.get(STATUS_KEY.format(md5=md5))
+
+    @staticmethod
+    def cache_status(md5: str, status: str, message: str) -> None:
+        cache.set(STATUS_KEY.format(md5=md5), {"status": status, "message": message}, timeout=getattr(settings, 'BAKONG_STATUS_CACHE_TTL', 10))
+
+    @staticmethod
+    def check_md5_list(md5s: list) -> dict:
+        """
+        One check_transaction_by_md5_list call. Returns {md5: transaction data} for the
+        hashes Bakong reports as paid. Raises ConnectionError when Bakong can't be used.
+        """
+        data = get_bakong_client().check_md5_list(md5s)
+        if data.get('responseCode') != 0:
+            # Bakong answers responseCode 1 when none of the hashes has been paid yet
+            return {}
+        return {
+            item['md5']: item.get('data') or {}
+            for item in data.get('data') or []
+            if item.get('md5') and item.get('status') == 'SUCCESS'
+        }
+
+    @staticmethod
+    def _complete(paid: dict) -> tuple:
+        """Marks the paid payments completed and confirms their bookings; returns (payments, bookings)."""
+        now = timezone.now()
+        with transaction.atomic():
+            payments = list(
+                Payment.objects.select_for_update(skip_locked=True)
+                .filter(md5__in=paid, status='pending', is_deleted=False)
+            )
+            if not payments:
+                return 0, 0
+
+            for payment in payments:
+                details = paid[payment.md5]
+                payment.status, payment.paid, payment.paid_at, payment.updated_at = 'completed', True, now, now
+                payment.bakongHash = details.get('hash')
+                payment.fromAccountId = details.get('fromAccountId')
+                payment.toAccountId = details.get('toAccountId')
+            Payment.objects.bulk_update(
+                payments, ['status', 'paid', 'paid_at', 'bakongHash', 'fromAccountId', 'toAccountId', 'updated_at']
+            )
+
+            booking_ids = {payment.booking_id for payment in payments}
+            confirmed = Booking.objects.filter(id__in=booking_ids, status='pending').update(
+                status='confirmed', hold_expires_at=None, updated_at=now
+            )
+            # Holds that lapsed before the money arrived have to win their seats back one by one
+            for booking in Booking.objects.filter(id__in=booking_ids, status='expired'):
+                confirmed += SeatHoldService.confirm(booking)
+
+            md5s = [payment.md5 for payment in payments]
+            transaction.on_commit(lambda: [
+                BakongReconcileService.cache_status(md5, "COMPLETED", "Payment confirmed") for md5 in md5s
+            ])
+            # Wake the clients streaming these payments' status
+            get_payment_event_hub().publish_on_commit(md5s, "COMPLETED")
+        return len(payments), confirmed
+
+    @staticmethod
+    def reconcile(batch_size: int = None, now=None) -> dict:
+        """
+        Checks every pending Bakong payment whose QR has not expired (plus
+        BAKONG_RECONCILE_GRACE seconds) against Bakong. Returns metrics for the run.
+        """
+        batch_size = min(batch_size or getattr(settings, 'BAKONG_RECONCILE_BATCH', MAX_BULK_MD5), MAX_BULK_MD5)
+        now = now or timezone.now()
+        started = time.perf_counter()
+        metrics = {'checked': 0, 'batches': 0, 'completed': 0, 'bookings': 0, 'errors': 0}
+
+        md5s = list(dict.fromkeys(
+            Payment.objects.filter(
+                payment_method='bakong',
+                status='pending',
+                is_deleted=False,
+                md5__isnull=False,
+                expire_at__gt=now - timedelta(seconds=getattr(settings, 'BAKONG_RECONCILE_GRACE', 120)),
+            ).order_by('expire_at').values_list('md5', flat=True)
+        ))
+
+        for start in range(0, len(md5s), batch_size):
+            batch = md5s[start:start + batch_size]
+            metrics['batches'] += 1
+            try:
+                paid = BakongReconcileService.check_md5_list(batch)
+            except (ConnectionError, ValueError) as e:
+                metrics['errors'] += 1
+                logger.warning(f"Bakong reconcile batch of {len(batch)} failed: {e}")
+                continue
+
+            metrics['checked'] += len(batch)
+            if paid:
+                payments, bookings = BakongReconcileService._complete(paid)
+                metrics['completed'] += payments
+                metrics['bookings'] += bookings
+            for md5 in batch:
+                if md5 not in paid:
+                    BakongReconcileService.cache_status(md5, "PENDING", "Payment is pending")
+
+        metrics['seconds'] = round(time.perf_counter() - started, 3)
+        if metrics['completed'] or metrics['errors']:
+            logger.info(
+                f"Bakong reconcile: {metrics['completed']} of {metrics['checked']} pending payments completed, "
+                f"{metrics['bookings']} bookings confirmed, {metrics['errors']} failed batches ({metrics['seconds']}s)"
+            )
+        return metrics
+
+
+class BakongReconciler:
+    """
+    In-process scheduler that runs BakongReconcileService.reconcile every
+    BAKONG_RECONCILE_INTERVAL seconds on a daemon thread. With a shared cache only
+    one worker per interval makes the Bakong calls; a per-process cache (LocMem)
+    cannot coordinate workers, so every worker would poll Bakong.
+    """
+    _thread = None
+    _lock = threading.Lock()
+    runs = 0
+    last_run = None
+
+    @classmethod
+    def _loop(cls, interval: float) -> None:
+        while True:
+            time.sleep(interval)
+            # Held for the whole run, however long a struggling gateway makes it
+            token = secrets.token_hex(16)
+            if not cache.add(RUN_LOCK_KEY, token, timeout=RUN_LOCK_TIMEOUT):
+                continue
+            started = time.monotonic()
+            close_old_connections()
+            try:
+                cls.last_run = BakongReconcileService.reconcile()
+                cls.runs += 1
+            except Exception:
+                logger.exception("Bakong reconcile failed")
+            finally:
+                close_old_connections()
+                if cache.get(RUN_LOCK_KEY) == token:
+                    # Keep the other workers off until an interval has passed since this run started
+                    left = int(interval - (time.monotonic() - started))
+                    if left > 0:
+                        cache.touch(RUN_LOCK_KEY, left)
+                    else:
+                        cache.delete(RUN_LOCK_KEY)
+
+    @classmethod
+    def start(cls, interval: float = None) -> bool:
+        """Starts the reconciler thread once per process; no-op when the interval is 0."""
+        interval = interval if interval is not None else getattr(settings, 'BAKONG_RECONCILE_INTERVAL', 0)
+        if not interval:
+            return False
+        if settings.CACHES['default']['BACKEND'].endswith('LocMemCache'):
+            logger.warning(
+                "BAKONG_RECONCILE_INTERVAL is set but the cache is per-process; every worker will poll Bakong. "
+                "Configure a shared cache or run the reconcile_bakong_payments command instead."
+            )
+        with cls._lock:
+            if cls._thread is None:
+                cls._thread = threading.Thread(target=cls._loop, args=(interval,), name='bakong-reconciler', daemon=True)
+                cls._thread.start()
+        return True
@@ -1,12 +1,20 @@
-from typing import Dict, Any
-from django.db import transaction
-from django.db.models import Q
+from collections import defaultdict
+from typing import Dict, Any, List
+from django.db import connection, transaction
+from django.db.models import Max, Q
 from django.core.exceptions import ObjectDoesNotExist
 from django.utils import timezone
 from app.models.booking import Booking
 from app.models.customer import Customer
 from app.models.event import Event
 from app.models.ticket import Ticket
+from app.services.seat_hold_service import SeatHoldService
+from app.services.ticket_inventory_service import TicketInventoryService
+from app.utils.pagination import paginate_queryset
+
+# Bookings in these states hold their seats; expired holds were already returned by
+# SeatHoldService.release_expired and cancelled ones when they were cancelled
+SEAT_HOLDING_STATUSES = ('pending', 'confirmed')
 
 
 class BookingService:
@@ -42,33 +50,138 @@ class BookingService:
         quantity = validated_data.get('quantity')
         total_amount = validated_data.get('total_amount')
 
-        # Basic ticket availability check
-        if ticket and quantity and ticket.quantity - ticket.sold < quantity:
+        # Reserve seats with one conditional UPDATE; no read-check-write race
+        if ticket and quantity and not TicketInventoryService.reserve(ticket, quantity):
             raise ValueError('Not enough tickets available')
 
+        status = validated_data.get('status', 'pending')
         booking = Booking.objects.create(
             customer=customer,
             event=event,
             ticket=ticket,
             quantity=quantity,
             total_amount=total_amount,
-            status=validated_data.get('status', 'pending')
+            status=status,
+            # Pending bookings only hold their seats until the hold expires
+            hold_expires_at=SeatHoldService.hold_expiry() if status == 'pending' else None,
         )
 
-        # Update ticket sold count
-        if ticket and quantity:
-            ticket.sold += quantity
-            ticket.save()
-
         return booking
 
+    @staticmethod
+    def _reserve_lines(ticket: Ticket, lines: List[dict]) -> List[dict]:
+        """
+        Reserves seats for all lines on one ticket with a single conditional UPDATE.
+        If they don't all fit, reserves the lines that fit what is left, in order.
+        Returns the lines that got their seats.
+        """
+        if TicketInventoryService.reserve(ticket, sum(line['quantity'] for line in lines)):
+            return lines
+
+        left = TicketInventoryService.available(ticket)
+        fitting = []
+        for line in lines:
+            if line['quantity'] <= left:
+                fitting.append(line)
+                left -= line['quantity']
+        if fitting and not TicketInventoryService.reserve(ticket, sum(line['quantity'] for line in fitting)):
+            return []
+        return fitting
+
+    @staticmethod
+    @transaction.atomic
+    def create_bookings_batch(lines: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Creates many bookings at once. Customers, events and tickets are resolved with
+        one in_bulk query each, seats are reserved with one UPDATE per ticket and the
+        bookings are inserted with bulk_create. Lines fail individually; the result
+        has one {'index', 'success', 'booking' | 'error'} entry per line, in order.
+        """
+        customers = Customer.objects.in_bulk({line['customer'] for line in lines})
+        events = Event.objects.select_related('category', 'venue').filter(is_deleted=False).in_bulk(
+            {line['event'] for line in lines}
+        )
+        tickets = Ticket.objects.filter(is_deleted=False).in_bulk({line['ticket'] for line in lines})
+
+        results = [{'index': index, 'success': False} for index in range(len(lines))]
+        by_ticket = defaultdict(list)
+        for index, line in enumerate(lines):
+            ticket = tickets.get(line['ticket'])
+            if line['customer'] not in customers:
+                results[index]['error'] = 'Customer not found'
+            elif line['event'] not in events:
+                results[index]['error'] = 'Event not found'
+            elif ticket is None:
+                results[index]['error'] = 'Ticket not found'
+            elif ticket.event_id != line['event']:
+                results[index]['error'] = 'Ticket does not belong to this event'
+            else:
+                by_ticket[ticket.id].append({**line, 'index': index})
+
+        # Lock tickets in id order so concurrent batches cannot deadlock each other
+        reserved = []
+        for ticket_id in sorted(by_ticket):
+            fitting = BookingService._reserve_lines(tickets[ticket_id], by_ticket[ticket_id])
+            fitted = {line['index'] for line in fitting}
+            for line in by_ticket[ticket_id]:
+                if line['index'] not in fitted:
+                    results[line['index']]['error'] = 'Not enough tickets available'
+            reserved.extend(fitting)
+        reserved.sort(key=lambda line: line['index'])
+        if not reserved:
+            return results
+
+        hold_expires_at = SeatHoldService.hold_expiry()
+        bookings = [
+            Booking(
+                customer=customers[line['customer']],
+                event=events[line['event']],
+                ticket=tickets[line['ticket']],
+                quantity=line['quantity'],
+                total_amount=tickets[line['ticket']].price * line['quantity'],
+                status='pending',
+                hold_expires_at=hold_expires_at,
+            )
+            for line in reserved
+        ]
+        last_id = None if connection.features.can_return_rows_from_bulk_insert else (
+            Booking.all_objects.aggregate(last_id=Max('id'))['last_id'] or 0
+        )
+        Booking.objects.bulk_create(bookings)
+
+        if last_id is not None:
+            # MySQL does not return ids from bulk_create; match the new rows back to their lines
+            created = defaultdict(list)
+            rows = Booking.all_objects.filter(id__gt=last_id, hold_expires_at=hold_expires_at).order_by('id').values_list(
+                'id', 'customer_id', 'ticket_id', 'quantity'
+            )
+            for booking_id, *key in rows:
+                created[tuple(key)].append(booking_id)
+            for booking in bookings:
+                booking.id = created[(booking.customer_id, booking.ticket_id, booking.quantity)].pop(0)
+
+        for line, booking in zip(reserved, bookings):
+            results[line['index']].update(success=True, booking=booking)
+        return results
+
+    @staticmethod
+    def _get_locked_booking(pk: int):
+        """
+        Returns the booking locked for update (call inside a transaction), so its
+        status cannot change under us, e.g. by the seat hold sweeper.
+        """
+        return Booking.objects.select_for_update().filter(pk=pk, is_deleted=False).first()
+
     @staticmethod
     @transaction.atomic
     def update_booking(pk: int, validated_data: Dict[str, Any]):
-        booking = BookingService.get_booking_by_id(pk)
+        booking = BookingService._get_locked_booking(pk)
         if not booking:
             return None
 
+        old_ticket, old_qty = booking.ticket, booking.quantity
+        held = booking.status in SEAT_HOLDING_STATUSES
+
         if 'customer' in validated_data:
             booking.customer = BookingService._resolve_fk(validated_data.get('customer'), Customer)
         if 'event' in validated_data:
@@ -76,18 +189,22 @@ class BookingService:
         if 'ticket' in validated_data:
             booking.ticket = BookingService._resolve_fk(validated_data.get('ticket'), Ticket)
         if 'quantity' in validated_data:
-            # Adjust ticket sold counts if ticket is set
-            old_qty = booking.quantity
-            new_qty = validated_data.get('quantity')
-            booking.quantity = new_qty
-            if booking.ticket:
-                delta = new_qty - old_qty
-                booking.ticket.sold = max(0, booking.ticket.sold + delta)
-                booking.ticket.save()
+            booking.quantity = validated_data.get('quantity')
         if 'total_amount' in validated_data:
             booking.total_amount = validated_data.get('total_amount')
         if 'status' in validated_data:
             booking.status = validated_data.get('status')
+            if booking.status != 'pending':
+                booking.hold_expires_at = None
+        # Move the reserved seats if the ticket or quantity changed, and reserve or
+        # release them when the booking starts or stops holding seats
+        holds = booking.status in SEAT_HOLDING_STATUSES
+        if 'ticket' in validated_data or 'quantity' in validated_data or held != holds:
+            if not TicketInventoryService.move(
+                old_ticket if held else None, old_qty,
+                booking.ticket if holds else None, booking.quantity,
+            ):
+                raise ValueError('Not enough tickets available')
 
         booking.save()
         return booking
@@ -95,17 +212,16 @@ class BookingService:
     @staticmethod
     @transaction.atomic
     def delete_booking(pk: int):
-        booking = BookingService.get_booking_by_id(pk)
+        booking = BookingService._get_locked_booking(pk)
         if not booking:
             return False
         # Soft delete instead of hard delete
         booking.is_deleted = True
         booking.deleted_at = timezone.now()
-        booking.save()
-        # Rollback ticket sold count for soft deleted booking
-        if booking.ticket:
-            booking.ticket.sold = max(0, booking.ticket.sold - booking.quantity)
-            booking.ticket.save()
+        booking.save(update_fields=['is_deleted', 'deleted_at', 'updated_at'])
+        # Rollback ticket sold count for soft deleted booking, unless already returned
+        if booking.ticket_id and booking.status in SEAT_HOLDING_STATUSES:
+            TicketInventoryService.release(booking.ticket, booking.quantity)
         return True
 
     @staticmethod
@@ -115,22 +231,17 @@ class BookingService:
         Permanently delete a booking from the database.
         Use with caution - this action cannot be undone.
         """
-        booking = BookingService.get_booking_by_id(pk)
+        booking = BookingService._get_locked_booking(pk)
         if not booking:
             return False
-        # Rollback ticket sold count before hard delete
-        if booking.ticket:
-            booking.ticket.sold = max(0, booking.ticket.sold - booking.quantity)
-            booking.ticket.save()
+        # Rollback ticket sold count before hard delete, unless already returned
+        if booking.ticket_id and booking.status in SEAT_HOLDING_STATUSES:
+            TicketInventoryService.release(booking.ticket, booking.quantity)
         booking.delete()  # Hard delete
         return True
 
     @staticmethod
     def get_paginated_bookings(params: Dict[str, Any]):
-        page = int(params.get('page', 1))
-        limit = int(params.get('limit', 100))
-        sort_by = params.get('sort_by', 'id')
-        sort_order = params.get('sort_order', 'asc')
         search = params.get('search')
         filters = params.get('filters') or {}
 
@@ -148,16 +259,4 @@ class BookingService:
         if 'ticket_id' in filters:
             qs = qs.filter(ticket_id=filters['ticket_id'])
 
-        order_prefix = '' if sort_order == 'asc' else '-'
-        qs = qs.order_by(f"{order_prefix}{sort_by}")
-
-        total = qs.count()
-        offset = (page - 1) * limit
-        items = list(qs[offset: offset + limit])
-
-        return {
-            'items': items,
-            'total': total,
-            'page': page,
-            'limit': limit
-        }
\ No newline at end of file
+        return paginate_queryset(qs, params, default_limit=100)
\ No newline at end of file
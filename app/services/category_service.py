@@ -1,10 +1,11 @@
 from typing import List, Optional
 from django.core.exceptions import ObjectDoesNotExist
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 from django.db.models import Q
 from django.utils import timezone
 from app.models.category import Category
 from app.dto.responses.category_response import CategoryResponse # Fixed import
+from app.services.event_service import EventService
+from app.utils.pagination import paginate_queryset, page_response
 
 class CategoryService:
     @staticmethod
@@ -33,6 +34,7 @@ class CategoryService:
             category.category_name = request_data.get('category_name', category.category_name)
             category.description = request_data.get('description', category.description)
             category.save()
+            EventService.invalidate_catalogue()
             return category
         except ObjectDoesNotExist:
             return None
@@ -44,6 +46,7 @@ class CategoryService:
             category.is_deleted = True
             category.deleted_at = timezone.now()
             category.save()
+            EventService.invalidate_catalogue()
             return True
         except ObjectDoesNotExist:
             return False
@@ -57,16 +60,13 @@ class CategoryService:
         try:
             category = Category.objects.get(id=id)
             category.delete()  # Hard delete
+            EventService.invalidate_catalogue()
             return True
         except ObjectDoesNotExist:
             return False
 
     @staticmethod
     def get_paginated_categories(validated_data: dict) -> dict:
-        page = validated_data.get('page', 1)
-        limit = validated_data.get('limit', 100)
-        sort_by = validated_data.get('sort_by', 'id')
-        sort_order = validated_data.get('sort_order', 'asc')
         search = validated_data.get('search', None)
         filters = validated_data.get('filters', {})
 
@@ -81,23 +81,8 @@ class CategoryService:
                 Q(description__icontains=search)
             )
 
-        if sort_order.lower() == 'desc':
-            sort_by = f'-{sort_by}'
-        queryset = queryset.order_by(sort_by)
+        page = paginate_queryset(queryset, validated_data, default_limit=100)
 
-        paginator = Paginator(queryset, limit)
-        try:
-            paginated_categories = paginator.page(page)
-        except PageNotAnInteger:
-            paginated_categories = paginator.page(1)
-        except EmptyPage:
-            paginated_categories = paginator.page(paginator.num_pages)
-
-        categories_data = CategoryResponse(paginated_categories.object_list, many=True).data # Changed to use CategoryResponse serializer
+        categories_data = CategoryResponse(page['items'], many=True).data # Changed to use CategoryResponse serializer
 
-        return {
-            'data': categories_data,
-            'total': paginator.count,
-            'page': paginated_categories.number,
-            'limit': limit,
-        }
+        return page_response(page, categories_data)
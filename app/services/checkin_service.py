@@ -1,12 +1,30 @@
 from typing import List, Optional
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
+from django.db import transaction
 from django.db.models import Q
 from django.utils import timezone
 from app.models.checkin import Checkin
 from app.models.booking import Booking
 from app.models.event_ticket import EventTicket
 from app.dto.responses.checkin_response import CheckinResponse
+from app.utils.filters import FilterSchema, EQUALITY, RANGE, PREFIX
+from app.utils.gate_index import find_ticket, get_gate_index, load_gate_index, record_ticket_status, unload_gate_index
+from app.utils.pagination import paginate_queryset, page_response
+from app.utils.scan_info import ScanInfoCache
+from app.utils.ticket_codes import is_signed_format, verify_ticket_code
+
+CHECKIN_FILTERS = FilterSchema(
+    Checkin,
+    fields={
+        'id': EQUALITY,
+        'booking_id': EQUALITY,
+        'ticket_code': PREFIX,
+        'checkin_time': RANGE,
+    },
+    aliases={'booking': 'booking_id', 'booking__id': 'booking_id'},
+    sortable=('checkin_time',),
+)
 
 
 class CheckinService:
@@ -32,13 +50,24 @@ class CheckinService:
         """
         Validates an event ticket by its code.
         Returns the details necessary for the check-in UI and logs invalid attempts if necessary.
+        Tickets of events with a gate index are answered from memory.
         """
+        entry = find_ticket(ticket_code)
+        if entry is not None:
+            return {
+                "ticket_code": ticket_code,
+                "customer_name": entry['customer_name'],
+                "event_name": entry['event_name'],
+                "ticket_type": entry['ticket_type'],
+                "booking_id": entry['booking_id'],
+                "status": {'UNUSED': 'VALID', 'USED': 'ALREADY_USED'}.get(entry['status'], 'INVALID')
+            }
         try:
             ticket = EventTicket.objects.select_related('booking__customer', 'booking__event', 'booking__ticket').get(ticket_code=ticket_code)
             booking = ticket.booking
             customer_name = f"{booking.customer.first_name} {booking.customer.last_name}" if booking and booking.customer else "Unknown"
             event_name = booking.event.event_name if booking and booking.event else "Unknown"
-            ticket_type = booking.ticket.ticket_name if booking and booking.ticket else "-"
+            ticket_type = booking.ticket.ticket_type if booking and booking.ticket else "-"
             booking_id_val = booking.id if booking else None
             
             status = 'VALID' if ticket.status == 'UNUSED' else 'ALREADY_USED'
@@ -65,26 +94,116 @@ class CheckinService:
     def confirm_checkin(ticket_code: str) -> dict:
         """
         Confirms a check-in by updating the event ticket status and logging the attempt.
+        Exactly one of any number of concurrent confirmations of a ticket succeeds (see _admit).
+        Tickets a gate index already knows as used are turned away without the update.
         """
-        try:
-            ticket = EventTicket.objects.get(ticket_code=ticket_code)
-            
-            if ticket.status == 'USED':
-                Checkin.objects.create(ticket_code=ticket_code, booking=ticket.booking, status='ALREADY_USED')
-                return {"success": False, "message": "Ticket is already used."}
-            
-            # Update ticket status
-            ticket.status = 'USED'
-            ticket.save()
-            
-            # Log successful check-in
-            Checkin.objects.create(ticket_code=ticket_code, booking=ticket.booking, status='SUCCESS')
-            
+        entry = find_ticket(ticket_code)
+        if entry is not None and entry['status'] == 'USED':
+            Checkin.objects.create(ticket_code=ticket_code, booking_id=entry['booking_id'], status='ALREADY_USED')
+            return {"success": False, "message": "Ticket is already used."}
+
+        status = CheckinService._admit(ticket_code, entry['booking_id'] if entry else None)
+        if status == 'CHECKED_IN':
             return {"success": True, "message": "Check-in successful."}
-        except ObjectDoesNotExist:
-            # Log invalid check-in attempt
-            Checkin.objects.create(ticket_code=ticket_code, booking=None, status='INVALID')
-            return {"success": False, "message": "Invalid ticket code."}
+        if status == 'ALREADY_USED':
+            return {"success": False, "message": "Ticket is already used."}
+        # Log invalid check-in attempt
+        Checkin.objects.create(ticket_code=ticket_code, booking=None, status='INVALID')
+        return {"success": False, "message": "Invalid ticket code."}
+
+    @staticmethod
+    def _admit(ticket_code: str, booking_id: Optional[int] = None) -> str:
+        """
+        Flips an issued ticket from UNUSED to USED with one conditional
+        UPDATE ... WHERE status = 'UNUSED' and logs the attempt in the same transaction.
+        The database serialises concurrent updates of the row, so only one scan sees
+        it change. Returns CHECKED_IN, ALREADY_USED or INVALID (not issued or revoked).
+        The new status is written through to the gate indexes once committed.
+        """
+        with transaction.atomic():
+            tickets = EventTicket.objects.filter(ticket_code=ticket_code, is_deleted=False)
+            if tickets.filter(status='UNUSED').update(status='USED', updated_at=timezone.now()):
+                if booking_id is None:
+                    booking_id = tickets.values_list('booking_id', flat=True).first()
+                Checkin.objects.create(ticket_code=ticket_code, booking_id=booking_id, status='SUCCESS')
+                transaction.on_commit(lambda: record_ticket_status(ticket_code, 'USED'))
+                return 'CHECKED_IN'
+
+            used_booking_id = tickets.filter(status='USED').values_list('booking_id', flat=True).first()
+            if used_booking_id is not None:
+                Checkin.objects.create(ticket_code=ticket_code, booking_id=used_booking_id, status='ALREADY_USED')
+                transaction.on_commit(lambda: record_ticket_status(ticket_code, 'USED'))
+                return 'ALREADY_USED'
+        return 'INVALID'
+
+    @staticmethod
+    def scan_ticket(ticket_code: str, event_id: Optional[int] = None) -> dict:
+        """
+        Validates a ticket code at the gate and checks it in.
+        Signed codes are verified in memory, so forged or malformed codes and codes
+        for another event than `event_id` are rejected without touching the database
+        (unsigned codes are checked against `event_id` with one query).
+        Event details come from ScanInfoCache; the only queries are the check-in itself.
+        Unsigned codes issued before signing go through validate_ticket first, unless
+        TICKET_ACCEPT_UNSIGNED_CODES is off.
+        """
+        result = {
+            "ticket_code": ticket_code,
+            "event_name": "Unknown",
+            "ticket_type": "-",
+            "booking_id": None,
+            "status": "INVALID"
+        }
+        claims = verify_ticket_code(ticket_code)
+        if claims is None:
+            if is_signed_format(ticket_code) or not getattr(settings, 'TICKET_ACCEPT_UNSIGNED_CODES', True):
+                return result
+            if event_id is not None:
+                # An unsigned code does not name its event; look it up before admitting
+                ticket_event_id = EventTicket.objects.filter(
+                    ticket_code=ticket_code, is_deleted=False,
+                ).values_list('booking__event_id', flat=True).first()
+                if ticket_event_id is None:
+                    return result
+                if ticket_event_id != event_id:
+                    result['status'] = 'WRONG_EVENT'
+                    return result
+            details = CheckinService.validate_ticket(ticket_code)
+            if details['status'] == 'VALID':
+                details['status'] = CheckinService._admit(ticket_code, details['booking_id'])
+            return details
+
+        if event_id is not None and claims.event_id != event_id:
+            result['status'] = 'WRONG_EVENT'
+            return result
+        info = ScanInfoCache.get(claims.event_id, claims.ticket_id)
+        if info is None:
+            return result
+
+        result.update(
+            event_name=info['event_name'],
+            ticket_type=info['ticket_type'],
+            booking_id=claims.booking_id,
+            status=CheckinService._admit(ticket_code, claims.booking_id),
+        )
+        return result
+
+    @staticmethod
+    def load_gate_index(event_id: int) -> dict:
+        """
+        Preloads an event's tickets into the in-memory gate index of this worker and
+        registers it for the others (see app.utils.gate_index). Returns its stats.
+        """
+        return load_gate_index(event_id).stats()
+
+    @staticmethod
+    def get_gate_index_stats(event_id: int) -> Optional[dict]:
+        index = get_gate_index(event_id)
+        return index.stats() if index is not None else None
+
+    @staticmethod
+    def unload_gate_index(event_id: int) -> bool:
+        return unload_gate_index(event_id)
 
     @staticmethod
     def get_checkin_by_id(checkin_id: int) -> Optional[Checkin]:
@@ -154,17 +273,10 @@ class CheckinService:
         """
         Retrieves a paginated list of check-ins with optional filtering and searching.
         """
-        page = validated_data.get('page', 1)
-        limit = validated_data.get('limit', 10)
-        sort_by = validated_data.get('sort_by', 'id')
-        sort_order = validated_data.get('sort_order', 'asc')
         search = validated_data.get('search', None)
-        filters = validated_data.get('filters', {})
 
         queryset = Checkin.objects.select_related('booking').filter(is_deleted=False)
-
-        if filters:
-            queryset = queryset.filter(**filters)
+        queryset, plan = CHECKIN_FILTERS.apply(queryset, validated_data)
 
         if search:
             queryset = queryset.filter(
@@ -173,23 +285,8 @@ class CheckinService:
                 Q(booking__id__icontains=search)
             )
 
-        if sort_order.lower() == 'desc':
-            sort_by = f'-{sort_by}'
-        queryset = queryset.order_by(sort_by)
+        page = paginate_queryset(queryset, validated_data, default_limit=10, plan=plan)
 
-        paginator = Paginator(queryset, limit)
-        try:
-            paginated_checkins = paginator.page(page)
-        except PageNotAnInteger:
-            paginated_checkins = paginator.page(1)
-        except EmptyPage:
-            paginated_checkins = paginator.page(paginator.num_pages)
-
-        checkins_data = CheckinResponse(paginated_checkins.object_list, many=True).data
-
-        return {
-            'data': checkins_data,
-            'total': paginator.count,
-            'page': paginated_checkins.number,
-            'limit': limit,
-        }
+        checkins_data = CheckinResponse(page['items'], many=True).data
+
+        return page_response(page, checkins_data)
@@ -1,10 +1,11 @@
 from typing import List, Optional
 from django.core.exceptions import ObjectDoesNotExist
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 from django.db.models import Q
 from django.utils import timezone
 from app.models.customer import Customer
 from app.dto.responses.customer_response import CustomerResponse
+from app.utils.principal import PrincipalCache
+from app.utils.pagination import paginate_queryset, page_response
 
 
 class CustomerService:
@@ -42,6 +43,7 @@ class CustomerService:
             customer.picture = request_data.get('picture', customer.picture)
             customer.status = request_data.get('status', customer.status)
             customer.save()
+            PrincipalCache.evict_customer(customer.id)
             return CustomerResponse(customer).data
         except ObjectDoesNotExist:
             return None
@@ -53,16 +55,13 @@ class CustomerService:
             customer.is_deleted = True
             customer.deleted_at = timezone.now()
             customer.save()
+            PrincipalCache.evict_customer(customer.id)
             return True
         except ObjectDoesNotExist:
             return False
 
     @staticmethod
     def get_paginated_customers(validated_data: dict) -> dict:
-        page = validated_data.get('page', 1)
-        limit = validated_data.get('limit', 100)
-        sort_by = validated_data.get('sort_by', 'id')
-        sort_order = validated_data.get('sort_order', 'asc')
         search = validated_data.get('search', None)
 
         queryset = Customer.objects.filter(is_deleted=False)
@@ -74,23 +73,8 @@ class CustomerService:
                 Q(email__icontains=search)
             )
 
-        if sort_order.lower() == 'desc':
-            sort_by = f'-{sort_by}'
-        queryset = queryset.order_by(sort_by)
+        page = paginate_queryset(queryset, validated_data, default_limit=100)
 
-        paginator = Paginator(queryset, limit)
-        try:
-            paginated = paginator.page(page)
-        except PageNotAnInteger:
-            paginated = paginator.page(1)
-        except EmptyPage:
-            paginated = paginator.page(paginator.num_pages)
-
-        data = [CustomerResponse(c).data for c in paginated.object_list]
+        data = [CustomerResponse(c).data for c in page['items']]
 
-        return {
-            'data': data,
-            'total': paginator.count,
-            'page': paginated.number,
-            'limit': limit,
-        }
+        return page_response(page, data)
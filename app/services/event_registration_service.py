@@ -5,6 +5,7 @@ from django.utils import timezone
 from app.models.event_registration import EventRegistration
 from app.models.user import User
 from app.models.event import Event
+from app.utils.pagination import paginate_queryset
 
 
 class EventRegistrationService:
@@ -89,10 +90,6 @@ class EventRegistrationService:
 
     @staticmethod
     def get_paginated_event_registrations(params: Dict[str, Any]):
-        page = int(params.get('page', 1))
-        limit = int(params.get('limit', 100))
-        sort_by = params.get('sort_by', 'id')
-        sort_order = params.get('sort_order', 'asc')
         search = params.get('search')
         filters = params.get('filters') or {}
 
@@ -108,16 +105,4 @@ class EventRegistrationService:
         if 'event_id' in filters:
             qs = qs.filter(event_id=filters['event_id'])
 
-        order_prefix = '' if sort_order == 'asc' else '-'
-        qs = qs.order_by(f"{order_prefix}{sort_by}")
-
-        total = qs.count()
-        offset = (page - 1) * limit
-        items = list(qs[offset: offset + limit])
-
-        return {
-            'items': items,
-            'total': total,
-            'page': page,
-            'limit': limit
-        }
\ No newline at end of file
+        return paginate_queryset(qs, params, default_limit=100)
\ No newline at end of file
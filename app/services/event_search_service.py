@@ -0,0 +1,139 @@
+import re
+from collections import Counter
+from typing import Iterable
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q, Sum
+from django.db.models.expressions import RawSQL
+
+from app.models.event import Event
+from app.models.event_search_term import EventSearchTerm
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+MIN_TOKEN_LENGTH = 2
+MAX_TERM_LENGTH = 64
+MAX_QUERY_TOKENS = 8
+
+# Relevance weight per event column for the inverted index
+FIELD_WEIGHTS = {
+    'event_name': 3,
+    'organizer': 2,
+    'location': 2,
+    'description': 1,
+}
+
+FULLTEXT_MATCH = (
+    "MATCH(events.event_name, events.description, events.location, events.organizer) "
+    "AGAINST (%s IN BOOLEAN MODE)"
+)
+
+
+class EventSearchService:
+    """
+    Ranked, prefix-matching event search.
+    Uses MySQL FULLTEXT when available and otherwise the event_search_terms inverted
+    index, which EventService keeps up to date on every event write.
+    """
+
+    @staticmethod
+    def tokenize(text: str) -> list:
+        """Lowercase word tokens, skipping very short ones."""
+        if not text:
+            return []
+        return [
+            token[:MAX_TERM_LENGTH]
+            for token in TOKEN_RE.findall(text.lower())
+            if len(token) >= MIN_TOKEN_LENGTH
+        ]
+
+    @staticmethod
+    def get_backend() -> str:
+        """
+        Resolves EVENT_SEARCH_BACKEND: 'fulltext', 'index', 'icontains' or 'auto'
+        (FULLTEXT on MySQL, the inverted index elsewhere).
+        """
+        backend = getattr(settings, 'EVENT_SEARCH_BACKEND', 'auto')
+        if backend == 'auto':
+            return 'fulltext' if connection.vendor == 'mysql' else 'index'
+        return backend
+
+    @staticmethod
+    def build_terms(event: Event) -> Counter:
+        """Returns {term: weight} for an event, summing weights across columns."""
+        weights = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            for token in EventSearchService.tokenize(getattr(event, field, '')):
+                weights[token] += weight
+        return weights
+
+    @staticmethod
+    @transaction.atomic
+    def index_event(event: Event) -> None:
+        """Replaces the inverted-index rows for one event."""
+        EventSearchTerm.objects.filter(event_id=event.id).delete()
+        if event.is_deleted:
+            return
+        EventSearchTerm.objects.bulk_create([
+            EventSearchTerm(event_id=event.id, term=term, weight=min(weight, 32767))
+            for term, weight in EventSearchService.build_terms(event).items()
+        ])
+
+    @staticmethod
+    def remove_event(event_id: int) -> None:
+        EventSearchTerm.objects.filter(event_id=event_id).delete()
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild_index(events: Iterable[Event] = None, batch_size: int = 1000) -> int:
+        """Rebuilds the inverted index for the given (default: all active) events."""
+        if events is None:
+            EventSearchTerm.objects.all().delete()
+            events = Event.objects.filter(is_deleted=False).only(*FIELD_WEIGHTS.keys(), 'is_deleted').iterator()
+
+        count = 0
+        rows = []
+        for event in events:
+            rows.extend(
+                EventSearchTerm(event_id=event.id, term=term, weight=min(weight, 32767))
+                for term, weight in EventSearchService.build_terms(event).items()
+            )
+            count += 1
+            if len(rows) >= batch_size:
+                EventSearchTerm.objects.bulk_create(rows, batch_size=batch_size)
+                rows = []
+        if rows:
+            EventSearchTerm.objects.bulk_create(rows, batch_size=batch_size)
+        return count
+
+    @staticmethod
+    def search(queryset, search: str, backend: str = None):
+        """
+        Filters an Event queryset to matches for `search`, annotated with `search_rank`.
+        Every query token is treated as a prefix; events matching more/heavier terms rank higher.
+        """
+        backend = backend or EventSearchService.get_backend()
+        tokens = list(dict.fromkeys(EventSearchService.tokenize(search)))[:MAX_QUERY_TOKENS]
+
+        if backend == 'icontains':
+            return queryset.filter(
+                Q(event_name__icontains=search) |
+                Q(description__icontains=search) |
+                Q(location__icontains=search) |
+                Q(organizer__icontains=search)
+            )
+
+        if not tokens:
+            return queryset.none()
+
+        if backend == 'fulltext':
+            boolean_query = ' '.join(f'{token}*' for token in tokens)
+            return queryset.annotate(
+                search_rank=RawSQL(FULLTEXT_MATCH, [boolean_query])
+            ).filter(search_rank__gt=0)
+
+        # Inverted index: one range scan on (term, event_id) per token, ranked by summed weight
+        prefix_query = Q()
+        for token in tokens:
+            prefix_query |= Q(search_terms__term__startswith=token)
+        return queryset.filter(prefix_query).annotate(search_rank=Sum('search_terms__weight'))
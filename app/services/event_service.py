@@ -1,13 +1,38 @@
+import hashlib
+import json
 from typing import List, Optional
+from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
-from django.db.models import Q
 from django.utils import timezone
 from app.models.event import Event
 from app.models.category import Category
 from app.models.venue import Venue
 from app.dto.responses.event_response import EventResponse
+from app.services.event_search_service import EventSearchService
+from app.services.waiting_room_service import WaitingRoomService
 from app.utils.helper import Helper
+from app.utils.cache_version import get_version, bump_version
+from app.utils.filters import FilterSchema, EQUALITY, RANGE, PREFIX
+from app.utils.pagination import paginate_queryset, page_response
+
+CATALOGUE_NAMESPACE = 'event_catalogue'
+CATALOGUE_KEY = 'event_catalogue:v{version}'
+
+EVENT_FILTERS = FilterSchema(
+    Event,
+    fields={
+        'id': EQUALITY,
+        'category_id': EQUALITY,
+        'venue_id': EQUALITY,
+        'status': EQUALITY,
+        'event_date': RANGE,
+        'created_at': RANGE,
+        'event_name': PREFIX,
+    },
+    aliases={'category': 'category_id', 'category__id': 'category_id', 'venue': 'venue_id', 'venue__id': 'venue_id'},
+    sortable=('event_name', 'event_date', 'status', 'created_at'),
+)
 
 class EventService:
     """
@@ -63,6 +88,8 @@ class EventService:
             image=image_path,
             **request_data
         )
+        EventSearchService.index_event(event)
+        EventService.invalidate_catalogue()
         return event
 
     @staticmethod
@@ -71,7 +98,7 @@ class EventService:
         Retrieves a single event by its ID. Excludes soft-deleted events.
         """
         try:
-            return Event.objects.get(id=event_id, is_deleted=False)
+            return Event.objects.select_related('category', 'venue').get(id=event_id, is_deleted=False)
         except ObjectDoesNotExist:
             return None
 
@@ -80,7 +107,34 @@ class EventService:
         """
         Retrieves all active events.
         """
-        return Event.objects.filter(is_deleted=False)
+        return Event.objects.select_related('category', 'venue').filter(is_deleted=False)
+
+    @staticmethod
+    def get_event_catalogue() -> dict:
+        """
+        Returns the rendered public event listing and its ETag.
+        The payload is rendered once per catalogue version and served from the cache
+        until an event, category or venue write invalidates it.
+        """
+        version = get_version(CATALOGUE_NAMESPACE)
+        key = CATALOGUE_KEY.format(version=version)
+        catalogue = cache.get(key)
+        if catalogue is None:
+            data = EventResponse(EventService.get_all_events(), many=True).data
+            body = json.dumps(data, default=str)
+            catalogue = {
+                'data': json.loads(body),
+                'etag': f'"{hashlib.md5(body.encode("utf-8")).hexdigest()}"',
+            }
+            cache.set(key, catalogue, timeout=getattr(settings, 'EVENT_CATALOGUE_CACHE_TTL', 300))
+        return catalogue
+
+    @staticmethod
+    def invalidate_catalogue() -> None:
+        """
+        Drops the cached public event listing. Called on event, category and venue writes.
+        """
+        bump_version(CATALOGUE_NAMESPACE)
 
     @staticmethod
     def update_event(event_id: int, request_data: dict) -> Optional[Event]:
@@ -124,6 +178,9 @@ class EventService:
                 setattr(event, key, value)
 
             event.save()
+            EventSearchService.index_event(event)
+            EventService.invalidate_catalogue()
+            WaitingRoomService.invalidate_rate(event.id)
             return event
         except ObjectDoesNotExist:
             return None
@@ -139,6 +196,9 @@ class EventService:
             event.deleted_by = user
             event.deleted_at = timezone.now()
             event.save()
+            EventSearchService.remove_event(event.id)
+            EventService.invalidate_catalogue()
+            WaitingRoomService.invalidate_rate(event.id)
             return True
         except ObjectDoesNotExist:
             return False
@@ -152,6 +212,8 @@ class EventService:
         try:
             event = Event.objects.get(id=event_id)
             event.delete()  # Hard delete
+            EventService.invalidate_catalogue()
+            WaitingRoomService.invalidate_rate(event_id)
             return True
         except ObjectDoesNotExist:
             return False
@@ -161,43 +223,20 @@ class EventService:
         """
         Retrieves a paginated list of events with optional filtering and searching.
         """
-        page = validated_data.get('page', 1)
-        limit = validated_data.get('limit', 10)
-        sort_by = validated_data.get('sort_by', 'id')
-        sort_order = validated_data.get('sort_order', 'asc')
         search = validated_data.get('search', None)
-        filters = validated_data.get('filters', {})
-
-        queryset = Event.objects.filter(is_deleted=False)
+        queryset = Event.objects.select_related('category', 'venue').filter(is_deleted=False)
 
-        if filters:
-            queryset = queryset.filter(**filters)
+        queryset, plan = EVENT_FILTERS.apply(queryset, validated_data)
 
+        leading_ordering = ()
         if search:
-            queryset = queryset.filter(
-                Q(event_name__icontains=search) |
-                Q(description__icontains=search) |
-                Q(location__icontains=search) |
-                Q(organizer__icontains=search)
-            )
-
-        if sort_order.lower() == 'desc':
-            sort_by = f'-{sort_by}'
-        queryset = queryset.order_by(sort_by)
-
-        paginator = Paginator(queryset, limit)
-        try:
-            paginated_events = paginator.page(page)
-        except PageNotAnInteger:
-            paginated_events = paginator.page(1)
-        except EmptyPage:
-            paginated_events = paginator.page(paginator.num_pages)
-
-        events_data = EventResponse(paginated_events.object_list, many=True).data
-
-        return {
-            'data': events_data,
-            'total': paginator.count,
-            'page': paginated_events.number,
-            'limit': limit,
-        }
+            queryset = EventSearchService.search(queryset, search)
+            # Best matches first; the requested sort breaks ties (offset mode only)
+            if 'search_rank' in queryset.query.annotations:
+                leading_ordering = ('-search_rank',)
+
+        page = paginate_queryset(queryset, validated_data, default_limit=10, leading_ordering=leading_ordering, plan=plan)
+
+        events_data = EventResponse(page['items'], many=True).data
+
+        return page_response(page, events_data)
@@ -1,14 +1,14 @@
 from typing import Dict, Any
+from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
 from django.utils import timezone
 from app.models.event_ticket import EventTicket
 from app.models.booking import Booking
+from app.utils.gate_index import record_ticket_status
+from app.utils.pagination import paginate_queryset
+from app.utils.ticket_codes import sign_ticket_code
+from app.utils.ticket_qr import ticket_qr_png, warm_ticket_qrs
 from django.db.models import Q
-import uuid
-import datetime
-import qrcode
-import io
-import base64
 
 
 class EventTicketService:
@@ -48,35 +48,78 @@ class EventTicketService:
 
         ticket_code = validated_data.get('ticket_code')
         if not ticket_code:
-            # Generate a unique ticket code if missing
-            ticket_code = f"TKT-{datetime.datetime.utcnow().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:6].upper()}"
-
-        qr_code = validated_data.get('qr_code', None)
-        if not qr_code:
-            # Generate QR code for the ticket_code
-            qr = qrcode.QRCode(
-                version=1,
-                error_correction=qrcode.constants.ERROR_CORRECT_L,
-                box_size=10,
-                border=4,
-            )
-            qr.add_data(ticket_code)
-            qr.make(fit=True)
-
-            img = qr.make_image(fill_color="black", back_color="white")
-            buffered = io.BytesIO()
-            img.save(buffered, format="PNG")
-            qr_base64 = base64.b64encode(buffered.getvalue()).decode()
-            qr_code = f"data:image/png;base64,{qr_base64}"
+            # Generate a signed ticket code if missing (see app.utils.ticket_codes)
+            ticket_code = sign_ticket_code(booking.event_id, booking.ticket_id, booking.id)
 
+        # The QR image is rendered on demand from ticket_code (see get_ticket_qr_png)
         event_ticket = EventTicket.objects.create(
             ticket_code=ticket_code,
             booking=booking,
-            qr_code=qr_code,
             status=validated_data.get('status', 'UNUSED')
         )
         return event_ticket
 
+    @staticmethod
+    def _bulk_ticket_codes(booking: Booking, count: int) -> list:
+        # Codes of one booking differ only in their random serial
+        codes = set()
+        while len(codes) < count:
+            codes.add(sign_ticket_code(booking.event_id, booking.ticket_id, booking.id))
+        return list(codes)
+
+    @staticmethod
+    def issue_tickets_for_booking(booking_id: int, workers: int = None) -> Dict[str, Any]:
+        """
+        Issues the missing EventTickets of a confirmed booking (one per seat, each with
+        a signed code) in bulk.
+        The rows are inserted with one bulk_create under a lock on the booking, so
+        concurrent calls never issue more than booking.quantity tickets. After the
+        commit their QR images are pre-rendered into the render cache by a process
+        pool. Returns the booking, how many tickets were already issued and the new
+        tickets (id, ticket_code, status).
+        """
+        booking = Booking.objects.filter(pk=booking_id).first()
+        if booking is None:
+            raise ObjectDoesNotExist(f"Booking with id {booking_id} does not exist.")
+        if booking.status != 'confirmed':
+            raise ValueError('Tickets can only be issued for confirmed bookings.')
+
+        issued = EventTicket.objects.filter(booking_id=booking.id, is_deleted=False).count()
+        missing = max(booking.quantity - issued, 0)
+        if not missing:
+            return {'booking': booking, 'already_issued': issued, 'tickets': []}
+
+        codes = EventTicketService._bulk_ticket_codes(booking, missing)
+
+        with transaction.atomic():
+            # Re-read under the lock: the booking may have been cancelled or resized,
+            # and another call may have issued tickets, since the checks above
+            booking = Booking.objects.select_for_update().get(pk=booking.id)
+            if booking.status != 'confirmed':
+                raise ValueError('Tickets can only be issued for confirmed bookings.')
+            issued = EventTicket.objects.filter(booking_id=booking.id, is_deleted=False).count()
+            missing = max(booking.quantity - issued, 0)
+            codes = codes[:missing]
+            EventTicket.objects.bulk_create([
+                EventTicket(booking_id=booking.id, ticket_code=code, status='UNUSED') for code in codes
+            ], batch_size=500)
+        warm_ticket_qrs(codes, workers=workers)
+
+        # bulk_create does not return ids on MySQL; one query fetches them all
+        tickets = list(
+            EventTicket.objects.filter(ticket_code__in=codes).values('id', 'ticket_code', 'status')
+        )
+        return {'booking': booking, 'already_issued': issued, 'tickets': tickets}
+
+    @staticmethod
+    def get_ticket_code(pk: int):
+        """Returns the ticket_code of an active event ticket, or None."""
+        return EventTicket.objects.filter(pk=pk, is_deleted=False).values_list('ticket_code', flat=True).first()
+
+    @staticmethod
+    def get_ticket_qr_png(ticket_code: str) -> bytes:
+        return ticket_qr_png(ticket_code)
+
     @staticmethod
     @transaction.atomic
     def update_event_ticket(pk: int, validated_data: Dict[str, Any]):
@@ -88,14 +131,18 @@ class EventTicketService:
         # Resolve and set fields if present in validated_data
         if 'booking' in validated_data:
             event_ticket.booking = EventTicketService._resolve_fk(validated_data.get('booking'), Booking)
+        old_code = event_ticket.ticket_code
         if 'ticket_code' in validated_data:
             event_ticket.ticket_code = validated_data.get('ticket_code')
-        if 'qr_code' in validated_data:
-            event_ticket.qr_code = validated_data.get('qr_code')
         if 'status' in validated_data:
             event_ticket.status = validated_data.get('status')
 
         event_ticket.save()
+        # Keep gate indexes in step; a replaced code stops admitting
+        if event_ticket.ticket_code != old_code:
+            transaction.on_commit(lambda: record_ticket_status(old_code, 'REVOKED'))
+        elif 'status' in validated_data:
+            transaction.on_commit(lambda: record_ticket_status(event_ticket.ticket_code, event_ticket.status))
         return event_ticket
 
     @staticmethod
@@ -108,6 +155,7 @@ class EventTicketService:
         event_ticket.is_deleted = True
         event_ticket.deleted_at = timezone.now()
         event_ticket.save()
+        transaction.on_commit(lambda: record_ticket_status(event_ticket.ticket_code, 'REVOKED'))
         return True
 
     @staticmethod
@@ -119,17 +167,15 @@ class EventTicketService:
         event_ticket = EventTicketService.get_event_ticket_by_id(pk)
         if not event_ticket:
             return False
+        ticket_code = event_ticket.ticket_code
         event_ticket.delete()  # Hard delete
+        transaction.on_commit(lambda: record_ticket_status(ticket_code, 'REVOKED'))
         return True
 
     @staticmethod
     def get_paginated_event_tickets(params: Dict[str, Any]):
-        """Return a dict with keys: items (list of EventTicket instances), total, page, limit.
+        """Return a dict with keys: items (list of EventTicket instances), total, page, limit, mode, next_cursor.
         """
-        page = int(params.get('page', 1))
-        limit = int(params.get('limit', 100))
-        sort_by = params.get('sort_by', 'id')
-        sort_order = params.get('sort_order', 'asc')
         search = params.get('search')
         filters = params.get('filters') or {}
 
@@ -149,17 +195,4 @@ class EventTicketService:
         if 'status' in filters:
             qs = qs.filter(status=filters['status'])
 
-        # Ordering
-        order_prefix = '' if sort_order == 'asc' else '-'
-        qs = qs.order_by(f"{order_prefix}{sort_by}")
-
-        total = qs.count()
-        offset = (page - 1) * limit
-        items = list(qs[offset: offset + limit])
-
-        return {
-            'items': items,
-            'total': total,
-            'page': page,
-            'limit': limit
-        }
+        return paginate_queryset(qs, params, default_limit=100)
@@ -1,30 +1,46 @@
-from google.oauth2 import id_token
-from google.auth.transport import requests as google_requests
+from google.auth import jwt as google_jwt
 from django.conf import settings
 from rest_framework.exceptions import AuthenticationFailed
 
+from app.utils.google_certs import get_cert_source
+
+
 class GoogleOAuthService:
+    @staticmethod
+    def _decode(token: str, audience: list, force_refresh: bool = False) -> dict:
+        certs = get_cert_source().get_certs(force_refresh=force_refresh)
+        return google_jwt.decode(
+            token,
+            certs=certs,
+            audience=audience,
+            clock_skew_in_seconds=10
+        )
+
     @staticmethod
     def verify_google_token(token: str) -> dict:
         """
         Verifies the Google ID token and returns user information.
+        Signing certificates come from the process-wide cert source, so only the
+        first login after Google's max-age expires pays the fetch.
         """
         try:
             # Specify the CLIENT_ID of the app that accesses the backend:
             # We allow both your ID and the Google Playground ID for easier testing
-            idinfo = id_token.verify_oauth2_token(
-                token, 
-                google_requests.Request(), 
-                audience=[
-                    settings.GOOGLE_CLIENT_ID,
-                    '407408718192.apps.googleusercontent.com' # Google Playground default
-                ],
-                clock_skew_in_seconds=10
-            )
+            audience = [
+                settings.GOOGLE_CLIENT_ID,
+                '407408718192.apps.googleusercontent.com' # Google Playground default
+            ]
+            try:
+                idinfo = GoogleOAuthService._decode(token, audience)
+            except ValueError as e:
+                # Google rotated its keys before our cached copy expired
+                if 'Certificate for key id' not in str(e):
+                    raise
+                idinfo = GoogleOAuthService._decode(token, audience, force_refresh=True)
 
             # ID token is valid. Get the user's Google Account ID from the decoded token.
             # userid = idinfo['sub']
-            
+
             # Verify issuer
             if idinfo['iss'] not in ['accounts.google.com', 'https://accounts.google.com']:
                 raise AuthenticationFailed('Wrong issuer.')
@@ -1,26 +1,48 @@
 import os
 import logging
-import requests
 from urllib.parse import quote
 from datetime import timedelta
 from typing import List, Optional
 
 from django.core.exceptions import ObjectDoesNotExist
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
+from django.db import transaction
 from django.db.models import Q
+from django.urls import reverse
 from django.utils import timezone
 
-from django.conf import settings
-import os
-from bakong_khqr import KHQR
-
 from app.models.payment import Payment
 from app.models.booking import Booking
 from app.dto.responses.payment_response import PaymentResponse
+from app.services.bakong_reconcile_service import BakongReconcileService
+from app.services.seat_hold_service import SeatHoldService
+from app.utils.bakong_client import get_bakong_client
+from app.utils.payment_events import get_payment_event_hub
+from app.utils.khqr_images import qr_png
+from app.utils.filters import FilterSchema, EQUALITY, RANGE, NULLABLE
+from app.utils.pagination import paginate_queryset, page_response
 
 logger = logging.getLogger(__name__)
 
 BAKONG_EXPIRY_MINUTES = 5
+# Payment fields baked into the KHQR payload
+KHQR_FIELDS = {
+    'amount', 'currency', 'merchant_name', 'merchant_city', 'store_label',
+    'phone_number', 'bill_number', 'terminal_label',
+}
+
+PAYMENT_FILTERS = FilterSchema(
+    Payment,
+    fields={
+        'id': EQUALITY,
+        'booking_id': EQUALITY,
+        'status': EQUALITY,
+        'md5': EQUALITY,
+        'paid_at': RANGE + NULLABLE,
+        'created_at': RANGE,
+    },
+    aliases={'booking': 'booking_id', 'booking__id': 'booking_id'},
+    sortable=('status', 'paid_at', 'created_at'),
+)
 
 
 class PaymentService:
@@ -29,10 +51,9 @@ class PaymentService:
     """
 
     def __init__(self):
-        self.token = getattr(settings, 'BAKONG_ACCESS_TOKEN', os.getenv('BAKONG_ACCESS_TOKEN'))
-        self.account_username = getattr(settings, 'BAKONG_ACCOUNT_USERNAME', os.getenv('BAKONG_ACCOUNT_USERNAME'))
-        self.bakong_api_url = getattr(settings, 'BAKONG_PROD_BASE_API_URL', 'https://api-bakong.nbc.gov.kh/v1')
-        self.khqr_client = KHQR(bakong_token=self.token)
+        # The Bakong client (pooled session, KHQR instance) is shared by the whole process
+        self.bakong = get_bakong_client()
+        self.account_username = self.bakong.account or os.getenv('BAKONG_ACCOUNT_USERNAME')
 
     # ------------------------------------------------------------------
     # PAYMENT CRUD
@@ -77,20 +98,25 @@ class PaymentService:
 
         try:
             qr_result = self._generate_qr_for_payment(payment, currency)
-            payment.refresh_from_db()
             return {
                 "payment": payment,
-                "qr_image": qr_result.get('qr_image'),
+                "qr_image_url": qr_result['qr_image_url'],
             }
         except Exception as e:
             payment.delete()  # Roll back payment if QR generation fails
             logger.error(f"Failed to generate Bakong QR. Payment rolled back. Error: {str(e)}")
             raise ValueError(f"Failed to generate Bakong payment: {str(e)}")
 
+    @transaction.atomic
     def _create_cash_payment(self, booking: Booking, amount: float, request_data: dict) -> dict:
         """Handles the creation of a completed Cash payment."""
         payment_data = {k: v for k, v in request_data.items() if k not in ['amount', 'status']}
 
+        # Mark booking as confirmed immediately since it's a cash payment; a booking
+        # whose hold expired and whose seats were sold since cannot be paid for
+        if not SeatHoldService.confirm(booking):
+            raise ValueError(f"Booking #{booking.id} can no longer be confirmed: it was cancelled, or its seats were sold after its hold expired.")
+
         payment = Payment.objects.create(
             booking=booking,
             amount=amount,
@@ -101,10 +127,6 @@ class PaymentService:
             **payment_data
         )
 
-        # Mark booking as confirmed immediately since it's a cash payment
-        booking.status = 'confirmed'
-        booking.save(update_fields=['status', 'updated_at'])
-
         return {"payment": payment}
 
     @staticmethod
@@ -129,10 +151,21 @@ class PaymentService:
             if 'booking_id' in request_data:
                 payment.booking = Booking.objects.get(id=request_data.pop('booking_id'))
 
+            old_status = payment.status
+            # A stored KHQR encodes these fields. While it can still be paid it must
+            # stay as it is; once it can't, a pending payment builds a new one on the
+            # next request and other payments keep theirs as a record.
+            clear_qr = bool(KHQR_FIELDS.intersection(request_data)) and payment.status == 'pending'
+            if clear_qr and PaymentService._qr_payable(payment):
+                raise ValueError("The payment's QR code can still be paid; change it after the QR expires.")
             for key, value in request_data.items():
                 setattr(payment, key, value)
+            if clear_qr:
+                payment.qr, payment.md5 = None, None
 
             payment.save()
+            if payment.status != old_status:
+                get_payment_event_hub().publish_on_commit([payment.md5], payment.status.upper())
             return payment
         except Payment.DoesNotExist:
             return None
@@ -150,17 +183,10 @@ class PaymentService:
     @staticmethod
     def get_paginated_payments(validated_data: dict) -> dict:
         """Retrieves a paginated list of payments with optional filtering and searching."""
-        page = validated_data.get('page', 1)
-        limit = validated_data.get('limit', 10)
-        sort_by = validated_data.get('sort_by', 'id')
-        sort_order = validated_data.get('sort_order', 'asc')
         search = validated_data.get('search', None)
-        filters = validated_data.get('filters', {})
 
         queryset = Payment.objects.select_related('booking').filter(is_deleted=False)
-
-        if filters:
-            queryset = queryset.filter(**filters)
+        queryset, plan = PAYMENT_FILTERS.apply(queryset, validated_data)
 
         if search:
             queryset = queryset.filter(
@@ -169,47 +195,64 @@ class PaymentService:
                 Q(booking__customer__email__icontains=search)
             )
 
-        if sort_order.lower() == 'desc':
-            sort_by = f'-{sort_by}'
-        queryset = queryset.order_by(sort_by)
+        page = paginate_queryset(queryset, validated_data, default_limit=10, plan=plan)
 
-        paginator = Paginator(queryset, limit)
-        try:
-            paginated_payments = paginator.page(page)
-        except PageNotAnInteger:
-            paginated_payments = paginator.page(1)
-        except EmptyPage:
-            paginated_payments = paginator.page(paginator.num_pages)
+        payments_data = PaymentResponse(page['items'], many=True).data
 
-        payments_data = PaymentResponse(paginated_payments.object_list, many=True).data
-
-        return {
-            'data': payments_data,
-            'total': paginator.count,
-            'page': paginated_payments.number,
-            'limit': limit,
-        }
+        return page_response(page, payments_data)
 
     # ------------------------------------------------------------------
     # BAKONG QR GENERATION
     # ------------------------------------------------------------------
 
-    def generate_bakong_qr(self, payment_id: int) -> dict:
-        """Re-generates KHQR for an existing payment (e.g. QR expired)."""
+    def generate_bakong_qr(self, payment_id: int, refresh: bool = False) -> dict:
+        """
+        Returns the payment's KHQR; refresh=True builds a new one with a new expiry
+        once the old one can no longer be paid (see _qr_payable). Only pending
+        payments can be refreshed.
+        """
         payment = self.get_payment_by_id(payment_id)
         if not payment:
             raise ObjectDoesNotExist(f"Payment with id {payment_id} does not exist.")
-        return self._generate_qr_for_payment(payment, payment.currency or 'USD')
+        if refresh:
+            if payment.status != 'pending':
+                raise ValueError(f"Only pending payments can get a new QR code; this one is {payment.status}.")
+            if self._qr_payable(payment):
+                raise ValueError("The current QR code can still be paid; refresh it after it expires.")
+        return self._generate_qr_for_payment(payment, payment.currency or 'USD', refresh=refresh)
 
-    def _generate_qr_for_payment(self, payment: Payment, currency: str) -> dict:
+    @staticmethod
+    def _qr_payable(payment: Payment) -> bool:
+        """
+        True while a payment's stored KHQR may still be paid, i.e. while the reconciler
+        still checks its md5. Replacing the md5 then would orphan a payment in flight.
+        """
+        return bool(payment.md5) and BakongReconcileService.local_status(payment)['status'] == 'PENDING'
+
+    @staticmethod
+    def _qr_result(payment: Payment) -> dict:
+        return {
+            "qr_data": payment.qr,
+            "md5": payment.md5,
+            "qr_image_url": reverse('payment-khqr-image', args=[payment.md5]),
+            "payment_id": payment.id,
+        }
+
+    def _generate_qr_for_payment(self, payment: Payment, currency: str, refresh: bool = False) -> dict:
         """
-        Internal helper: generates KHQR payload + MD5 + deep links for a Payment instance.
-        Saves qr, md5, deep_link, deep_link_web back to the payment.
-        """        
+        Internal helper: generates the KHQR payload + MD5 for a Payment instance and
+        saves qr, md5 and a new expire_at back to the pending payment. Both are
+        computed once; later calls return the stored ones unless refresh=True. The
+        PNG is not built here: it is rendered on demand from qr_image_url (see
+        app.utils.khqr_images).
+        """
+        if payment.qr and payment.md5 and not refresh:
+            return self._qr_result(payment)
+
         try:
             amount = float(payment.amount)
 
-            khqr = KHQR(bakong_token=self.token)
+            khqr = self.bakong.khqr
 
             qr_string = khqr.create_qr(
                 bank_account=self.account_username,
@@ -224,98 +267,57 @@ class PaymentService:
             )
             
             md5 = khqr.generate_md5(qr_string)
-            qr_image = khqr.qr_image(qr_string, format='base64_uri')
 
-            # Persist back to payment
-            payment.qr = qr_string
-            payment.md5 = md5
-            # Don't store the large base64 image in database, return it separately
-            payment.save(update_fields=['qr', 'md5'])
-
-            return {
-                "qr_data": qr_string,
-                "md5": md5,
-                "qr_image": qr_image,
-                "payment_id": payment.id,
+            # Persist back to payment. Every new QR gets a new expiry; the conditional
+            # update keeps a payment the reconciler just completed from being rewritten.
+            fields = {
+                'qr': qr_string,
+                'md5': md5,
+                'expire_at': timezone.now() + timedelta(minutes=BAKONG_EXPIRY_MINUTES),
+                'updated_at': timezone.now(),
             }
+            if not Payment.objects.filter(pk=payment.pk, status='pending').update(**fields):
+                raise ValueError(f"Payment {payment.id} is no longer pending.")
+            for field, value in fields.items():
+                setattr(payment, field, value)
+
+            return self._qr_result(payment)
         except Exception as e:
             logger.error(f"Error generating Bakong QR for payment {payment.id}: {str(e)}")
             raise e
 
+    @staticmethod
+    def get_khqr_png(md5: str) -> Optional[bytes]:
+        """PNG of the KHQR with this md5, from the image LRU or rendered from the stored payload."""
+        return qr_png(md5, lambda md5: Payment.objects.filter(md5=md5).values_list('qr', flat=True).first())
+
     # ------------------------------------------------------------------
-    # BAKONG STATUS CHECK  (direct HTTP — matches actual Bakong API)
+    # BAKONG STATUS CHECK  (local — BakongReconcileService talks to Bakong)
     # ------------------------------------------------------------------
 
-    def check_bakong_status(self, md5: str) -> dict:
+    def check_bakong_status(self, md5: str, use_cache: bool = True) -> dict:
         """
-        Checks payment status by calling the Bakong API directly with the md5 hash.
-        Mirrors the Express implementation's checkBakongPayment.
+        Returns the payment status for an md5 hash from local state only.
+        The Bakong API is polled in bulk by BakongReconcileService, which completes
+        payments and caches each hash's status; polls never wait on Bakong.
+
+        COMPLETED → payment (and booking) confirmed
+        PENDING   → not paid yet, or not yet seen by the reconciler
+        FAILED    → payment failed or its QR has expired
 
-        responseCode 0  → COMPLETED
-        responseCode 1  → PENDING
-        anything else   → FAILED
+        Pass use_cache=False after a payment event, when the cached status may be stale.
         """
-        # 1. Find payment by md5
-        try:
-            payment = Payment.objects.select_related('booking').get(md5=md5)
-        except Payment.DoesNotExist:
+        # 1. Most polls are for pending payments: answer those from the cache
+        cached = BakongReconcileService.cached_status(md5) if use_cache else None
+        if cached and cached['status'] == 'PENDING':
+            return dict(cached)
+
+        # 2. Otherwise read the payment row
+        payment = Payment.objects.select_related('booking').filter(md5=md5).first()
+        if payment is None:
             raise ObjectDoesNotExist("Payment not found for the given md5.")
 
-        # 2. Call Bakong API
-        url = f"{self.bakong_api_url}/check_transaction_by_md5"
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
-        }
-        try:
-            response = requests.post(url, json={"md5": md5}, headers=headers, timeout=15)
-        except requests.RequestException as e:
-            logger.error(f"Bakong HTTP request failed: {str(e)}")
-            raise ConnectionError(f"Failed to reach Bakong API: {str(e)}")
-
-        if not response.ok:
-            logger.error(f"Bakong HTTP error: {response.status_code} {response.text}")
-            raise ConnectionError(f"Bakong service returned error {response.status_code}")
-
-        data = response.json()
-        logger.info(f"Bakong response: {data}")
-
-        response_code = data.get('responseCode')
-
-        # 3. Completed
-        if response_code == 0:
-            if payment.status != 'completed':
-                payment.status = 'completed'
-                payment.paid = True
-                payment.paid_at = timezone.now()
-                payment.bakongHash = data.get('data', {}).get('hash')
-                payment.fromAccountId = data.get('data', {}).get('fromAccountId')
-                payment.toAccountId = data.get('data', {}).get('toAccountId')
-                payment.save()
-
-                # Confirm the booking
-                booking = payment.booking
-                if booking and booking.status != 'confirmed':
-                    booking.status = 'confirmed'
-                    booking.save(update_fields=['status', 'updated_at'])
-
-            return {
-                "status": "COMPLETED",
-                "message": "Payment confirmed",
-                "payment": payment,
-            }
-
-        # 4. Pending
-        if response_code == 1:
-            return {
-                "status": "PENDING",
-                "message": data.get('message', 'Payment is pending'),
-            }
-
-        # 5. Other errors
-        return {
-            "status": "FAILED",
-            "message": data.get('message', 'Payment failed'),
-            "code": response_code,
-        }
-
+        result = BakongReconcileService.local_status(payment)
+        if result['status'] == 'PENDING':
+            BakongReconcileService.cache_status(md5, result['status'], result['message'])
+        return result
@@ -1,10 +1,11 @@
 from typing import List, Optional
 from django.core.exceptions import ObjectDoesNotExist
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 from django.db.models import Q
 from app.models.permission import Permission
 
 from app.dto.responses.permission_response import PermissionResponse
+from app.utils.permission_cache import PermissionCache
+from app.utils.pagination import paginate_queryset, page_response
 
 class PermissionService:
     @staticmethod
@@ -41,6 +42,7 @@ class PermissionService:
             permission.sort = request_data.get('sort', permission.sort)
             permission.status = request_data.get('status', permission.status)
             permission.save()
+            PermissionCache.invalidate()
             return PermissionResponse(permission).data
         except ObjectDoesNotExist:
             return None
@@ -50,6 +52,7 @@ class PermissionService:
         try:
             permission = Permission.objects.get(id=permission_id)
             permission.delete()
+            PermissionCache.invalidate()
             return True
         except ObjectDoesNotExist:
             return False
@@ -59,10 +62,6 @@ class PermissionService:
         """
         Get paginated permissions with optional filtering and searching.
         """
-        page = validated_data.get('page', 1)
-        limit = validated_data.get('limit', 100) # Consistent default limit
-        sort_by = validated_data.get('sort_by', 'id')
-        sort_order = validated_data.get('sort_order', 'asc')
         search = validated_data.get('search', None)
         filters = validated_data.get('filters', {}) # Use 'filters' plural
 
@@ -80,24 +79,8 @@ class PermissionService:
                 Q(group__icontains=search)
             )
 
-        # Sorting
-        if sort_order.lower() == 'desc':
-            sort_by = f'-{sort_by}'
-        queryset = queryset.order_by(sort_by)
+        page = paginate_queryset(queryset, validated_data, default_limit=100)
 
-        paginator = Paginator(queryset, limit)
-        try:
-            paginated_permissions = paginator.page(page)
-        except PageNotAnInteger:
-            paginated_permissions = paginator.page(1)
-        except EmptyPage:
-            paginated_permissions = paginator.page(paginator.num_pages)
-
-        permissions_data = [PermissionResponse(p).data for p in paginated_permissions.object_list]
+        permissions_data = [PermissionResponse(p).data for p in page['items']]
 
-        return {
-            'data': permissions_data,
-            'total': paginator.count,
-            'page': paginated_permissions.number,
-            'limit': limit,
-        }
\ No newline at end of file
+        return page_response(page, permissions_data)
@@ -1,6 +1,5 @@
 from typing import List, Optional
 from django.core.exceptions import ObjectDoesNotExist
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 from django.db.models import Q
 from app.models.role_permission import RolePermission
 from app.models.role import Role
@@ -8,6 +7,23 @@ from app.models.permission import Permission
  # Added UpdateRolePermissionRequest
 from app.dto.requests.pagination_request import PaginationRequest
 from app.dto.responses.role_permission_response import RolePermissionResponse
+from app.utils.permission_cache import PermissionCache
+from app.utils.filters import FilterSchema, EQUALITY
+from app.utils.pagination import paginate_queryset, page_response
+
+ROLE_PERMISSION_FILTERS = FilterSchema(
+    RolePermission,
+    fields={
+        'id': EQUALITY,
+        'role_id': EQUALITY,
+        'permission_id': EQUALITY,
+    },
+    aliases={
+        'role': 'role_id', 'role__id': 'role_id',
+        'permission': 'permission_id', 'permission__id': 'permission_id',
+    },
+    sortable=('role_id', 'permission_id'),
+)
 
 class RolePermissionService:
     @staticmethod
@@ -16,6 +32,7 @@ class RolePermissionService:
             role = Role.objects.get(id=request_data['role_id'])
             permission = Permission.objects.get(id=request_data['permission_id'])
             role_permission = RolePermission.objects.create(role=role, permission=permission)
+            PermissionCache.invalidate()
             return RolePermissionResponse(role_permission).data
         except ObjectDoesNotExist:
             return None # Role or Permission does not exist
@@ -44,6 +61,7 @@ class RolePermissionService:
                 role_permission.permission = Permission.objects.get(id=request_data['permission_id'])
 
             role_permission.save()
+            PermissionCache.invalidate()
             return RolePermissionResponse(role_permission).data
         except ObjectDoesNotExist:
             return None
@@ -55,6 +73,7 @@ class RolePermissionService:
         try:
             role_permission = RolePermission.objects.get(id=rp_id)
             role_permission.delete()
+            PermissionCache.invalidate()
             return True
         except ObjectDoesNotExist:
             return False
@@ -69,44 +88,21 @@ class RolePermissionService:
         
     @staticmethod
     def get_paginated_role_permissions(validated_data: dict) -> dict:
-        page = validated_data.get("page", 1)
-        limit = validated_data.get("limit", 100)
-        sort_by = validated_data.get("sort_by", "id")
-        sort_order = validated_data.get("sort_order", "desc")
         search = validated_data.get("search")
-        filters = validated_data.get("filters", {})
 
         queryset = RolePermission.objects.select_related("role", "permission")
 
-        # Apply filters (allow related lookups with __)
-        if filters:
-            queryset = queryset.filter(**filters)
+        # Apply filters (only the local foreign-key columns, no joins)
+        queryset, plan = ROLE_PERMISSION_FILTERS.apply(queryset, validated_data)
 
         # Apply search
         if search:
             search_query = Q(role__display_name__icontains=search) | Q(permission__display_name__icontains=search)
             queryset = queryset.filter(search_query)
 
-        # Sorting
-        sort_field = f"-{sort_by}" if sort_order.lower() == "desc" else sort_by
-        queryset = queryset.order_by(sort_field)
-
-        # Pagination
-        paginator = Paginator(queryset, limit)
-        try:
-            page_obj = paginator.page(page)
-        except PageNotAnInteger:
-            page_obj = paginator.page(1)
-        except EmptyPage:
-            page_obj = paginator.page(paginator.num_pages)
+        page = paginate_queryset(queryset, validated_data, default_limit=100, default_order='desc', plan=plan)
 
-        # Response
-        role_permissions_data = [RolePermissionResponse(rp).data for rp in page_obj.object_list]
+        role_permissions_data = [RolePermissionResponse(rp).data for rp in page['items']]
 
-        return {
-            "data": role_permissions_data,
-            "total": paginator.count,
-            "page": page_obj.number,
-            "limit": limit,
-        }
+        return page_response(page, role_permissions_data)
 
@@ -1,10 +1,11 @@
 from typing import List, Optional
 from django.core.exceptions import ObjectDoesNotExist
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 from django.db.models import Q
 from app.models.role import Role
 
 from app.dto.responses.role_response import RoleResponse
+from app.utils.permission_cache import PermissionCache
+from app.utils.pagination import paginate_queryset, page_response
 
 class RoleService:
     @staticmethod
@@ -37,6 +38,7 @@ class RoleService:
             role.display_name = request_data.get('display_name', role.display_name)
             role.status = request_data.get('status', role.status)
             role.save()
+            PermissionCache.invalidate()
             return RoleResponse(role).data
         except ObjectDoesNotExist:
             return None
@@ -46,6 +48,7 @@ class RoleService:
         try:
             role = Role.objects.get(id=role_id)
             role.delete()
+            PermissionCache.invalidate()
             return True
         except ObjectDoesNotExist:
             return False
@@ -55,10 +58,6 @@ class RoleService:
         """
         Get paginated roles with optional filtering and searching.
         """
-        page = validated_data.get('page', 1)
-        limit = validated_data.get('limit', 100)  # Consistent default limit
-        sort_by = validated_data.get('sort_by', 'id')
-        sort_order = validated_data.get('sort_order', 'asc')
         search = validated_data.get('search', None)
         filters = validated_data.get('filters', {})  # Use 'filters' plural
 
@@ -75,24 +74,8 @@ class RoleService:
                 Q(display_name__icontains=search)
             )
 
-        # Sorting
-        if sort_order.lower() == 'desc':
-            sort_by = f'-{sort_by}'
-        queryset = queryset.order_by(sort_by)
+        page = paginate_queryset(queryset, validated_data, default_limit=100)
 
-        paginator = Paginator(queryset, limit)
-        try:
-            paginated_roles = paginator.page(page)
-        except PageNotAnInteger:
-            paginated_roles = paginator.page(1)
-        except EmptyPage:
-            paginated_roles = paginator.page(paginator.num_pages)
-
-        roles_data = [RoleResponse(r).data for r in paginated_roles.object_list]
+        roles_data = [RoleResponse(r).data for r in page['items']]
 
-        return {
-            'data': roles_data,
-            'total': paginator.count,
-            'page': paginated_roles.number,
-            'limit': limit,
-        }
\ No newline at end of file
+        return page_response(page, roles_data)
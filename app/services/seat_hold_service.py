@@ -0,0 +1,178 @@
+import logging
+import threading
+import time
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import Case, Exists, F, IntegerField, OuterRef, Value, When
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from app.models.booking import Booking
+from app.models.payment import Payment
+from app.models.ticket import Ticket
+from app.services.ticket_inventory_service import TicketInventoryService
+from app.utils.payment_events import get_payment_event_hub
+
+logger = logging.getLogger(__name__)
+
+
+class SeatHoldService:
+    """
+    Time-boxed seat holds for pending bookings.
+
+    A pending booking holds its seats until hold_expires_at, or for as long as a
+    KHQR issued for it can still be paid. release_expired()
+    finds expired holds in batches (skipping rows other sweepers have locked),
+    marks the whole batch expired with one UPDATE and returns the seats with one
+    UPDATE per batch for plain tickets (sharded tickets release per ticket).
+    """
+
+    @staticmethod
+    def hold_expiry():
+        return timezone.now() + timedelta(minutes=getattr(settings, 'SEAT_HOLD_MINUTES', 15))
+
+    @staticmethod
+    def confirm(booking: Booking) -> bool:
+        """
+        Confirms a booking and drops its hold. A booking whose hold already expired is
+        re-reserved first; returns False if its seats have been sold in the meantime.
+        """
+        with transaction.atomic():
+            if Booking.objects.filter(pk=booking.pk, status='pending').update(
+                status='confirmed', hold_expires_at=None, updated_at=timezone.now()
+            ):
+                booking.status, booking.hold_expires_at = 'confirmed', None
+                return True
+
+            booking.refresh_from_db(fields=['status', 'ticket', 'quantity'])
+            if booking.status != 'expired':
+                return booking.status == 'confirmed'
+            if booking.ticket_id and not TicketInventoryService.reserve(booking.ticket, booking.quantity):
+                logger.warning(f"Booking {booking.pk} was paid after its hold expired and is now sold out.")
+                return False
+
+            Booking.objects.filter(pk=booking.pk, status='expired').update(
+                status='confirmed', hold_expires_at=None, updated_at=timezone.now()
+            )
+            booking.status, booking.hold_expires_at = 'confirmed', None
+            return True
+
+    @staticmethod
+    def _release_seats(seats: Counter) -> None:
+        tickets = Ticket.objects.filter(pk__in=seats).only('id', 'counter_slots')
+        plain = [ticket.id for ticket in tickets if not ticket.counter_slots]
+
+        if plain:
+            returned = Case(
+                *[When(pk=ticket_id, then=Value(seats[ticket_id])) for ticket_id in plain],
+                default=Value(0),
+                output_field=IntegerField(),
+            )
+            Ticket.objects.filter(pk__in=plain, counter_slots=0).update(
+                sold=Greatest(F('sold') - returned, 0),
+                updated_at=timezone.now(),
+            )
+
+        for ticket in tickets:
+            if ticket.counter_slots:
+                TicketInventoryService.release(ticket, seats[ticket.id])
+
+    @staticmethod
+    def release_expired(batch_size: int = None, now=None) -> dict:
+        """
+        Expires every pending booking whose hold has lapsed and returns its seats.
+        Returns metrics for the run: batches, bookings, seats, tickets and seconds.
+        """
+        batch_size = batch_size or getattr(settings, 'SEAT_HOLD_SWEEP_BATCH', 1000)
+        now = now or timezone.now()
+        started = time.perf_counter()
+        metrics = {'batches': 0, 'bookings': 0, 'seats': 0, 'tickets': 0}
+        # A KHQR the reconciler still checks may yet be paid; keep its booking held until then
+        payable_qr = Payment.objects.filter(
+            booking_id=OuterRef('pk'), status='pending', md5__isnull=False,
+            expire_at__gt=now - timedelta(seconds=getattr(settings, 'BAKONG_RECONCILE_GRACE', 120)),
+        )
+
+        while True:
+            with transaction.atomic():
+                rows = list(
+                    Booking.objects.select_for_update(skip_locked=True)
+                    .filter(status='pending', is_deleted=False, hold_expires_at__lte=now)
+                    .filter(~Exists(payable_qr))
+                    .order_by('hold_expires_at')
+                    .values_list('id', 'ticket_id', 'quantity')[:batch_size]
+                )
+                if not rows:
+                    break
+
+                ids = [row[0] for row in rows]
+                seats = Counter()
+                for _, ticket_id, quantity in rows:
+                    if ticket_id and quantity:
+                        seats[ticket_id] += quantity
+
+                Booking.objects.filter(id__in=ids).update(status='expired', updated_at=timezone.now())
+                pending_payments = Payment.objects.filter(booking_id__in=ids, status='pending')
+                failed_md5s = list(pending_payments.exclude(md5__isnull=True).values_list('md5', flat=True))
+                pending_payments.update(status='failed', updated_at=timezone.now())
+                get_payment_event_hub().publish_on_commit(failed_md5s, 'FAILED')
+                if seats:
+                    SeatHoldService._release_seats(seats)
+
+            metrics['batches'] += 1
+            metrics['bookings'] += len(ids)
+            metrics['seats'] += sum(seats.values())
+            metrics['tickets'] += len(seats)
+            if len(rows) < batch_size:
+                break
+
+        metrics['seconds'] = round(time.perf_counter() - started, 3)
+        if metrics['bookings']:
+            logger.info(
+                f"Released {metrics['seats']} seats from {metrics['bookings']} expired holds "
+                f"on {metrics['tickets']} tickets in {metrics['batches']} batches ({metrics['seconds']}s)"
+            )
+        return metrics
+
+
+class SeatHoldSweeper:
+    """
+    In-process scheduler that runs SeatHoldService.release_expired every
+    SEAT_HOLD_SWEEP_INTERVAL seconds on a daemon thread. Several workers may run it
+    at once; the sweeps skip each other's locked rows.
+    """
+    _thread = None
+    _lock = threading.Lock()
+    runs = 0
+    released = Counter()
+    last_run = None
+
+    @classmethod
+    def _loop(cls, interval: float) -> None:
+        while True:
+            time.sleep(interval)
+            close_old_connections()
+            try:
+                metrics = SeatHoldService.release_expired()
+                cls.runs += 1
+                cls.released.update({key: metrics[key] for key in ('bookings', 'seats')})
+                cls.last_run = metrics
+            except Exception:
+                logger.exception("Seat hold sweep failed")
+            finally:
+                close_old_connections()
+
+    @classmethod
+    def start(cls, interval: float = None) -> bool:
+        """Starts the sweeper thread once per process; no-op when the interval is 0."""
+        interval = interval if interval is not None else getattr(settings, 'SEAT_HOLD_SWEEP_INTERVAL', 0)
+        if not interval:
+            return False
+        with cls._lock:
+            if cls._thread is None:
+                cls._thread = threading.Thread(target=cls._loop, args=(interval,), name='seat-hold-sweeper', daemon=True)
+                cls._thread.start()
+        return True
@@ -0,0 +1,156 @@
+import random
+
+from django.db import transaction
+from django.db.models import F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from app.models.ticket import Ticket
+from app.models.ticket_counter_shard import TicketCounterShard
+
+MAX_COUNTER_SLOTS = 64
+
+
+class TicketCounterService:
+    """
+    Sharded sold-counters for flash-sale tickets.
+
+    While a ticket has counter_slots > 0 its remaining capacity is split across that
+    many TicketCounterShard rows. A booking decrements one random slot with a
+    conditional UPDATE, so concurrent buyers contend on N row locks instead of one.
+    When the chosen slot is drained but others still have seats, the seats are taken
+    from (and rebalanced over) the slots no other transaction holds. Ticket.sold is only brought up to date by reconcile(), which the
+    reconcile_ticket_counters command runs periodically.
+    """
+
+    @staticmethod
+    def _split(total: int, slots: int) -> list:
+        base, extra = divmod(max(total, 0), slots)
+        return [base + (1 if slot < extra else 0) for slot in range(slots)]
+
+    @staticmethod
+    @transaction.atomic
+    def enable(ticket_id: int, slots: int) -> Ticket:
+        """Moves a ticket's remaining capacity onto `slots` counter shards."""
+        if not 1 <= slots <= MAX_COUNTER_SLOTS:
+            raise ValueError(f'counter_slots must be between 1 and {MAX_COUNTER_SLOTS}.')
+
+        ticket = Ticket.objects.select_for_update().get(pk=ticket_id)
+        if ticket.counter_slots:
+            TicketCounterService._collapse(ticket)
+
+        TicketCounterShard.objects.bulk_create([
+            TicketCounterShard(ticket_id=ticket.id, slot=slot, remaining=remaining)
+            for slot, remaining in enumerate(TicketCounterService._split(ticket.quantity - ticket.sold, slots))
+        ])
+        ticket.counter_slots = slots
+        ticket.save(update_fields=['counter_slots', 'sold', 'updated_at'])
+        return ticket
+
+    @staticmethod
+    def _collapse(ticket: Ticket) -> None:
+        """Folds the shards back into ticket.sold and deletes them (ticket row must be locked)."""
+        remaining = TicketCounterShard.objects.select_for_update().filter(ticket_id=ticket.id).aggregate(
+            total=Sum('remaining')
+        )['total'] or 0
+        TicketCounterShard.objects.filter(ticket_id=ticket.id).delete()
+        ticket.sold = max(ticket.quantity - remaining, 0)
+        ticket.counter_slots = 0
+
+    @staticmethod
+    @transaction.atomic
+    def disable(ticket_id: int) -> Ticket:
+        """Returns a ticket to the single sold counter, reconciling it first."""
+        ticket = Ticket.objects.select_for_update().get(pk=ticket_id)
+        if ticket.counter_slots:
+            TicketCounterService._collapse(ticket)
+            ticket.save(update_fields=['counter_slots', 'sold', 'updated_at'])
+        return ticket
+
+    @staticmethod
+    def _take(ticket_id: int, slot: int, quantity: int) -> bool:
+        return TicketCounterShard.objects.filter(
+            ticket_id=ticket_id, slot=slot, remaining__gte=quantity
+        ).update(remaining=F('remaining') - quantity) == 1
+
+    @staticmethod
+    def _locked_shards(ticket_id: int, skip_locked: bool = False) -> list:
+        return list(
+            TicketCounterShard.objects.select_for_update(skip_locked=skip_locked)
+            .filter(ticket_id=ticket_id).order_by('slot')
+        )
+
+    @staticmethod
+    def _rebalance(shards: list, quantity: int = 0) -> None:
+        """Takes `quantity` seats from locked shards and spreads the rest evenly over them."""
+        total = sum(shard.remaining for shard in shards) - quantity
+        for shard, remaining in zip(shards, TicketCounterService._split(total, len(shards))):
+            if shard.remaining != remaining:
+                shard.remaining = remaining
+                shard.save(update_fields=['remaining'])
+
+    @staticmethod
+    def reserve(ticket_id: int, slots: int, quantity: int):
+        """
+        Takes `quantity` seats from a random slot. Returns True/False, or None when the
+        ticket has no shards (sharding was turned off concurrently).
+        """
+        # The plain path's UPDATE filters on is_deleted; the shards do not carry it
+        if not Ticket.objects.filter(pk=ticket_id, is_deleted=False).exists():
+            return False
+        if TicketCounterService._take(ticket_id, random.randrange(slots), quantity):
+            return True
+
+        # The slot is drained. The surrounding transaction may keep that slot's row lock,
+        # so waiting here for slots other buyers hold could deadlock with one of them doing
+        # the same: take the seats from the slots nobody else holds (SKIP LOCKED) instead.
+        shards = TicketCounterService._locked_shards(ticket_id, skip_locked=True)
+        if not shards:
+            if not TicketCounterShard.objects.filter(ticket_id=ticket_id).exists():
+                return None
+            return False
+        if sum(shard.remaining for shard in shards) < quantity:
+            return False
+        TicketCounterService._rebalance(shards, quantity)
+        return True
+
+    @staticmethod
+    def remaining(ticket_id: int) -> int:
+        """Seats left across all slots of a sharded ticket."""
+        return TicketCounterShard.objects.filter(ticket_id=ticket_id).aggregate(total=Sum('remaining'))['total'] or 0
+
+    @staticmethod
+    def release(ticket_id: int, slots: int, quantity: int) -> bool:
+        """Returns seats to a random slot; False when the ticket has no shards."""
+        return TicketCounterShard.objects.filter(
+            ticket_id=ticket_id, slot=random.randrange(slots)
+        ).update(remaining=F('remaining') + quantity) == 1
+
+    @staticmethod
+    @transaction.atomic
+    def resize(ticket: Ticket, delta: int) -> None:
+        """Applies a change in ticket.quantity to the shards of a sharded ticket."""
+        if delta > 0:
+            TicketCounterShard.objects.filter(ticket_id=ticket.id, slot=0).update(remaining=F('remaining') + delta)
+        elif delta < 0:
+            shards = TicketCounterService._locked_shards(ticket.id)
+            if sum(shard.remaining for shard in shards) < -delta:
+                raise ValueError('Cannot reduce quantity below the number of tickets sold.')
+            TicketCounterService._rebalance(shards, -delta)
+
+    @staticmethod
+    def reconcile(ticket_ids=None) -> int:
+        """
+        Sets Ticket.sold = quantity - SUM(shard.remaining) for sharded tickets in one
+        UPDATE. Returns the number of tickets reconciled.
+        """
+        remaining = TicketCounterShard.objects.filter(ticket_id=OuterRef('pk')).values('ticket_id').annotate(
+            total=Sum('remaining')
+        ).values('total')
+        queryset = Ticket.objects.filter(counter_slots__gt=0)
+        if ticket_ids is not None:
+            queryset = queryset.filter(pk__in=ticket_ids)
+        return queryset.update(
+            sold=F('quantity') - Coalesce(Subquery(remaining), Value(0)),
+            updated_at=timezone.now(),
+        )
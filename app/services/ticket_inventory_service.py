@@ -0,0 +1,103 @@
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from app.models.ticket import Ticket
+from app.services.ticket_counter_service import TicketCounterService
+
+
+class TicketInventoryService:
+    """
+    Race-free seat accounting for Ticket.sold.
+
+    Every change is one conditional UPDATE, so the database row lock serializes
+    concurrent buyers and no decision is ever made on a stale read. The
+    tickets_sold_within_quantity check constraint backs this up at the schema level.
+    Tickets in sharded-counter mode (counter_slots > 0) are delegated to
+    TicketCounterService; the direct UPDATEs are guarded by counter_slots=0 so a
+    stale mode read falls through to the right path.
+    """
+
+    @staticmethod
+    def _current_slots(ticket_id: int) -> int:
+        return Ticket.objects.filter(pk=ticket_id).values_list('counter_slots', flat=True).first() or 0
+
+    @staticmethod
+    def reserve(ticket: Ticket, quantity: int) -> bool:
+        """
+        Adds `quantity` to sold if that still fits the ticket's quantity:
+        UPDATE tickets SET sold = sold + n WHERE id = ? AND sold + n <= quantity.
+        Returns False when the seats are no longer available.
+        """
+        if quantity <= 0:
+            return True
+
+        if ticket.counter_slots:
+            reserved = TicketCounterService.reserve(ticket.id, ticket.counter_slots, quantity)
+            if reserved is not None:
+                return reserved
+
+        updated = Ticket.objects.filter(
+            pk=ticket.id,
+            is_deleted=False,
+            counter_slots=0,
+            sold__lte=F('quantity') - quantity,
+        ).update(sold=F('sold') + quantity, updated_at=timezone.now())
+        if updated:
+            return True
+
+        # Sharding may have been switched on since the ticket was read
+        slots = TicketInventoryService._current_slots(ticket.id)
+        if slots and not ticket.counter_slots:
+            return bool(TicketCounterService.reserve(ticket.id, slots, quantity))
+        return False
+
+    @staticmethod
+    def available(ticket: Ticket) -> int:
+        """Seats currently left on a ticket (a fresh read; use only to size a retry)."""
+        if ticket.counter_slots:
+            return TicketCounterService.remaining(ticket.id)
+        row = Ticket.objects.filter(pk=ticket.id, is_deleted=False).values_list('quantity', 'sold').first()
+        return max(row[0] - row[1], 0) if row else 0
+
+    @staticmethod
+    def release(ticket: Ticket, quantity: int) -> None:
+        """Returns `quantity` seats to the pool, never taking sold below zero."""
+        if quantity <= 0:
+            return
+
+        slots = ticket.counter_slots or TicketInventoryService._current_slots(ticket.id)
+        if slots and TicketCounterService.release(ticket.id, slots, quantity):
+            return
+
+        Ticket.objects.filter(pk=ticket.id, counter_slots=0).update(
+            sold=Greatest(F('sold') - quantity, 0),
+            updated_at=timezone.now(),
+        )
+
+    @staticmethod
+    def adjust(ticket: Ticket, delta: int) -> bool:
+        """Reserves (delta > 0) or releases (delta < 0) seats on one ticket."""
+        if delta > 0:
+            return TicketInventoryService.reserve(ticket, delta)
+        TicketInventoryService.release(ticket, -delta)
+        return True
+
+    @staticmethod
+    def move(old_ticket, old_quantity: int, new_ticket, new_quantity: int) -> bool:
+        """
+        Re-points a booking's seats, e.g. when its ticket or quantity changes.
+        Must run inside a transaction so a failed reservation rolls back the release.
+        """
+        old_id = old_ticket.id if old_ticket else None
+        new_id = new_ticket.id if new_ticket else None
+        if old_id == new_id:
+            if new_ticket is None:
+                return True
+            return TicketInventoryService.adjust(new_ticket, (new_quantity or 0) - (old_quantity or 0))
+
+        if new_ticket is not None and not TicketInventoryService.reserve(new_ticket, new_quantity or 0):
+            return False
+        if old_ticket is not None:
+            TicketInventoryService.release(old_ticket, old_quantity or 0)
+        return True
@@ -1,20 +1,38 @@
 from typing import List, Optional
 from django.core.exceptions import ObjectDoesNotExist
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
+from django.db import transaction
 from django.db.models import Q
 from django.utils import timezone
 from app.models.ticket import Ticket
 from app.models.event import Event
 from app.dto.responses.ticket_response import TicketResponse
+from app.services.ticket_counter_service import TicketCounterService
+from app.utils.filters import FilterSchema, EQUALITY, RANGE
+from app.utils.pagination import paginate_queryset, page_response
+
+TICKET_FILTERS = FilterSchema(
+    Ticket,
+    fields={
+        'id': EQUALITY,
+        'event_id': EQUALITY,
+        'created_at': RANGE,
+    },
+    aliases={'event': 'event_id', 'event__id': 'event_id'},
+    sortable=('created_at',),
+)
 
 class TicketService:
     @staticmethod
+    @transaction.atomic
     def create_ticket(request_data: dict) -> Ticket:
         event = Event.objects.get(id=request_data.pop('event_id'))
+        counter_slots = request_data.pop('counter_slots', 0)
         ticket = Ticket.objects.create(
             event=event,
             **request_data
         )
+        if counter_slots:
+            ticket = TicketCounterService.enable(ticket.id, counter_slots)
         return ticket
 
     @staticmethod
@@ -29,16 +47,32 @@ class TicketService:
         return Ticket.objects.filter(is_deleted=False)
 
     @staticmethod
+    @transaction.atomic
     def update_ticket(ticket_id: int, request_data: dict) -> Optional[Ticket]:
         try:
-            ticket = Ticket.objects.get(id=ticket_id, is_deleted=False)
+            # Locked so concurrent quantity edits resize the shards one after another
+            ticket = Ticket.objects.select_for_update().get(id=ticket_id, is_deleted=False)
+            counter_slots = request_data.pop('counter_slots', None)
+            # Sharded tickets keep their capacity in the counter shards
+            if ticket.counter_slots and 'quantity' in request_data:
+                TicketCounterService.resize(ticket, request_data['quantity'] - ticket.quantity)
+            update_fields = ['updated_at']
             if 'event_id' in request_data:
                 ticket.event = Event.objects.get(id=request_data.pop('event_id'))
+                update_fields.append('event')
             
             for key, value in request_data.items():
                 setattr(ticket, key, value)
+                update_fields.append(key)
             
-            ticket.save()
+            # Only write the changed columns so a stale `sold` never overwrites concurrent reservations
+            ticket.save(update_fields=update_fields)
+
+            if counter_slots is not None and counter_slots != ticket.counter_slots:
+                if counter_slots:
+                    ticket = TicketCounterService.enable(ticket.id, counter_slots)
+                else:
+                    ticket = TicketCounterService.disable(ticket.id)
             return ticket
         except ObjectDoesNotExist:
             return None
@@ -49,7 +83,7 @@ class TicketService:
             ticket = Ticket.objects.get(id=ticket_id)
             ticket.is_deleted = True
             ticket.deleted_at = timezone.now()
-            ticket.save()
+            ticket.save(update_fields=['is_deleted', 'deleted_at', 'updated_at'])
             return True
         except ObjectDoesNotExist:
             return False
@@ -69,17 +103,10 @@ class TicketService:
 
     @staticmethod
     def get_paginated_tickets(validated_data: dict) -> dict:
-        page = validated_data.get('page', 1)
-        limit = validated_data.get('limit', 10)
-        sort_by = validated_data.get('sort_by', 'id')
-        sort_order = validated_data.get('sort_order', 'asc')
         search = validated_data.get('search', None)
-        filters = validated_data.get('filters', {})
 
         queryset = Ticket.objects.filter(is_deleted=False)
-
-        if filters:
-            queryset = queryset.filter(**filters)
+        queryset, plan = TICKET_FILTERS.apply(queryset, validated_data)
 
         if search:
             queryset = queryset.filter(
@@ -87,23 +114,8 @@ class TicketService:
                 Q(event__event_name__icontains=search)
             )
 
-        if sort_order.lower() == 'desc':
-            sort_by = f'-{sort_by}'
-        queryset = queryset.order_by(sort_by)
-
-        paginator = Paginator(queryset, limit)
-        try:
-            paginated_tickets = paginator.page(page)
-        except PageNotAnInteger:
-            paginated_tickets = paginator.page(1)
-        except EmptyPage:
-            paginated_tickets = paginator.page(paginator.num_pages)
+        page = paginate_queryset(queryset, validated_data, default_limit=10, plan=plan)
 
-        tickets_data = TicketResponse(paginated_tickets.object_list, many=True).data
+        tickets_data = TicketResponse(page['items'], many=True).data
 
-        return {
-            'data': tickets_data,
-            'total': paginator.count,
-            'page': paginated_tickets.number,
-            'limit': limit,
-        }
\ No newline at end of file
+        return page_response(page, tickets_data)
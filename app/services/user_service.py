@@ -1,16 +1,29 @@
 from typing import List, Optional
 from django.core.exceptions import ObjectDoesNotExist
 from django.contrib.auth import get_user_model
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 from django.db.models import Q
 from django.utils import timezone
 from app.models.role import Role
 
 from app.dto.responses.user_response import UserResponse
-from app.utils.bycrypt import hash_password, check_password
+from app.utils.bycrypt import hash_password, check_password, needs_rehash
+from app.utils.principal import PrincipalCache
+from app.utils.filters import FilterSchema, EQUALITY, PREFIX, NULLABLE
+from app.utils.pagination import paginate_queryset, page_response
 
 User = get_user_model()
 
+USER_FILTERS = FilterSchema(
+    User,
+    fields={
+        'id': EQUALITY,
+        'email': PREFIX,
+        'role_id': EQUALITY + NULLABLE,
+    },
+    aliases={'role': 'role_id', 'role__id': 'role_id'},
+    sortable=('email',),
+)
+
 class UserService:
     @staticmethod
     def create_user(request_data: dict) -> UserResponse:
@@ -58,6 +71,7 @@ class UserService:
                 except ObjectDoesNotExist:
                     user.role = None # Set role to None if not found
             user.save()
+            PrincipalCache.evict_user(user.id)
             return UserResponse(user).data
         except ObjectDoesNotExist:
             return None
@@ -69,6 +83,7 @@ class UserService:
             user.is_deleted = True
             user.deleted_at = timezone.now()
             user.save()
+            PrincipalCache.evict_user(user.id)
             return True
         except ObjectDoesNotExist:
             return False
@@ -82,6 +97,7 @@ class UserService:
         try:
             user = User.all_objects.get(id=user_id)  # Include deleted users
             user.delete()  # Hard delete
+            PrincipalCache.evict_user(user_id)
             return True
         except ObjectDoesNotExist:
             return False
@@ -94,23 +110,21 @@ class UserService:
             return None # User not found
 
         if user and check_password(password, user.password):
+            # Transparently upgrade (or downgrade) hashes made with a different cost
+            if needs_rehash(user.password):
+                user.password = hash_password(password)
+                user.save(update_fields=['password'])
             return UserResponse(user).data
         return None
 
     @staticmethod
     def get_paginated_users(validated_data: dict) -> dict:
-        page = validated_data.get('page', 1)
-        limit = validated_data.get('limit', 100) # Consistent default limit
-        sort_by = validated_data.get('sort_by', 'id')
-        sort_order = validated_data.get('sort_order', 'asc')
         search = validated_data.get('search', None)
-        filters = validated_data.get('filters', {}) # Use 'filters' plural
 
         queryset = User.objects.filter(is_deleted=False)
 
-        # Apply filters from the 'filters' dictionary
-        if filters:
-            queryset = queryset.filter(**filters)
+        # Apply the whitelisted filters from the 'filters' dictionary
+        queryset, plan = USER_FILTERS.apply(queryset, validated_data)
 
         # Searching
         if search:
@@ -120,24 +134,8 @@ class UserService:
                 Q(last_name__icontains=search)    # Assuming last_name is available
             )
 
-        # Sorting
-        if sort_order.lower() == 'desc':
-            sort_by = f'-{sort_by}'
-        queryset = queryset.order_by(sort_by)
+        page = paginate_queryset(queryset, validated_data, default_limit=100, plan=plan)
 
-        paginator = Paginator(queryset, limit)
-        try:
-            paginated_users = paginator.page(page)
-        except PageNotAnInteger:
-            paginated_users = paginator.page(1)
-        except EmptyPage:
-            paginated_users = paginator.page(paginator.num_pages)
-
-        users_data = [UserResponse(u).data for u in paginated_users.object_list]
-
-        return {
-            'data': users_data,
-            'total': paginator.count,
-            'page': paginated_users.number,
-            'limit': limit,
-        }
\ No newline at end of file
+        users_data = [UserResponse(u).data for u in page['items']]
+
+        return page_response(page, users_data)
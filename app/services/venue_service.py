@@ -1,12 +1,13 @@
 from typing import List, Optional
 from django.core.exceptions import ObjectDoesNotExist
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 from django.db import connection
 from django.db.models import Q
 from django.utils import timezone
 from app.models.venue import Venue
 
 from app.dto.responses.venue_response import VenueResponse
+from app.services.event_service import EventService
+from app.utils.pagination import paginate_queryset, page_response
 
 class VenueService:
     @staticmethod
@@ -41,6 +42,7 @@ class VenueService:
             venue.capacity = request_data.get('capacity', venue.capacity)
             venue.contact_info = request_data.get('contact_info', venue.contact_info)
             venue.save()
+            EventService.invalidate_catalogue()
             return VenueResponse(venue).data
         except ObjectDoesNotExist:
             return None
@@ -52,6 +54,7 @@ class VenueService:
             venue.is_deleted = True
             venue.deleted_at = timezone.now()
             venue.save()
+            EventService.invalidate_catalogue()
             return True
         except ObjectDoesNotExist:
             return False
@@ -65,16 +68,13 @@ class VenueService:
         try:
             venue = Venue.objects.get(venue_id=venue_id)
             venue.delete()  # Hard delete
+            EventService.invalidate_catalogue()
             return True
         except ObjectDoesNotExist:
             return False
 
     @staticmethod
     def get_paginated_venues(validated_data: dict) -> dict:
-        page = validated_data.get('page', 1)
-        limit = validated_data.get('limit', 100)
-        sort_by = validated_data.get('sort_by', 'venue_id')
-        sort_order = validated_data.get('sort_order', 'asc')
         search = validated_data.get('search', None)
         filters = validated_data.get('filters', {})
 
@@ -90,23 +90,8 @@ class VenueService:
                 Q(contact_info__icontains=search)
             )
 
-        if sort_order.lower() == 'desc':
-            sort_by = f'-{sort_by}'
-        queryset = queryset.order_by(sort_by)
+        page = paginate_queryset(queryset, validated_data, default_limit=100, default_sort='venue_id')
 
-        paginator = Paginator(queryset, limit)
-        try:
-            paginated_venues = paginator.page(page)
-        except PageNotAnInteger:
-            paginated_venues = paginator.page(1)
-        except EmptyPage:
-            paginated_venues = paginator.page(paginator.num_pages)
-
-        venues_data = [VenueResponse(v).data for v in paginated_venues.object_list]
+        venues_data = [VenueResponse(v).data for v in page['items']]
 
-        return {
-            'data': venues_data,
-            'total': paginator.count,
-            'page': paginated_venues.number,
-            'limit': limit,
-        }
\ No newline at end of file
+        return page_response(page, venues_data)
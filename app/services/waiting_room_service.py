@@ -0,0 +1,161 @@
+import math
+import time
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from django.db import transaction
+
+from app.models.event import Event
+
+RATE_KEY = 'waiting_room:{event_id}:rate'
+SEQ_KEY = 'waiting_room:{event_id}:seq'
+FRONTIER_KEY = 'waiting_room:{event_id}:frontier'
+TICK_KEY = 'waiting_room:{event_id}:tick'
+MEMBER_KEY = 'waiting_room:{event_id}:member:{principal}'
+PASS_USED_KEY = 'waiting_room:{event_id}:used:{position}'
+
+QUEUE_SALT = 'waiting-room'
+PASS_SALT = 'waiting-room-pass'
+RATE_CACHE_TTL = 3600
+
+
+class WaitingRoomService:
+    """
+    Per-event admission queue for high-demand on-sales.
+
+    Events with admission_rate > 0 only let that many clients per second into
+    booking. Clients join to get a signed queue token carrying their position, then
+    poll status until the admission frontier reaches them and they receive a
+    short-lived, single-use admission pass for POST /v1/bookings/. All queue state
+    (sequence, frontier, rate) lives in the cache, so joining and polling never
+    touch the database; point CACHE_BACKEND at a shared store when running more
+    than one process.
+    """
+
+    @staticmethod
+    def get_rate(event_id: int) -> int:
+        """Admitted clients per second for an event (0 = no waiting room), cached."""
+        key = RATE_KEY.format(event_id=event_id)
+        rate = cache.get(key)
+        if rate is None:
+            rate = Event.objects.filter(id=event_id, is_deleted=False).values_list('admission_rate', flat=True).first() or 0
+            cache.set(key, rate, timeout=RATE_CACHE_TTL)
+        return rate
+
+    @staticmethod
+    def invalidate_rate(event_id: int) -> None:
+        key = RATE_KEY.format(event_id=event_id)
+        transaction.on_commit(lambda: cache.delete(key))
+
+    @staticmethod
+    def _frontier(event_id: int, rate: int) -> float:
+        """
+        Highest admitted position. Advanced by at most one caller per second by
+        rate x elapsed, and never past the queue length, so idle time earns no burst.
+        """
+        now = time.time()
+        frontier_key = FRONTIER_KEY.format(event_id=event_id)
+        frontier, at = cache.get(frontier_key) or (0.0, now)
+        if cache.add(TICK_KEY.format(event_id=event_id), 1, timeout=1):
+            length = cache.get(SEQ_KEY.format(event_id=event_id)) or 0
+            frontier = min(frontier + rate * (now - at), length)
+            cache.set(frontier_key, (frontier, now), timeout=None)
+        return frontier
+
+    @staticmethod
+    def _issue_pass(event_id: int, principal: str, position: int) -> str:
+        # Every pass for a queue position shares its single use, however often the client polls
+        return signing.dumps({'e': event_id, 'u': principal, 'p': position}, salt=PASS_SALT, compress=True)
+
+    @staticmethod
+    def join(event_id: int, principal: str) -> dict:
+        """
+        Places the caller in the event's queue (idempotent per caller) and returns the
+        queue token along with its current status.
+        """
+        rate = WaitingRoomService.get_rate(event_id)
+        if not rate:
+            return {'status': 'open', 'admission_required': False}
+
+        member_key = MEMBER_KEY.format(event_id=event_id, principal=principal)
+        token = cache.get(member_key)
+        if token is None:
+            seq_key = SEQ_KEY.format(event_id=event_id)
+            cache.add(seq_key, 0, timeout=None)
+            position = cache.incr(seq_key)
+            token = signing.dumps({'e': event_id, 'p': position, 'u': principal}, salt=QUEUE_SALT, compress=True)
+            cache.set(member_key, token, timeout=getattr(settings, 'WAITING_ROOM_TOKEN_TTL', 3600))
+        return {'token': token, **WaitingRoomService.status(event_id, token, principal)}
+
+    @staticmethod
+    def status(event_id: int, token: str, principal: str) -> dict:
+        """
+        Cheap poll: where the caller stands and, once admitted, an admission pass.
+        Raises ValueError for a missing, forged, expired or foreign token.
+        """
+        rate = WaitingRoomService.get_rate(event_id)
+        if not rate:
+            return {'status': 'open', 'admission_required': False}
+
+        try:
+            payload = signing.loads(token or '', salt=QUEUE_SALT, max_age=getattr(settings, 'WAITING_ROOM_TOKEN_TTL', 3600))
+        except signing.BadSignature:
+            raise ValueError('Invalid or expired queue token; join the queue again.')
+        if payload.get('e') != event_id or payload.get('u') != principal:
+            raise ValueError('Queue token does not belong to this event or user.')
+
+        position = payload['p']
+        frontier = WaitingRoomService._frontier(event_id, rate)
+        if position <= frontier:
+            return {
+                'status': 'admitted',
+                'admission_required': True,
+                'position': position,
+                'admission_pass': WaitingRoomService._issue_pass(event_id, principal, position),
+                'pass_expires_in': getattr(settings, 'WAITING_ROOM_PASS_TTL', 120),
+            }
+
+        ahead = math.ceil(position - frontier)
+        wait = ahead / rate
+        return {
+            'status': 'waiting',
+            'admission_required': True,
+            'position': position,
+            'ahead': ahead,
+            'estimated_wait_seconds': math.ceil(wait),
+            'poll_after_seconds': min(max(math.ceil(wait / 2), 1), 10),
+        }
+
+    @staticmethod
+    def admit(event_id, admission_pass: str, principal: str):
+        """
+        Gate for booking creation. Returns None when the event has no waiting room,
+        otherwise consumes the admission pass and returns its used-key (see refund).
+        Raises ValueError if the caller has no valid, unused pass.
+        """
+        try:
+            event_id = int(event_id)
+        except (TypeError, ValueError):
+            return None  # Let request validation reject the event id
+        if not WaitingRoomService.get_rate(event_id):
+            return None
+
+        try:
+            payload = signing.loads(admission_pass or '', salt=PASS_SALT, max_age=getattr(settings, 'WAITING_ROOM_PASS_TTL', 120))
+        except signing.BadSignature:
+            raise ValueError('This event is in high demand; join the waiting room to get an admission pass.')
+        if payload.get('e') != event_id or payload.get('u') != principal:
+            raise ValueError('Admission pass does not belong to this event or user.')
+
+        used_key = PASS_USED_KEY.format(event_id=event_id, position=payload['p'])
+        # One booking per queue position for as long as its queue token lives
+        if not cache.add(used_key, 1, timeout=getattr(settings, 'WAITING_ROOM_TOKEN_TTL', 3600)):
+            raise ValueError('Admission pass has already been used.')
+        return used_key
+
+    @staticmethod
+    def refund(used_key) -> None:
+        """Makes a consumed pass usable again, e.g. when the booking attempt failed."""
+        if used_key:
+            cache.delete(used_key)
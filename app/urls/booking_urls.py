@@ -1,9 +1,10 @@
 from django.urls import path
-from app.views.booking_views import BookingListCreateView, BookingRetrieveUpdateDestroyView, PaginatedBookingListView, AdminBookingCreateView
+from app.views.booking_views import BookingListCreateView, BookingRetrieveUpdateDestroyView, PaginatedBookingListView, AdminBookingCreateView, AdminBatchBookingCreateView
 
 urlpatterns = [
     path('', BookingListCreateView.as_view(), name='booking-list-create'),
     path('admin/', AdminBookingCreateView.as_view(), name='admin-booking-create'),
+    path('admin/batch/', AdminBatchBookingCreateView.as_view(), name='admin-booking-batch-create'),
     path('<int:pk>/', BookingRetrieveUpdateDestroyView.as_view(), name='booking-retrieve-update-destroy'),
     path('paginate/', PaginatedBookingListView.as_view(), name='booking-paginate'),
 ]
@@ -4,7 +4,9 @@ from app.views.checkin_views import (
     CheckinRetrieveUpdateDestroyView, 
     PaginatedCheckinListView,
     ValidateTicketView,
-    ConfirmCheckinView
+    ConfirmCheckinView,
+    ScanTicketView,
+    GateIndexView
 )
 
 urlpatterns = [
@@ -13,4 +15,6 @@ urlpatterns = [
     path('paginate/', PaginatedCheckinListView.as_view(), name='checkin-paginate'),
     path('validate/', ValidateTicketView.as_view(), name='checkin-validate'),
     path('confirm/', ConfirmCheckinView.as_view(), name='checkin-confirm'),
+    path('scan/', ScanTicketView.as_view(), name='checkin-scan'),
+    path('gate-index/<int:event_id>/', GateIndexView.as_view(), name='checkin-gate-index'),
 ]
\ No newline at end of file
@@ -1,8 +1,10 @@
 from django.urls import path
-from app.views.event_ticket_views import EventTicketListCreateView, EventTicketRetrieveUpdateDestroyView, PaginatedEventTicketListView
+from app.views.event_ticket_views import EventTicketListCreateView, EventTicketRetrieveUpdateDestroyView, PaginatedEventTicketListView, BookingTicketIssueView, EventTicketQRImageView
 
 urlpatterns = [
     path('', EventTicketListCreateView.as_view(), name='event-ticket-list-create'),
     path('<int:pk>/', EventTicketRetrieveUpdateDestroyView.as_view(), name='event-ticket-retrieve-update-destroy'),
+    path('<int:pk>/qr/<str:key>.png', EventTicketQRImageView.as_view(), name='event-ticket-qr-image'),
     path('paginate/', PaginatedEventTicketListView.as_view(), name='event-ticket-paginate'),
+    path('bookings/<int:booking_id>/issue/', BookingTicketIssueView.as_view(), name='event-ticket-booking-issue'),
 ]
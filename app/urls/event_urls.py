@@ -1,8 +1,11 @@
 from django.urls import path
 from app.views.event_views import EventListCreateView, EventRetrieveUpdateDestroyView, PaginatedEventListView
+from app.views.waiting_room_views import EventQueueJoinView, EventQueueStatusView
 
 urlpatterns = [
     path('', EventListCreateView.as_view(), name='event-list-create'),
     path('<int:pk>/', EventRetrieveUpdateDestroyView.as_view(), name='event-retrieve-update-destroy'),
     path('paginate/', PaginatedEventListView.as_view(), name='event-paginate'),
+    path('<int:pk>/queue/', EventQueueJoinView.as_view(), name='event-queue-join'),
+    path('<int:pk>/queue/status/', EventQueueStatusView.as_view(), name='event-queue-status'),
 ]
\ No newline at end of file
@@ -6,15 +6,21 @@ from app.views.payment_views import (
     GenerateBakongQRView,
     CheckBakongStatusView,
     TestBakongPaymentView,
-    TestBakongCheckStatusView
+    TestBakongCheckStatusView,
+    BakongClientStatsView,
+    KHQRImageView
 )
+from app.views.payment_stream_views import PaymentStatusStreamView
 
 urlpatterns = [
     path('', PaymentListCreateView.as_view(), name='payment-list-create'),
     path('<int:pk>/', PaymentRetrieveUpdateDestroyView.as_view(), name='payment-retrieve-update-destroy'),
     path('paginate/', PaginatedPaymentListView.as_view(), name='payment-paginate'),
     path('<int:pk>/bakong-qr/', GenerateBakongQRView.as_view(), name='payment-bakong-qr'),
+    path('qr/<str:md5>.png', KHQRImageView.as_view(), name='payment-khqr-image'),
     path('check-status/', CheckBakongStatusView.as_view(), name='payment-check-status'),
+    path('status-stream/', PaymentStatusStreamView.as_view(), name='payment-status-stream'),
     path('test-bakong/', TestBakongPaymentView.as_view(), name='test-bakong'),
     path('test-bakong-status/', TestBakongCheckStatusView.as_view(), name='test-bakong-status'),
+    path('bakong-client-stats/', BakongClientStatsView.as_view(), name='payment-bakong-client-stats'),
 ]
\ No newline at end of file
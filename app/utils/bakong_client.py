@@ -0,0 +1,241 @@
+import random
+import threading
+import time
+from collections import deque
+
+import requests
+from django.conf import settings
+from django.utils.module_loading import import_string
+from requests.adapters import HTTPAdapter
+
+DEFAULT_BASE_URL = 'https://api-bakong.nbc.gov.kh/v1'
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+LATENCY_SAMPLES = 1000
+
+
+class BakongUnavailable(ConnectionError):
+    """Raised when the Bakong gateway can't be used: unreachable, failing or circuit open."""
+
+
+class CircuitBreaker:
+    """
+    Fails calls fast after `threshold` consecutive failures. Once `cooldown`
+    seconds have passed a single trial call is let through; its outcome closes
+    the circuit again or restarts the cooldown.
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 30):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        return 'half_open' if time.monotonic() - self.opened_at >= self.cooldown else 'open'
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at < self.cooldown or self._trial:
+                return False
+            self._trial = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures, self.opened_at, self._trial = 0, None, False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._trial or self.failures >= self.threshold:
+                self.opened_at, self._trial = time.monotonic(), False
+
+
+class HttpBakongClient:
+    """
+    Process-wide Bakong gateway client. Reuses one pooled keep-alive session and
+    one KHQR instance, retries transient failures a bounded number of times with
+    jittered exponential backoff, and puts a circuit breaker in front of the
+    gateway so a slow or failing Bakong costs callers milliseconds, not timeouts.
+    """
+
+    def __init__(self, base_url: str = None, token: str = None, account: str = None):
+        self.base_url = (base_url or getattr(settings, 'BAKONG_PROD_BASE_API_URL', DEFAULT_BASE_URL)).rstrip('/')
+        self.token = token if token is not None else getattr(settings, 'BAKONG_ACCESS_TOKEN', '')
+        self.account = account if account is not None else getattr(settings, 'BAKONG_ACCOUNT_USERNAME', '')
+        self.timeout = (getattr(settings, 'BAKONG_CONNECT_TIMEOUT', 3), getattr(settings, 'BAKONG_HTTP_TIMEOUT', 10))
+        self.retries = getattr(settings, 'BAKONG_HTTP_RETRIES', 2)
+        self.backoff = getattr(settings, 'BAKONG_HTTP_BACKOFF', 0.2)
+        self.breaker = CircuitBreaker(
+            threshold=getattr(settings, 'BAKONG_BREAKER_THRESHOLD', 5),
+            cooldown=getattr(settings, 'BAKONG_BREAKER_COOLDOWN', 30),
+        )
+
+        pool_size = getattr(settings, 'BAKONG_HTTP_POOL_SIZE', 10)
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json",
+        })
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self._khqr = None
+        self._lock = threading.Lock()
+        self._counters = {'requests': 0, 'attempts': 0, 'successes': 0, 'failures': 0, 'retries': 0, 'short_circuited': 0}
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+
+    @property
+    def khqr(self):
+        """Shared KHQR instance for building QR payloads, md5s and images."""
+        if self._khqr is None:
+            with self._lock:
+                if self._khqr is None:
+                    from bakong_khqr import KHQR
+                    self._khqr = KHQR(bakong_token=self.token)
+        return self._khqr
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def _sleep_before_retry(self, attempt: int) -> None:
+        # Full jitter keeps retrying workers from hitting the gateway in lockstep
+        time.sleep(random.uniform(0, self.backoff * (2 ** attempt)))
+
+    def post(self, path: str, payload) -> dict:
+        """POSTs JSON to a Bakong endpoint and returns the decoded body. Raises BakongUnavailable."""
+        self._count('requests')
+        if not self.breaker.allow():
+            self._count('short_circuited')
+            raise BakongUnavailable("Bakong gateway is unavailable; try again shortly.")
+
+        error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self._count('retries')
+                self._sleep_before_retry(attempt - 1)
+            self._count('attempts')
+            started = time.perf_counter()
+            try:
+                response = self.session.post(f"{self.base_url}/{path.lstrip('/')}", json=payload, timeout=self.timeout)
+            except requests.RequestException as e:
+                error = f"Failed to reach Bakong API: {str(e)}"
+                continue
+            finally:
+                with self._lock:
+                    self._latencies.append((time.perf_counter() - started) * 1000)
+
+            if response.status_code in RETRY_STATUSES:
+                error = f"Bakong service returned error {response.status_code}"
+                continue
+            if not response.ok:
+                # Client errors are ours to fix; retrying or tripping the breaker won't help
+                self.breaker.record_success()
+                self._count('failures')
+                raise BakongUnavailable(f"Bakong service returned error {response.status_code}")
+
+            self.breaker.record_success()
+            self._count('successes')
+            return response.json()
+
+        self.breaker.record_failure()
+        self._count('failures')
+        raise BakongUnavailable(error)
+
+    def check_md5(self, md5: str) -> dict:
+        return self.post('check_transaction_by_md5', {"md5": md5})
+
+    def check_md5_list(self, md5s: list) -> dict:
+        return self.post('check_transaction_by_md5_list', list(md5s))
+
+    def stats(self) -> dict:
+        """Request, error and latency counters for this process."""
+        with self._lock:
+            counters = dict(self._counters)
+            latencies = sorted(self._latencies)
+
+        def percentile(share: float):
+            return round(latencies[min(int(len(latencies) * share), len(latencies) - 1)], 1) if latencies else None
+
+        return {
+            **counters,
+            'circuit': self.breaker.state,
+            'consecutive_failures': self.breaker.failures,
+            'latency_ms': {
+                'samples': len(latencies),
+                'p50': percentile(0.5),
+                'p95': percentile(0.95),
+                'p99': percentile(0.99),
+                'max': round(latencies[-1], 1) if latencies else None,
+            },
+        }
+
+
+class LocalBakongClient(HttpBakongClient):
+    """
+    In-memory stand-in for the Bakong gateway. Hashes passed to mark_paid() are
+    reported as paid; everything else as not found. QR payloads are still built
+    with the real KHQR library, which works offline.
+    """
+
+    def __init__(self, paid=None):
+        super().__init__(base_url='http://bakong.local', token='local', account=None)
+        self.paid = set(paid or ())
+
+    def mark_paid(self, md5: str) -> None:
+        self.paid.add(md5)
+
+    @staticmethod
+    def _transaction(md5: str) -> dict:
+        return {'hash': f'local-{md5[:8]}', 'fromAccountId': 'payer@local', 'toAccountId': 'merchant@local'}
+
+    def post(self, path: str, payload) -> dict:
+        self._count('requests')
+        self._count('successes')
+        if path == 'check_transaction_by_md5':
+            md5 = payload.get('md5')
+            if md5 in self.paid:
+                return {'responseCode': 0, 'responseMessage': 'Success', 'data': self._transaction(md5)}
+            return {'responseCode': 1, 'responseMessage': 'Transaction could not be found.', 'errorCode': 1}
+
+        items = [
+            {'md5': md5, 'status': 'SUCCESS', 'message': None, 'data': self._transaction(md5)} if md5 in self.paid
+            else {'md5': md5, 'status': 'NOT_FOUND', 'message': 'Transaction could not be found.', 'data': None}
+            for md5 in payload
+        ]
+        paid = any(item['status'] == 'SUCCESS' for item in items)
+        return {'responseCode': 0 if paid else 1, 'responseMessage': 'Success' if paid else 'Transaction could not be found.', 'data': items}
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_bakong_client():
+    """
+    Returns the process-wide Bakong client. BAKONG_CLIENT may name a custom class
+    (e.g. 'app.utils.bakong_client.LocalBakongClient'); otherwise HttpBakongClient.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                client_path = getattr(settings, 'BAKONG_CLIENT', '')
+                _client = import_string(client_path)() if client_path else HttpBakongClient()
+    return _client
+
+
+def set_bakong_client(client) -> None:
+    """Replaces the process-wide Bakong client (e.g. with a LocalBakongClient in tests)."""
+    global _client
+    with _client_lock:
+        _client = client
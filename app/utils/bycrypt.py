@@ -1,8 +1,71 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
+from django.conf import settings
 
-def hash_password(password: str) -> str:
-    hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
-    return hashed_password.decode('utf-8')
+_executor = None
+_executor_lock = threading.Lock()
 
-def check_password(password: str, hashed_password: str) -> bool:
+
+def get_rounds() -> int:
+    """Target bcrypt work factor (BCRYPT_ROUNDS setting)."""
+    return getattr(settings, 'BCRYPT_ROUNDS', 12)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Bounded pool that all hashing runs on. It caps how many bcrypt computations
+    run at once, so a login storm queues here instead of saturating every worker.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, 'BCRYPT_MAX_WORKERS', 4),
+                    thread_name_prefix='bcrypt',
+                )
+    return _executor
+
+
+def _hash(password: str, rounds: int) -> str:
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=rounds)).decode('utf-8')
+
+
+def _check(password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+
+def hash_password(password: str, rounds: int = None) -> str:
+    return _get_executor().submit(_hash, password, rounds or get_rounds()).result()
+
+
+def check_password(password: str, hashed_password: str) -> bool:
+    return _get_executor().submit(_check, password, hashed_password).result()
+
+
+async def ahash_password(password: str, rounds: int = None) -> str:
+    """Async variant of hash_password; awaits the pool so the event loop is never blocked."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), _hash, password, rounds or get_rounds())
+
+
+async def acheck_password(password: str, hashed_password: str) -> bool:
+    """Async variant of check_password."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), _check, password, hashed_password)
+
+
+def get_hash_rounds(hashed_password: str):
+    """Extracts the cost from a '$2b$12$...' hash, or None if it is not a bcrypt hash."""
+    try:
+        return int(hashed_password.split('$')[2])
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """True when the stored hash was made with a cost other than the current target."""
+    return get_hash_rounds(hashed_password) != get_rounds()
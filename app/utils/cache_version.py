@@ -0,0 +1,34 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+VERSION_KEY = 'version:{name}'
+
+
+def get_version(name: str) -> int:
+    """
+    Returns the current version of a named cache namespace. Cached entries are
+    keyed by this version, so bumping it invalidates them all at once.
+    """
+    key = VERSION_KEY.format(name=name)
+    version = cache.get(key)
+    if version is None:
+        # Seed from the clock so a lost key never resurrects an old version.
+        version = int(time.time() * 1000)
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key, version)
+    return version
+
+
+def _bump(name: str) -> None:
+    key = VERSION_KEY.format(name=name)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, int(time.time() * 1000), timeout=None)
+
+
+def bump_version(name: str) -> None:
+    """Invalidates a namespace once the surrounding transaction (if any) commits."""
+    transaction.on_commit(lambda: _bump(name))
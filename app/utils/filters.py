@@ -0,0 +1,143 @@
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import models
+from django.utils import timezone
+
+# Operator groups for FilterSchema field declarations
+EQUALITY = ('exact', 'in')
+RANGE = ('exact', 'in', 'gt', 'gte', 'lt', 'lte', 'range')
+PREFIX = ('exact', 'in', 'istartswith')
+NULLABLE = ('isnull',)
+
+MAX_IN_VALUES = 500
+
+
+class FilterSchema:
+    """
+    Per-resource whitelist for the `filters` JSON of the paginated list endpoints.
+
+    Only declared fields and operators are accepted, so clients can no longer
+    trigger arbitrary joins or unindexed lookups; any other lookup (e.g. a
+    substring match) is rejected. Foreign keys are filtered on their local
+    `<name>_id` column (`event` / `event__id` are rewritten to it), and
+    `<datetime>__date` becomes a half-open range instead of DATE(column).
+    """
+
+    def __init__(self, model, fields: dict, aliases: dict = None, sortable: tuple = ()):
+        self.model = model
+        self.fields = fields
+        self.aliases = aliases or {}
+        self.sortable = set(sortable) | {'id', 'pk'}
+
+    def _model_field(self, name: str):
+        try:
+            return self.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            # `<fk>_id` columns are looked up by their attname
+            for field in self.model._meta.concrete_fields:
+                if field.attname == name:
+                    return field
+            raise
+
+    def _coerce(self, name: str, value):
+        field = self._model_field(name)
+        if isinstance(field, models.ForeignKey):
+            field = field.target_field
+        if value is None:
+            raise ValueError(f"Filter '{name}' does not accept null; use '{name}__isnull'.")
+        try:
+            return field.to_python(value)
+        except ValidationError as e:
+            raise ValueError(f"Invalid value for filter '{name}': {'; '.join(e.messages)}")
+
+    def _split(self, key: str):
+        key = self.aliases.get(key, key)
+        if key in self.fields:
+            return key, 'exact'
+        name, _, op = key.rpartition('__')
+        name = self.aliases.get(name, name)
+        if name not in self.fields:
+            allowed = ', '.join(sorted(self.fields))
+            raise ValueError(f"Filtering on '{key}' is not allowed. Allowed fields: {allowed}.")
+        return name, op
+
+    def _compile_one(self, key: str, value, rewrites: list) -> dict:
+        name, op = self._split(key)
+        allowed = self.fields[name]
+
+        if op == 'date' and 'range' in allowed and isinstance(self._model_field(name), models.DateTimeField):
+            day = self._coerce_date(name, value)
+            start = datetime.combine(day, time.min)
+            if settings.USE_TZ:
+                start = timezone.make_aware(start)
+            rewrites.append(f'{key} -> {name}__gte/{name}__lt')
+            return {f'{name}__gte': start, f'{name}__lt': start + timedelta(days=1)}
+
+        if op not in allowed:
+            raise ValueError(
+                f"Operator '{op}' is not allowed on '{name}'. Allowed: {', '.join(allowed)}."
+            )
+
+        if op == 'isnull':
+            return {f'{name}__isnull': bool(value)}
+        if op == 'in':
+            if not isinstance(value, (list, tuple)) or not value:
+                raise ValueError(f"Filter '{key}' expects a non-empty list.")
+            if len(value) > MAX_IN_VALUES:
+                raise ValueError(f"Filter '{key}' accepts at most {MAX_IN_VALUES} values.")
+            return {f'{name}__in': [self._coerce(name, v) for v in value]}
+        if op == 'range':
+            if not isinstance(value, (list, tuple)) or len(value) != 2:
+                raise ValueError(f"Filter '{key}' expects a [start, end] list.")
+            return {f'{name}__range': [self._coerce(name, v) for v in value]}
+        if op == 'istartswith':
+            if not isinstance(value, str) or not value:
+                raise ValueError(f"Filter '{key}' expects a non-empty string.")
+            return {f'{name}__istartswith': value}
+        if op == 'exact':
+            return {name: self._coerce(name, value)}
+        return {f'{name}__{op}': self._coerce(name, value)}
+
+    def _coerce_date(self, name: str, value):
+        try:
+            return models.DateField().to_python(value)
+        except ValidationError as e:
+            raise ValueError(f"Invalid value for filter '{name}__date': {'; '.join(e.messages)}")
+
+    def compile(self, filters: dict):
+        """
+        Validates `filters` and returns (lookups, rewrites): the ORM lookups to apply
+        and a description of every lookup that was rewritten.
+        """
+        if not filters:
+            return {}, []
+        if not isinstance(filters, dict):
+            raise ValueError('filters must be a JSON object.')
+
+        lookups, rewrites = {}, []
+        for key, value in filters.items():
+            lookups.update(self._compile_one(key, value, rewrites))
+        return lookups, rewrites
+
+    def validate_sort(self, sort_by: str) -> None:
+        if sort_by and sort_by not in self.sortable:
+            allowed = ', '.join(sorted(self.sortable))
+            raise ValueError(f"Sorting by '{sort_by}' is not allowed. Allowed: {allowed}.")
+
+    def apply(self, queryset, params: dict):
+        """
+        Applies the validated `filters` of a PaginationRequest to `queryset` and checks
+        its `sort_by`. Returns (queryset, plan); pass the plan to paginate_queryset so
+        it can be reported when FILTER_EXPLAIN is on.
+        """
+        lookups, rewrites = self.compile(params.get('filters'))
+        self.validate_sort(params.get('sort_by'))
+        if lookups:
+            queryset = queryset.filter(**lookups)
+        plan = {
+            'filters': {key: str(value) for key, value in lookups.items()},
+            'rewrites': rewrites,
+        }
+        return queryset, plan
@@ -0,0 +1,264 @@
+import hashlib
+import logging
+import secrets
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections
+
+from app.models.event import Event
+from app.models.event_ticket import EventTicket
+from app.utils.ticket_codes import verify_ticket_code
+
+logger = logging.getLogger(__name__)
+
+# Shared registry of {event id: load stamp} every gate worker keeps an index of
+EVENTS_KEY = 'gate:events'
+# Held while a load or unload rewrites EVENTS_KEY, so concurrent changes are not lost
+EVENTS_LOCK_KEY = 'gate:events:lock'
+EVENTS_LOCK_TIMEOUT = 10
+# Status written through by whichever worker changed it, read by all of them
+STATUS_KEY = 'gate:status:{code_hash:016x}'
+
+STATUSES = ('UNUSED', 'USED', 'REVOKED')
+STATUS_CODES = {name: code for code, name in enumerate(STATUSES)}
+
+
+def code_hash(ticket_code: str) -> int:
+    """64-bit hash of a ticket code; at 100k tickets a collision is a ~1e-10 chance."""
+    return int.from_bytes(hashlib.blake2b(ticket_code.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+class GateIndex:
+    """
+    Compact in-memory index of one event's issued tickets for gate scans.
+    Tickets are stored as parallel arrays sorted by code hash (8 + 1 + 4 + 2 + 4
+    bytes per ticket) and looked up by binary search; ticket types and customer
+    names are stored once each and referenced by position.
+    """
+
+    def __init__(self, event_id: int, event_name: str, rows: list, ticket_types: list, customer_names: list,
+                 build_seconds: float = 0.0):
+        rows.sort()
+        self.event_id = event_id
+        self.event_name = event_name
+        self.hashes = array('Q', (row[0] for row in rows))
+        self.statuses = bytearray(row[1] for row in rows)
+        self.booking_ids = array('I', (row[2] for row in rows))
+        self.ticket_types = array('H', (row[3] for row in rows))
+        self.customers = array('I', (row[4] for row in rows))
+        self.ticket_type_names = ticket_types
+        self.customer_names = customer_names
+        self.build_seconds = build_seconds
+        self.loaded_at = time.time()
+
+    @classmethod
+    def build(cls, event_id: int) -> 'GateIndex':
+        """Loads every active ticket of an event with one streamed query."""
+        started = time.perf_counter()
+        event_name = Event.objects.filter(pk=event_id).values_list('event_name', flat=True).first()
+        if event_name is None:
+            raise Event.DoesNotExist(f"Event with id {event_id} does not exist.")
+
+        ticket_types, customer_names, rows = {}, {}, []
+        tickets = EventTicket.objects.filter(
+            booking__event_id=event_id, booking__is_deleted=False, is_deleted=False,
+        ).values_list(
+            'ticket_code', 'status', 'booking_id', 'booking__ticket__ticket_type',
+            'booking__customer__first_name', 'booking__customer__last_name',
+        )
+        for ticket_code, status, booking_id, ticket_type, first_name, last_name in tickets.iterator(chunk_size=5000):
+            rows.append((
+                code_hash(ticket_code),
+                STATUS_CODES.get(status, 0),
+                booking_id,
+                ticket_types.setdefault(ticket_type or '-', len(ticket_types)),
+                customer_names.setdefault(f"{first_name} {last_name}", len(customer_names)),
+            ))
+        return cls(event_id, event_name, rows, list(ticket_types), list(customer_names), time.perf_counter() - started)
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def position(self, key: int) -> int:
+        """Index of a code hash, or -1."""
+        position = bisect_left(self.hashes, key)
+        if position < len(self.hashes) and self.hashes[position] == key:
+            return position
+        return -1
+
+    def entry(self, position: int) -> dict:
+        return {
+            'event_id': self.event_id,
+            'event_name': self.event_name,
+            'booking_id': self.booking_ids[position],
+            'customer_name': self.customer_names[self.customers[position]],
+            'ticket_type': self.ticket_type_names[self.ticket_types[position]],
+            'status': STATUSES[self.statuses[position]],
+        }
+
+    def nbytes(self) -> int:
+        arrays = sum(len(values) * values.itemsize for values in (self.hashes, self.booking_ids, self.ticket_types, self.customers))
+        strings = sum(sys.getsizeof(name) for name in self.customer_names + self.ticket_type_names)
+        lists = sys.getsizeof(self.customer_names) + sys.getsizeof(self.ticket_type_names)
+        return arrays + len(self.statuses) + strings + lists
+
+    def stats(self) -> dict:
+        nbytes = self.nbytes()
+        return {
+            'event_id': self.event_id,
+            'tickets': len(self),
+            'used': len(self) - self.statuses.count(STATUS_CODES['UNUSED']),
+            'bytes': nbytes,
+            'bytes_per_100k_tickets': round(nbytes / len(self) * 100_000) if len(self) else 0,
+            'build_seconds': round(self.build_seconds, 3),
+            'loaded_at': self.loaded_at,
+        }
+
+
+_indexes = {}
+_building = set()
+_lock = threading.Lock()
+_synced_at = 0.0
+
+
+def _ttl() -> int:
+    return getattr(settings, 'GATE_INDEX_TTL', 86400)
+
+
+def _update_registry(change):
+    """
+    Applies `change` to the shared registry dict under EVENTS_LOCK_KEY and stores
+    it; returns what `change` returns.
+    """
+    token = secrets.token_hex(16)
+    deadline = time.monotonic() + EVENTS_LOCK_TIMEOUT
+    while not cache.add(EVENTS_LOCK_KEY, token, timeout=EVENTS_LOCK_TIMEOUT):
+        if time.monotonic() >= deadline:
+            raise RuntimeError('The gate index registry is locked by another load or unload.')
+        time.sleep(0.05)
+    try:
+        registered = cache.get(EVENTS_KEY) or {}
+        result = change(registered)
+        cache.set(EVENTS_KEY, registered, timeout=_ttl())
+        return result
+    finally:
+        # The lock may have expired and been taken by another worker meanwhile
+        if cache.get(EVENTS_LOCK_KEY) == token:
+            cache.delete(EVENTS_LOCK_KEY)
+
+
+def _build_in_background(event_id: int) -> None:
+    try:
+        close_old_connections()
+        index = GateIndex.build(event_id)
+        with _lock:
+            _indexes[event_id] = index
+    except Exception:
+        logger.exception("Gate index build failed for event %s", event_id)
+    finally:
+        with _lock:
+            _building.discard(event_id)
+        close_old_connections()
+
+
+def _sync() -> None:
+    """
+    Follows the shared registry at most every GATE_INDEX_SYNC_INTERVAL seconds:
+    builds indexes other workers loaded (on a background thread; scans fall back
+    to the database meanwhile) and drops the ones they unloaded.
+    """
+    global _synced_at
+    now = time.monotonic()
+    if now - _synced_at < getattr(settings, 'GATE_INDEX_SYNC_INTERVAL', 5):
+        return
+    _synced_at = now
+    registered = cache.get(EVENTS_KEY) or {}
+    with _lock:
+        for event_id in [event_id for event_id in _indexes if event_id not in registered]:
+            del _indexes[event_id]
+        for event_id, stamp in registered.items():
+            index = _indexes.get(event_id)
+            if event_id in _building or (index is not None and index.loaded_at >= stamp):
+                continue
+            _building.add(event_id)
+            threading.Thread(
+                target=_build_in_background, args=(event_id,), name=f'gate-index-{event_id}', daemon=True,
+            ).start()
+
+
+def load_gate_index(event_id: int) -> GateIndex:
+    """
+    Builds an event's index in this process and registers it so every other gate
+    worker builds its own copy on its next scan. Loading again re-snapshots it.
+    """
+    index = GateIndex.build(event_id)
+    with _lock:
+        _indexes[event_id] = index
+    _update_registry(lambda registered: registered.update({event_id: index.loaded_at}))
+    return index
+
+
+def unload_gate_index(event_id: int) -> bool:
+    """Drops an event's index here and, within GATE_INDEX_SYNC_INTERVAL, in every worker."""
+    found = _update_registry(lambda registered: registered.pop(event_id, None) is not None)
+    with _lock:
+        found = _indexes.pop(event_id, None) is not None or found
+    return found
+
+
+def get_gate_index(event_id: int) -> Optional[GateIndex]:
+    return _indexes.get(event_id)
+
+
+def find_ticket(ticket_code: str) -> Optional[dict]:
+    """
+    Looks a ticket up in the loaded gate indexes: the event a signed code names,
+    otherwise each one. Returns its entry (event, booking, customer, ticket type and
+    current status, including changes written through by other workers), or None
+    when no index holds it and the caller should ask the database.
+    """
+    _sync()
+    if not _indexes:
+        return None
+    claims = verify_ticket_code(ticket_code)
+    if claims is not None:
+        index = _indexes.get(claims.event_id)
+        candidates = [index] if index is not None else []
+    else:
+        candidates = list(_indexes.values())
+
+    key = code_hash(ticket_code)
+    for index in candidates:
+        position = index.position(key)
+        if position < 0:
+            continue
+        shared = cache.get(STATUS_KEY.format(code_hash=key))
+        if shared is not None:
+            index.statuses[position] = shared
+        return index.entry(position)
+    return None
+
+
+def record_ticket_status(ticket_code: str, status: str) -> None:
+    """
+    Writes a committed status change (UNUSED, USED or REVOKED) through to this
+    worker's indexes and the shared cache, so other gate workers see it on their
+    next lookup of the ticket. The shared key is always written, even before this
+    worker has seen an index registered, so an index loaded (or still building)
+    elsewhere never misses the change.
+    """
+    _sync()
+    key = code_hash(ticket_code)
+    code = STATUS_CODES[status]
+    cache.set(STATUS_KEY.format(code_hash=key), code, timeout=_ttl())
+    for index in list(_indexes.values()):
+        position = index.position(key)
+        if position >= 0:
+            index.statuses[position] = code
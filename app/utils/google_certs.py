@@ -0,0 +1,98 @@
+import json
+import re
+import threading
+import time
+
+import requests
+from django.conf import settings
+from django.utils.module_loading import import_string
+from requests.adapters import HTTPAdapter
+
+GOOGLE_CERTS_URL = 'https://www.googleapis.com/oauth2/v1/certs'
+DEFAULT_MAX_AGE = 3600
+
+_MAX_AGE_RE = re.compile(r'max-age=(\d+)')
+
+
+class HttpGoogleCertSource:
+    """
+    Fetches Google's public signing certificates over a pooled session and keeps
+    them in process until the Cache-Control max-age Google sent has elapsed.
+    """
+
+    def __init__(self, url: str = GOOGLE_CERTS_URL, timeout: float = 5):
+        self.url = url
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=10))
+        self._certs = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _max_age(response) -> int:
+        match = _MAX_AGE_RE.search(response.headers.get('Cache-Control', ''))
+        return int(match.group(1)) if match else DEFAULT_MAX_AGE
+
+    def get_certs(self, force_refresh: bool = False) -> dict:
+        if not force_refresh and self._certs is not None and time.monotonic() < self._expires_at:
+            return self._certs
+
+        with self._lock:
+            # Another thread may have refreshed while we waited for the lock
+            if not force_refresh and self._certs is not None and time.monotonic() < self._expires_at:
+                return self._certs
+
+            response = self.session.get(self.url, timeout=self.timeout)
+            if not response.ok:
+                raise ValueError(f'Could not fetch Google certificates: {response.status_code}')
+            self._certs = response.json()
+            self._expires_at = time.monotonic() + self._max_age(response)
+            return self._certs
+
+
+class LocalGoogleCertSource:
+    """
+    Serves certificates from a dict or a JSON file of {kid: PEM certificate}.
+    Lets the verification path run offline against self-signed test tokens.
+    """
+
+    def __init__(self, certs: dict = None, path: str = None):
+        if certs is None and path:
+            with open(path) as fh:
+                certs = json.load(fh)
+        self._certs = certs or {}
+
+    def get_certs(self, force_refresh: bool = False) -> dict:
+        return self._certs
+
+
+_source = None
+_source_lock = threading.Lock()
+
+
+def get_cert_source():
+    """
+    Returns the process-wide certificate source. GOOGLE_CERT_SOURCE may name a
+    custom class; otherwise GOOGLE_CERTS_FILE selects the local source.
+    """
+    global _source
+    if _source is None:
+        with _source_lock:
+            if _source is None:
+                source_path = getattr(settings, 'GOOGLE_CERT_SOURCE', '')
+                certs_file = getattr(settings, 'GOOGLE_CERTS_FILE', '')
+                if source_path:
+                    _source = import_string(source_path)()
+                elif certs_file:
+                    _source = LocalGoogleCertSource(path=certs_file)
+                else:
+                    _source = HttpGoogleCertSource()
+    return _source
+
+
+def set_cert_source(source) -> None:
+    """Replaces the process-wide certificate source (e.g. with a LocalGoogleCertSource in tests)."""
+    global _source
+    with _source_lock:
+        _source = source
@@ -0,0 +1,123 @@
+import hashlib
+import json
+import secrets
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+
+from app.utils.api_response import api_response
+from app.utils.principal import principal_key
+
+HEADER = 'Idempotency-Key'
+RESULT_KEY = 'idem:{scope}:{principal}:{key}'
+LOCK_KEY = 'idem:{scope}:{principal}:{key}:lock'
+MAX_KEY_LENGTH = 255
+
+
+def _fingerprint(request) -> str:
+    body = json.dumps(request.data, sort_keys=True, default=str)
+    return hashlib.sha256(f'{request.method} {request.path}\n{body}'.encode('utf-8')).hexdigest()
+
+
+def _principal(request) -> str:
+    """
+    Caller namespace for keys. Guests have no identity of their own, so their keys
+    are scoped by client address and the booking they act on instead of being shared.
+    """
+    if getattr(request.user, 'is_authenticated', False):
+        return principal_key(request.user)
+    data = request.data if hasattr(request.data, 'get') else {}
+    guest = f"{request.META.get('REMOTE_ADDR', '')}|{data.get('booking_id', '')}"
+    return f"anonymous:{hashlib.sha256(guest.encode('utf-8')).hexdigest()[:32]}"
+
+
+def _replay(stored: dict):
+    response = api_response(
+        data=stored['data'],
+        message=stored['message'],
+        success=stored['success'],
+        status_code=stored['status'],
+    )
+    response['Idempotent-Replayed'] = 'true'
+    return response
+
+
+def idempotent(scope: str):
+    """
+    Makes an APIView handler safe to retry with an `Idempotency-Key` header.
+
+    The first successful (2xx) response is stored for IDEMPOTENCY_TTL seconds and
+    replayed for repeats with the same key from the same caller (for guests: the
+    same client address and booking). A duplicate that arrives while the first
+    request is still running waits for its result instead of redoing the work.
+    Reusing a key with a different body is rejected with 422. Failed attempts are
+    not stored, so they can be retried with the same key. Requests without the
+    header run as before.
+    """
+    def decorator(handler):
+        @wraps(handler)
+        def wrapper(view, request, *args, **kwargs):
+            key = request.headers.get(HEADER)
+            if not key:
+                return handler(view, request, *args, **kwargs)
+            if len(key) > MAX_KEY_LENGTH:
+                return api_response(
+                    message=f"{HEADER} must be at most {MAX_KEY_LENGTH} characters.",
+                    success=False,
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                )
+
+            names = {'scope': scope, 'principal': _principal(request), 'key': hashlib.sha256(key.encode('utf-8')).hexdigest()}
+            result_key, lock_key = RESULT_KEY.format(**names), LOCK_KEY.format(**names)
+            fingerprint = _fingerprint(request)
+            lock_timeout = getattr(settings, 'IDEMPOTENCY_LOCK_TIMEOUT', 30)
+            deadline = time.monotonic() + getattr(settings, 'IDEMPOTENCY_WAIT_TIMEOUT', 10)
+            delay = 0.05
+            token = secrets.token_hex(16)
+
+            while True:
+                stored = cache.get(result_key)
+                if stored is not None:
+                    if stored['fingerprint'] != fingerprint:
+                        return api_response(
+                            message=f"{HEADER} was already used with a different request.",
+                            success=False,
+                            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                        )
+                    return _replay(stored)
+
+                if cache.add(lock_key, token, timeout=lock_timeout):
+                    break
+
+                # Another request with this key is in flight: wait for its result
+                if time.monotonic() >= deadline:
+                    return api_response(
+                        message=f"A request with this {HEADER} is still in progress; retry later.",
+                        success=False,
+                        status_code=status.HTTP_409_CONFLICT,
+                    )
+                time.sleep(delay)
+                delay = min(delay * 2, 0.5)
+
+            try:
+                response = handler(view, request, *args, **kwargs)
+                if 200 <= response.status_code < 300:
+                    data = response.data or {}
+                    cache.set(result_key, {
+                        'fingerprint': fingerprint,
+                        'status': response.status_code,
+                        'success': data.get('success', True),
+                        'message': data.get('message', ''),
+                        'data': data.get('data'),
+                    }, timeout=getattr(settings, 'IDEMPOTENCY_TTL', 86400))
+                return response
+            finally:
+                # After IDEMPOTENCY_LOCK_TIMEOUT the lock may belong to a newer request
+                if cache.get(lock_key) == token:
+                    cache.delete(lock_key)
+
+        return wrapper
+    return decorator
@@ -3,7 +3,8 @@ from rest_framework_simplejwt.exceptions import TokenError, InvalidToken
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from django.contrib.auth import get_user_model
 from django.conf import settings
-from app.models.customer import Customer
+from app.utils.principal import PrincipalCache
+from app.utils.token_denylist import TokenDenylist
 
 class JWTUtil:
     """
@@ -44,6 +45,8 @@ class JWTUtil:
     def get_user_from_refresh_token(refresh_token):
         try:
             refresh = RefreshToken(refresh_token)
+            if TokenDenylist.is_revoked(refresh.get('jti'), refresh.get('exp')):
+                return None
             user_id = refresh['user_id']
             User = get_user_model()
             user = User.objects.get(id=user_id)
@@ -54,27 +57,18 @@ class JWTUtil:
 class UniversalJWTAuthentication(JWTAuthentication):
     """
     Universal authenticator that handles both Customers and standard Users.
-    Identifies the model to query based on the 'type' claim in the token.
+    Identifies the model to query based on the 'type' claim in the token and
+    returns a cached AuthPrincipal rather than a model instance.
     """
     def get_user(self, validated_token):
         user_id = validated_token.get('user_id')
         if not user_id:
             return None
 
-        # Check if the token belongs to a Customer
-        if validated_token.get('type') == 'customer':
-            try:
-                customer = Customer.objects.get(id=user_id, is_deleted=False)
-                return customer
-            except Customer.DoesNotExist:
-                return None
-        
-        # Otherwise, treat as a standard User
-        try:
-            User = get_user_model()
-            return User.objects.get(id=user_id, is_active=True)
-        except User.DoesNotExist:
-            return None
+        # Customers carry a 'type' claim; everything else is a standard User.
+        # Principals are served from a short-TTL cache, so repeat requests skip the DB.
+        token_type = 'customer' if validated_token.get('type') == 'customer' else 'user'
+        return PrincipalCache.get(token_type, user_id)
 
     def authenticate(self, request):
         header = self.get_header(request)
@@ -87,6 +81,9 @@ class UniversalJWTAuthentication(JWTAuthentication):
 
         try:
             validated_token = self.get_validated_token(raw_token)
+            # Logged-out tokens are rejected from an in-memory denylist, no DB query
+            if TokenDenylist.is_revoked(validated_token.get('jti'), validated_token.get('exp')):
+                return None
             user = self.get_user(validated_token)
             if user:
                 return (user, validated_token)
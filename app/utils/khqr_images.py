@@ -0,0 +1,83 @@
+import base64
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+
+from app.utils.bakong_client import get_bakong_client
+
+
+class QRImageCache:
+    """
+    Bounded in-process LRU of rendered KHQR PNGs keyed by md5. The md5 is the hash
+    of the KHQR string, so an entry never goes stale; it is only ever evicted.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._images = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, md5: str):
+        with self._lock:
+            png = self._images.get(md5)
+            if png is None:
+                self.misses += 1
+                return None
+            self._images.move_to_end(md5)
+            self.hits += 1
+            return png
+
+    def put(self, md5: str, png: bytes) -> None:
+        with self._lock:
+            self._images[md5] = png
+            self._images.move_to_end(md5)
+            while len(self._images) > self.capacity:
+                self._images.popitem(last=False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'size': len(self._images),
+                'capacity': self.capacity,
+                'bytes': sum(len(png) for png in self._images.values()),
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_qr_image_cache() -> QRImageCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = QRImageCache(getattr(settings, 'KHQR_IMAGE_CACHE_SIZE', 512))
+    return _cache
+
+
+def render_qr_png(qr_string: str) -> bytes:
+    """Renders a KHQR string to PNG bytes (uncached)."""
+    data_uri = get_bakong_client().khqr.qr_image(qr_string, format='base64_uri')
+    return base64.b64decode(data_uri.split(',', 1)[1])
+
+
+def qr_png(md5: str, load_qr):
+    """
+    PNG for a KHQR md5, served from the LRU. On a miss load_qr(md5) supplies the
+    KHQR string to render; returns None when it finds none.
+    """
+    cache = get_qr_image_cache()
+    png = cache.get(md5)
+    if png is None:
+        qr_string = load_qr(md5)
+        if not qr_string:
+            return None
+        png = render_qr_png(qr_string)
+        cache.put(md5, png)
+    return png
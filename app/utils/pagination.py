@@ -0,0 +1,185 @@
+import base64
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
+from django.db.models import Q
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _resolve_attr(obj, path: str):
+    """Reads a possibly related '__' path (e.g. 'event__event_name') from a model instance."""
+    for part in path.split('__'):
+        if obj is None:
+            return None
+        obj = getattr(obj, part)
+    return obj
+
+
+def encode_cursor(sort_by: str, sort_order: str, value, pk) -> str:
+    payload = json.dumps({'s': sort_by, 'o': sort_order, 'k': _encode_value(value), 'id': pk}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> dict:
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        if not isinstance(payload, dict) or 'id' not in payload:
+            raise ValueError
+        return payload
+    except (ValueError, TypeError, UnicodeError):
+        raise ValueError('Invalid cursor.')
+
+
+def _seek_filter(sort_by: str, descending: bool, value, pk) -> Q:
+    """
+    WHERE clause selecting rows strictly after (value, pk) in (sort_by, pk) order.
+    NULLs sort first ascending and last descending, as on MySQL.
+    """
+    pk_after = Q(pk__lt=pk) if descending else Q(pk__gt=pk)
+    if sort_by in ('id', 'pk'):
+        return pk_after
+
+    if value is None:
+        same_key = Q(**{f'{sort_by}__isnull': True}) & pk_after
+        return same_key if descending else same_key | Q(**{f'{sort_by}__isnull': False})
+
+    lookup = 'lt' if descending else 'gt'
+    after = Q(**{f'{sort_by}__{lookup}': value}) | (Q(**{sort_by: value}) & pk_after)
+    if descending:
+        after |= Q(**{f'{sort_by}__isnull': True})
+    return after
+
+
+def _explain(queryset, plan: dict) -> dict:
+    """Adds the final SQL and the database's EXPLAIN output to a FilterSchema plan."""
+    plan = dict(plan)
+    try:
+        plan['sql'] = str(queryset.query)
+        plan['explain'] = queryset.explain()
+    except Exception as e:
+        plan['explain'] = f'unavailable: {e}'
+    return plan
+
+
+def paginate_queryset(queryset, params: dict, default_limit: int = 100, default_sort: str = 'id',
+                      default_order: str = 'asc', leading_ordering: tuple = (), plan: dict = None) -> dict:
+    """
+    Shared paginator for the get_paginated_* services.
+
+    Offset mode (default) orders by `leading_ordering` + sort_by and returns the page
+    number and exact total, clamping out-of-range pages like Django's Paginator.
+    Cursor mode (`pagination_mode='cursor'` or a `cursor` param) orders by (sort_by, pk),
+    seeks past the cursor with an indexed WHERE clause instead of an OFFSET, and
+    returns an opaque `next_cursor`. Either mode skips the COUNT(*) when
+    `include_total` is false.
+
+    Returns a dict with items, total, page, limit, mode and next_cursor. When a
+    FilterSchema `plan` is given and FILTER_EXPLAIN is on, the page query's plan is
+    added under `plan`.
+    """
+    explain = plan is not None and getattr(settings, 'FILTER_EXPLAIN', False)
+    limit = int(params.get('limit') or default_limit)
+    sort_by = params.get('sort_by') or default_sort
+    sort_order = (params.get('sort_order') or default_order).lower()
+    descending = sort_order == 'desc'
+    include_total = params.get('include_total', True)
+    cursor = params.get('cursor')
+    prefix = '-' if descending else ''
+
+    if cursor or params.get('pagination_mode') == 'cursor':
+        queryset = queryset.order_by(f'{prefix}{sort_by}', f'{prefix}pk')
+        total = queryset.count() if include_total else None
+
+        if cursor:
+            position = decode_cursor(cursor)
+            if position.get('s') != sort_by or position.get('o') != sort_order:
+                raise ValueError('Cursor does not match the requested sort order.')
+            queryset = queryset.filter(_seek_filter(sort_by, descending, position.get('k'), position['id']))
+
+        page_query = queryset[:limit + 1]
+        rows = list(page_query)
+        items = rows[:limit]
+        next_cursor = None
+        if len(rows) > limit:
+            last = items[-1]
+            next_cursor = encode_cursor(sort_by, sort_order, _resolve_attr(last, sort_by), last.pk)
+
+        result = {
+            'items': items,
+            'total': total,
+            'page': None,
+            'limit': limit,
+            'mode': 'cursor',
+            'next_cursor': next_cursor,
+        }
+        if explain:
+            result['plan'] = _explain(page_query, plan)
+        return result
+
+    queryset = queryset.order_by(*leading_ordering, f'{prefix}{sort_by}')
+    page = params.get('page') or 1
+
+    if not include_total:
+        page = max(int(page), 1)
+        offset = (page - 1) * limit
+        page_query = queryset[offset:offset + limit]
+        result = {
+            'items': list(page_query),
+            'total': None,
+            'page': page,
+            'limit': limit,
+            'mode': 'offset',
+            'next_cursor': None,
+        }
+        if explain:
+            result['plan'] = _explain(page_query, plan)
+        return result
+
+    paginator = Paginator(queryset, limit)
+    try:
+        page_obj = paginator.page(page)
+    except PageNotAnInteger:
+        page_obj = paginator.page(1)
+    except EmptyPage:
+        page_obj = paginator.page(paginator.num_pages)
+
+    result = {
+        'items': list(page_obj.object_list),
+        'total': paginator.count,
+        'page': page_obj.number,
+        'limit': limit,
+        'mode': 'offset',
+        'next_cursor': None,
+    }
+    if explain:
+        result['plan'] = _explain(page_obj.object_list, plan)
+    return result
+
+
+def page_response(page: dict, data, data_key: str = 'data') -> dict:
+    """
+    Builds the standard paginated payload; `next_cursor` is only included in cursor
+    mode and `plan` only when the page carries one (FILTER_EXPLAIN).
+    """
+    response = {
+        data_key: data,
+        'total': page['total'],
+        'page': page['page'],
+        'limit': page['limit'],
+    }
+    if page['mode'] == 'cursor':
+        response['next_cursor'] = page['next_cursor']
+    if 'plan' in page:
+        response['plan'] = page['plan']
+    return response
@@ -0,0 +1,203 @@
+import asyncio
+import logging
+import queue
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+EVENT_KEY = 'payment_events:{md5}'
+
+
+class _Subscription:
+    """One waiter for status changes of one payment md5, on a thread or an event loop."""
+
+    def __init__(self, md5: str, loop=None):
+        self.md5 = md5
+        self.loop = loop
+        self.queue = asyncio.Queue() if loop else queue.Queue()
+
+    def deliver(self, status: str) -> None:
+        if self.loop:
+            self.loop.call_soon_threadsafe(self.queue.put_nowait, status)
+        else:
+            self.queue.put_nowait(status)
+
+    def get(self, timeout: float):
+        """Blocks until a change arrives; returns its status, or None on timeout."""
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    async def aget(self, timeout: float):
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class LocalPaymentEventBackend:
+    """Delivers events inside this process only (single-worker deployments)."""
+
+    def start(self, hub) -> None:
+        pass
+
+    def publish(self, md5: str, status: str) -> None:
+        pass
+
+    def baseline(self, md5: str) -> None:
+        pass
+
+
+class CachePaymentEventBackend:
+    """
+    Relays events between processes through the shared cache. publish() stamps
+    the md5's event key; one thread per process reads the keys of every md5 it has
+    waiters for with a single get_many every PAYMENT_EVENTS_POLL_INTERVAL seconds
+    and hands new stamps to the local hub. Needs a shared CACHE_BACKEND to reach
+    other processes; with the default per-process cache it behaves like the local one.
+    """
+
+    def __init__(self, interval: float = None):
+        self.interval = interval or getattr(settings, 'PAYMENT_EVENTS_POLL_INTERVAL', 0.5)
+        # md5 -> last stamp seen; shared by request threads and the relay thread
+        self.seen = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self, hub) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, args=(hub,), name='payment-events', daemon=True)
+            self._thread.start()
+
+    def publish(self, md5: str, status: str) -> None:
+        stamp = uuid.uuid4().hex
+        # Our own waiters were served directly; don't deliver the relayed copy to them again
+        with self._lock:
+            self.seen[md5] = stamp
+        cache.set(EVENT_KEY.format(md5=md5), (stamp, status), timeout=getattr(settings, 'PAYMENT_EVENTS_TTL', 600))
+
+    def _loop(self, hub) -> None:
+        while True:
+            time.sleep(self.interval)
+            md5s = hub.watched()
+            if not md5s:
+                continue
+            try:
+                events = cache.get_many([EVENT_KEY.format(md5=md5) for md5 in md5s])
+            except Exception:
+                logger.exception("Payment event relay failed")
+                continue
+            changed = []
+            with self._lock:
+                for md5 in md5s:
+                    event = events.get(EVENT_KEY.format(md5=md5))
+                    if event is None:
+                        continue
+                    stamp, status = event
+                    previous = self.seen.get(md5)
+                    self.seen[md5] = stamp
+                    # The first read only sets a baseline; older events were before anyone here waited
+                    if previous is not None and previous != stamp:
+                        changed.append((md5, status))
+
+                watched = set(hub.watched())
+                for md5 in list(self.seen):
+                    if md5 not in watched:
+                        self.seen.pop(md5, None)
+            for md5, status in changed:
+                hub.dispatch(md5, status)
+
+    def baseline(self, md5: str) -> None:
+        """Remembers the md5's current stamp so only later events reach a new waiter."""
+        event = cache.get(EVENT_KEY.format(md5=md5))
+        with self._lock:
+            self.seen.setdefault(md5, event[0] if event else '')
+
+
+class PaymentEventHub:
+    """
+    In-process pub/sub for payment status changes, keyed by Payment.md5.
+
+    Status writers call publish_on_commit(); every waiter for that md5 in this
+    process is woken at once, and the backend (PAYMENT_EVENTS_BACKEND) carries
+    the event to the other processes.
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend or LocalPaymentEventBackend()
+        self._subscriptions = {}
+        self._lock = threading.Lock()
+        self.backend.start(self)
+
+    def subscribe(self, md5: str, loop=None) -> _Subscription:
+        """
+        Registers a waiter. May block on the backend (a cache read); from an event loop
+        call it through sync_to_async.
+        """
+        subscription = _Subscription(md5, loop)
+        # Watched before the baseline is taken, so the relay never drops the baseline entry
+        with self._lock:
+            self._subscriptions.setdefault(md5, set()).add(subscription)
+        self.backend.baseline(md5)
+        return subscription
+
+    def unsubscribe(self, subscription: _Subscription) -> None:
+        with self._lock:
+            waiters = self._subscriptions.get(subscription.md5)
+            if waiters is not None:
+                waiters.discard(subscription)
+                if not waiters:
+                    del self._subscriptions[subscription.md5]
+
+    def watched(self) -> list:
+        with self._lock:
+            return list(self._subscriptions)
+
+    def waiting(self) -> int:
+        with self._lock:
+            return sum(len(waiters) for waiters in self._subscriptions.values())
+
+    def dispatch(self, md5: str, status: str) -> None:
+        with self._lock:
+            waiters = list(self._subscriptions.get(md5, ()))
+        for subscription in waiters:
+            subscription.deliver(status)
+
+    def publish(self, md5: str, status: str) -> None:
+        self.dispatch(md5, status)
+        try:
+            self.backend.publish(md5, status)
+        except Exception:
+            logger.exception(f"Failed to relay payment event for {md5}")
+
+    def publish_on_commit(self, md5s, status: str) -> None:
+        """Publishes `status` for each md5 once the current transaction commits."""
+        md5s = [md5 for md5 in md5s if md5]
+        if md5s:
+            transaction.on_commit(lambda: [self.publish(md5, status) for md5 in md5s])
+
+
+_hub = None
+_hub_lock = threading.Lock()
+
+
+def get_payment_event_hub() -> PaymentEventHub:
+    """
+    Returns the process-wide hub. PAYMENT_EVENTS_BACKEND names the cross-process
+    backend class; any class with start(hub), publish(md5, status) and baseline(md5) will do.
+    """
+    global _hub
+    if _hub is None:
+        with _hub_lock:
+            if _hub is None:
+                backend_path = getattr(settings, 'PAYMENT_EVENTS_BACKEND', '')
+                _hub = PaymentEventHub(import_string(backend_path)() if backend_path else None)
+    return _hub
@@ -0,0 +1,88 @@
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from app.models.role_permission import RolePermission
+from app.utils.cache_version import bump_version, get_version
+
+VERSION_NAMESPACE = 'permissions'
+ROLE_KEY = 'perm:role:{role_id}:v{version}'
+
+
+class PermissionCache:
+    """
+    Two-level cache of role -> frozenset of permission names.
+
+    The process-local layer answers warm checks without any I/O; the shared
+    Django cache lets every worker reuse a set loaded by another one. Both
+    layers are keyed by a global version which is bumped on every write to
+    roles, permissions or role-permissions, so stale sets are never served
+    for longer than PERMISSION_CACHE_LOCAL_TTL seconds.
+    """
+    _local = {}
+    _lock = threading.Lock()
+    _version = None
+    _version_checked_at = 0.0
+
+    @classmethod
+    def _local_ttl(cls) -> float:
+        return getattr(settings, 'PERMISSION_CACHE_LOCAL_TTL', 5)
+
+    @classmethod
+    def _shared_ttl(cls) -> int:
+        return getattr(settings, 'PERMISSION_CACHE_TTL', 3600)
+
+    @classmethod
+    def get_version(cls) -> int:
+        """Returns the current global version, re-reading the shared cache at most once per local TTL."""
+        now = time.monotonic()
+        if cls._version is not None and now - cls._version_checked_at < cls._local_ttl():
+            return cls._version
+
+        version = get_version(VERSION_NAMESPACE)
+        with cls._lock:
+            if version != cls._version:
+                cls._local.clear()
+            cls._version = version
+            cls._version_checked_at = now
+        return version
+
+    @classmethod
+    def get_role_permissions(cls, role_id: int) -> frozenset:
+        """Returns the permission names granted to a role."""
+        version = cls.get_version()
+        permissions = cls._local.get(role_id)
+        if permissions is not None:
+            return permissions
+
+        key = ROLE_KEY.format(role_id=role_id, version=version)
+        names = cache.get(key)
+        if names is None:
+            names = list(
+                RolePermission.objects.filter(role_id=role_id).values_list('permission__name', flat=True)
+            )
+            cache.set(key, names, timeout=cls._shared_ttl())
+
+        permissions = frozenset(names)
+        with cls._lock:
+            if cls._version == version:
+                cls._local[role_id] = permissions
+        return permissions
+
+    @classmethod
+    def _clear_local(cls) -> None:
+        with cls._lock:
+            cls._local.clear()
+            cls._version = None
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Invalidates every cached role set in this and all other processes once the
+        surrounding transaction (if any) commits.
+        """
+        bump_version(VERSION_NAMESPACE)
+        transaction.on_commit(cls._clear_local)
@@ -1,6 +1,6 @@
 # api/utils/permissions.py
 from django.contrib.auth import get_user_model
-from app.models.role_permission import RolePermission
+from app.utils.permission_cache import PermissionCache
 from functools import wraps # Still needed for other decorators if any
 from django.http import HttpResponseForbidden # Still needed if CheckPermission or has_permission could return it
 from rest_framework import permissions # For DRF permission class
@@ -10,7 +10,8 @@ User = get_user_model()
 def has_permission(user, permission_name: str) -> bool:
     """
     Checks if the given user (or customer) has the specified permission.
-    Accepts any object that has 'is_authenticated' and 'role' attributes.
+    Accepts any object that has 'is_authenticated' and 'role_id' attributes.
+    Role permission sets are served from PermissionCache, so warm checks run no queries.
     """
     if not user or not user.is_authenticated:
         return False
@@ -19,16 +20,11 @@ def has_permission(user, permission_name: str) -> bool:
     if getattr(user, 'is_superuser', False):
         return True
     
-    if user.role:
-        # Check if the user's role has the 'all_permissions' permission
-        if RolePermission.objects.filter(role=user.role, permission__name='all_permissions').exists():
-            return True
-
-        # Check if the user's role has the specific permission
-        return RolePermission.objects.filter(
-            role=user.role,
-            permission__name=permission_name
-        ).exists()
+    # Use role_id so the check never lazily loads the Role row
+    role_id = getattr(user, 'role_id', None)
+    if role_id:
+        granted = PermissionCache.get_role_permissions(role_id)
+        return 'all_permissions' in granted or permission_name in granted
     
     return False
 
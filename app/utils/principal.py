@@ -0,0 +1,101 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+
+from app.models.customer import Customer
+
+PRINCIPAL_KEY = 'principal:{token_type}:{id}'
+
+USER_FIELDS = ('id', 'email', 'first_name', 'last_name', 'role_id', 'is_superuser', 'is_staff', 'is_active')
+CUSTOMER_FIELDS = (
+    'id', 'email', 'first_name', 'last_name', 'role_id', 'picture', 'email_verified', 'status',
+    'created_at', 'updated_at',
+)
+
+
+def principal_key(user) -> str:
+    """Stable identity of the caller (token type and id) for per-caller cache keys."""
+    if not user or not getattr(user, 'is_authenticated', False):
+        return 'anonymous'
+    return f"{getattr(user, 'token_type', 'user')}:{user.pk}"
+
+
+class AuthPrincipal:
+    """
+    Lightweight stand-in for a User or Customer on authenticated requests.
+    Carries only the identity, role and flags that views and permission checks read;
+    call get_model() when the real model instance is needed.
+    """
+    is_authenticated = True
+    is_anonymous = False
+
+    def __init__(self, token_type: str, data: dict):
+        self.token_type = token_type
+        self.is_superuser = False
+        self.is_staff = False
+        self.is_active = True
+        self.__dict__.update(data)
+        self._model = None
+
+    @property
+    def pk(self):
+        return self.id
+
+    @property
+    def is_customer(self) -> bool:
+        return self.token_type == 'customer'
+
+    def get_model(self):
+        """Loads (once) and returns the underlying User or Customer instance."""
+        if self._model is None:
+            model = Customer if self.is_customer else get_user_model()
+            self._model = model.objects.filter(id=self.id).first()
+        return self._model
+
+    def __str__(self):
+        return self.email or ''
+
+
+class PrincipalCache:
+    """
+    Short-TTL cache of authenticated principals keyed by (token type, id).
+    """
+
+    @staticmethod
+    def _ttl() -> int:
+        return getattr(settings, 'PRINCIPAL_CACHE_TTL', 60)
+
+    @staticmethod
+    def _load(token_type: str, principal_id: int):
+        if token_type == 'customer':
+            return Customer.objects.filter(id=principal_id, is_deleted=False).values(*CUSTOMER_FIELDS).first()
+        User = get_user_model()
+        return User.objects.filter(id=principal_id, is_active=True).values(*USER_FIELDS).first()
+
+    @staticmethod
+    def get(token_type: str, principal_id: int):
+        """Returns an AuthPrincipal, or None if the account no longer exists or is inactive."""
+        key = PRINCIPAL_KEY.format(token_type=token_type, id=principal_id)
+        data = cache.get(key)
+        if data is None:
+            data = PrincipalCache._load(token_type, principal_id)
+            if data is None:
+                return None
+            cache.set(key, data, timeout=PrincipalCache._ttl())
+        return AuthPrincipal(token_type, data)
+
+    @staticmethod
+    def evict(token_type: str, principal_id: int) -> None:
+        """Drops a cached principal now and again after the surrounding transaction commits."""
+        key = PRINCIPAL_KEY.format(token_type=token_type, id=principal_id)
+        cache.delete(key)
+        transaction.on_commit(lambda: cache.delete(key))
+
+    @staticmethod
+    def evict_user(user_id: int) -> None:
+        PrincipalCache.evict('user', user_id)
+
+    @staticmethod
+    def evict_customer(customer_id: int) -> None:
+        PrincipalCache.evict('customer', customer_id)
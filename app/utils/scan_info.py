@@ -0,0 +1,52 @@
+import threading
+import time
+
+from django.conf import settings
+
+from app.models.ticket import Ticket
+
+
+class ScanInfoCache:
+    """
+    Process-local cache of the event-level details a gate scanner shows (event
+    name and date, ticket type) keyed by (event id, ticket id). Entries
+    live for SCAN_INFO_CACHE_TTL seconds, so one query serves every scan of the
+    same ticket type in a worker during that time.
+    """
+    _entries = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def _load(cls, event_id: int, ticket_id: int):
+        return Ticket.objects.filter(
+            pk=ticket_id, event_id=event_id, is_deleted=False, event__is_deleted=False,
+        ).values(
+            'ticket_type', 'event__event_name', 'event__event_date',
+        ).first()
+
+    @classmethod
+    def get(cls, event_id: int, ticket_id: int):
+        """Returns the display info, or None if the ticket type or event no longer exists."""
+        key = (event_id, ticket_id)
+        now = time.monotonic()
+        entry = cls._entries.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        row = cls._load(event_id, ticket_id)
+        info = None
+        if row is not None:
+            info = {
+                'event_id': event_id,
+                'event_name': row['event__event_name'],
+                'event_date': row['event__event_date'],
+                'ticket_type': row['ticket_type'],
+            }
+        with cls._lock:
+            cls._entries[key] = (now + getattr(settings, 'SCAN_INFO_CACHE_TTL', 300), info)
+        return info
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._entries.clear()
@@ -0,0 +1,68 @@
+import hashlib
+import hmac
+import re
+import secrets
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+from django.conf import settings
+
+# TKT-<event id>-<ticket id>-<booking id>-<serial>-<signature>, all upper-case so the
+# QR code stays in alphanumeric mode
+SIGNED_CODE = re.compile(r'^TKT-([1-9]\d{0,9})-([1-9]\d{0,9})-([1-9]\d{0,9})-([0-9A-F]{8})-([0-9A-F]{16})$')
+
+
+class TicketClaims(NamedTuple):
+    event_id: int
+    ticket_id: int
+    booking_id: int
+    serial: str
+
+
+@lru_cache(maxsize=8)
+def _derive_key(secret: str) -> bytes:
+    # Separate from every other use of the secret
+    return hashlib.sha256(f'app.utils.ticket_codes:{secret}'.encode('utf-8')).digest()
+
+
+def _signing_keys() -> list:
+    current = getattr(settings, 'TICKET_SIGNING_KEY', '') or settings.SECRET_KEY
+    return [_derive_key(secret) for secret in [current, *getattr(settings, 'TICKET_SIGNING_FALLBACK_KEYS', [])]]
+
+
+def _signature(key: bytes, event_id: int, ticket_id: int, booking_id: int, serial: str) -> str:
+    message = f'{event_id}:{ticket_id}:{booking_id}:{serial}'.encode('utf-8')
+    return hmac.new(key, message, hashlib.sha256).hexdigest()[:16].upper()
+
+
+def sign_ticket_code(event_id: int, ticket_id: int, booking_id: int, serial: str = None) -> str:
+    """
+    Issues a self-verifying ticket code: the event, ticket type and booking it
+    admits to plus a random per-ticket serial, with a truncated HMAC-SHA256 over
+    all four under TICKET_SIGNING_KEY (SECRET_KEY when unset).
+    """
+    serial = serial or secrets.token_hex(4).upper()
+    signature = _signature(_signing_keys()[0], event_id, ticket_id, booking_id, serial)
+    return f'TKT-{event_id}-{ticket_id}-{booking_id}-{serial}-{signature}'
+
+
+def is_signed_format(ticket_code: str) -> bool:
+    """True if the code has the shape of a signed code, whether or not the signature is right."""
+    return bool(SIGNED_CODE.match(ticket_code))
+
+
+def verify_ticket_code(ticket_code: str) -> Optional[TicketClaims]:
+    """
+    Returns the claims of a signed ticket code, or None if it is malformed or its
+    signature matches neither the current key nor one of TICKET_SIGNING_FALLBACK_KEYS.
+    Needs no database access.
+    """
+    match = SIGNED_CODE.match(ticket_code)
+    if not match:
+        return None
+    event_id, ticket_id, booking_id = int(match[1]), int(match[2]), int(match[3])
+    serial, signature = match[4], match[5]
+    for key in _signing_keys():
+        if hmac.compare_digest(_signature(key, event_id, ticket_id, booking_id, serial), signature):
+            return TicketClaims(event_id, ticket_id, booking_id, serial)
+    return None
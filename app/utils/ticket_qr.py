@@ -0,0 +1,128 @@
+import hashlib
+import io
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+import qrcode
+from django.conf import settings
+
+from app.utils.khqr_images import QRImageCache
+
+# Part of every cache key: bump it when the rendering below changes
+RENDER_VERSION = 'v1-l-10-4'
+
+_pools = {}
+_pools_lock = threading.Lock()
+_memory = None
+_memory_lock = threading.Lock()
+
+
+def render_ticket_png(ticket_code: str) -> bytes:
+    """Renders a ticket code as a PNG QR code."""
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=10,
+        border=4,
+    )
+    qr.add_data(ticket_code)
+    qr.make(fit=True)
+
+    img = qr.make_image(fill_color="black", back_color="white")
+    buffered = io.BytesIO()
+    img.save(buffered, format="PNG")
+    return buffered.getvalue()
+
+
+def ticket_qr_key(ticket_code: str) -> str:
+    """Content hash of a ticket's QR image; doubles as its ETag."""
+    return hashlib.sha256(f'{RENDER_VERSION}:{ticket_code}'.encode('utf-8')).hexdigest()
+
+
+def _memory_cache() -> QRImageCache:
+    global _memory
+    if _memory is None:
+        with _memory_lock:
+            if _memory is None:
+                _memory = QRImageCache(getattr(settings, 'TICKET_QR_MEMORY_CACHE_SIZE', 1024))
+    return _memory
+
+
+def _disk_path(key: str):
+    cache_dir = getattr(settings, 'TICKET_QR_CACHE_DIR', '')
+    return os.path.join(cache_dir, key[:2], f'{key}.png') if cache_dir else None
+
+
+def ticket_qr_png(ticket_code: str) -> bytes:
+    """
+    PNG QR code for a ticket, rendered on demand and cached by content hash: in a
+    bounded in-process LRU, then in TICKET_QR_CACHE_DIR (shared by all processes).
+    """
+    key = ticket_qr_key(ticket_code)
+    memory = _memory_cache()
+    png = memory.get(key)
+    if png is not None:
+        return png
+
+    path = _disk_path(key)
+    if path and os.path.exists(path):
+        with open(path, 'rb') as fh:
+            png = fh.read()
+    else:
+        png = render_ticket_png(ticket_code)
+        if path:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write-then-rename so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as fh:
+                fh.write(png)
+            os.replace(tmp_path, path)
+    memory.put(key, png)
+    return png
+
+
+def _warm(ticket_codes: list) -> int:
+    for ticket_code in ticket_codes:
+        path = _disk_path(ticket_qr_key(ticket_code))
+        if not os.path.exists(path):
+            ticket_qr_png(ticket_code)
+    return len(ticket_codes)
+
+
+def get_qr_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Process-wide pool of QR renderers. Workers are spawned rather than forked
+    (forking a threaded server process is unsafe) and set Django up once.
+    """
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=django.setup,
+            )
+            _pools[workers] = pool
+        return pool
+
+
+def warm_ticket_qrs(ticket_codes: list, workers: int = None) -> list:
+    """
+    Pre-renders QR codes into the disk cache on a pool of `workers` processes
+    (default TICKET_QR_WORKERS) so the first scans of a large issue are cache hits.
+    Returns the pool futures without waiting on them. Does nothing without a disk
+    cache, for workers <= 1 or for fewer than TICKET_QR_PARALLEL_MIN codes: those
+    render on first request instead.
+    """
+    workers = workers if workers is not None else getattr(settings, 'TICKET_QR_WORKERS', 4)
+    if not getattr(settings, 'TICKET_QR_CACHE_DIR', '') or workers <= 1 \
+            or len(ticket_codes) < getattr(settings, 'TICKET_QR_PARALLEL_MIN', 16):
+        return []
+
+    pool = get_qr_pool(workers)
+    chunk = max(len(ticket_codes) // (workers * 4), 1)
+    return [pool.submit(_warm, ticket_codes[start:start + chunk]) for start in range(0, len(ticket_codes), chunk)]
@@ -0,0 +1,152 @@
+import hashlib
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+REVOKED_KEY = 'revoked:jti:{jti}'
+SEQ_KEY = 'revoked:seq'
+LOG_KEY = 'revoked:log:{seq}'
+SYNC_CHUNK = 1000
+# A log slot is reserved (incr) before its entry is written, so a reader can find
+# a recent slot still empty. Empty slots this close to the head are re-read on
+# later syncs for up to PENDING_SLOT_TIMEOUT seconds; older ones belong to expired
+# tokens.
+PENDING_SLOT_WINDOW = 1000
+PENDING_SLOT_TIMEOUT = 30
+
+
+class BloomFilter:
+    """
+    Fixed-size bloom filter over strings, using double hashing of one blake2b digest.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, int(round(self.size / capacity * math.log(2))))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value: str):
+        digest = hashlib.blake2b(value.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, value: str) -> None:
+        for pos in self._positions(value):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, value: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(value))
+
+
+class TokenDenylist:
+    """
+    Revoked-token (jti) denylist checked on every authenticated request.
+
+    Locally, revocations live in bloom filters bucketed by the token's expiry
+    window, so a check is O(1), memory stays bounded and whole buckets are dropped
+    once every token in them has expired. A bloom hit is confirmed against the
+    shared cache, where each revoked jti is stored with a TTL ending at the token's
+    exp. Other processes learn about revocations by replaying a sequence-numbered
+    log in the shared cache at most every TOKEN_DENYLIST_SYNC_INTERVAL seconds;
+    a slot found empty near the head of the log is read again on later syncs.
+    """
+    _buckets = {}
+    _lock = threading.Lock()
+    _last_seq = 0
+    _pending = {}
+    _synced_at = 0.0
+
+    @staticmethod
+    def _window() -> int:
+        lifetime = settings.SIMPLE_JWT.get('REFRESH_TOKEN_LIFETIME')
+        return int(lifetime.total_seconds()) if lifetime else 86400
+
+    @staticmethod
+    def _capacity() -> int:
+        return getattr(settings, 'TOKEN_DENYLIST_CAPACITY', 1_000_000)
+
+    @classmethod
+    def _bucket_for(cls, exp: int, create: bool = False):
+        bucket_id = int(exp) // cls._window()
+        bucket = cls._buckets.get(bucket_id)
+        if bucket is None and create:
+            bucket = BloomFilter(cls._capacity())
+            cls._buckets[bucket_id] = bucket
+        return bucket
+
+    @classmethod
+    def _add_local(cls, jti: str, exp: int) -> None:
+        with cls._lock:
+            cls._bucket_for(exp, create=True).add(jti)
+
+    @classmethod
+    def _purge(cls, now: float) -> None:
+        """Drops buckets whose whole expiry window is in the past."""
+        current = int(now) // cls._window()
+        with cls._lock:
+            for bucket_id in [b for b in cls._buckets if b < current]:
+                del cls._buckets[bucket_id]
+
+    @classmethod
+    def sync(cls, force: bool = False) -> None:
+        """Replays revocations other processes wrote to the shared log since the last sync."""
+        now = time.time()
+        interval = getattr(settings, 'TOKEN_DENYLIST_SYNC_INTERVAL', 1)
+        if not force and now - cls._synced_at < interval:
+            return
+        cls._synced_at = now
+        cls._purge(now)
+
+        latest = cache.get(SEQ_KEY) or 0
+        seqs = sorted(cls._pending) + list(range(cls._last_seq + 1, latest + 1))
+        for start in range(0, len(seqs), SYNC_CHUNK):
+            chunk = seqs[start:start + SYNC_CHUNK]
+            entries = cache.get_many([LOG_KEY.format(seq=seq) for seq in chunk])
+            for seq in chunk:
+                entry = entries.get(LOG_KEY.format(seq=seq))
+                if entry is not None:
+                    cls._pending.pop(seq, None)
+                    jti, exp = entry
+                    if exp > now:
+                        cls._add_local(jti, exp)
+                elif seq > latest - PENDING_SLOT_WINDOW:
+                    # Reserved but maybe not written yet: look again next time
+                    cls._pending.setdefault(seq, now)
+        for seq, seen in list(cls._pending.items()):
+            if now - seen > PENDING_SLOT_TIMEOUT:
+                cls._pending.pop(seq, None)
+        cls._last_seq = max(cls._last_seq, latest)
+
+    @classmethod
+    def revoke(cls, jti: str, exp: int) -> None:
+        """Revokes a token until its exp passes."""
+        ttl = int(exp - time.time())
+        if not jti or ttl <= 0:
+            return
+
+        cache.set(REVOKED_KEY.format(jti=jti), 1, timeout=ttl)
+        cache.add(SEQ_KEY, 0, timeout=None)
+        seq = cache.incr(SEQ_KEY)
+        cache.set(LOG_KEY.format(seq=seq), (jti, exp), timeout=ttl)
+        cls._add_local(jti, exp)
+
+    @classmethod
+    def revoke_token(cls, token) -> None:
+        """Revokes a validated simplejwt token (access or refresh)."""
+        jti_claim = settings.SIMPLE_JWT.get('JTI_CLAIM', 'jti')
+        cls.revoke(token.get(jti_claim), token.get('exp'))
+
+    @classmethod
+    def is_revoked(cls, jti: str, exp: int) -> bool:
+        if not jti or not exp:
+            return False
+        cls.sync()
+        bucket = cls._bucket_for(exp)
+        if bucket is None or jti not in bucket:
+            return False
+        # Bloom hit: confirm against the exact set to rule out a false positive
+        return cache.get(REVOKED_KEY.format(jti=jti)) is not None
@@ -12,6 +12,9 @@ from app.dto.responses.auth_response import LoginResponseDTO
 from app.services.user_service import UserService
 from app.services.authentication_service import AuthenticationService
 from app.utils.jwt import JWTUtil
+from app.utils.token_denylist import TokenDenylist
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.exceptions import TokenError
 from app.utils.api_response import api_response
 
 
@@ -103,12 +106,28 @@ class LogoutView(APIView):
     permission_classes = [IsAuthenticated]
 
     @swagger_auto_schema(
-        operation_description="Logout user (requires authentication).",
+        operation_description="Logout user (requires authentication). Revokes the access token and, if given, the refresh token.",
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            properties={
+                'refresh_token': openapi.Schema(type=openapi.TYPE_STRING, description='Refresh token to revoke')
+            }
+        ),
         responses={
             200: "Successfully logged out."
         }
     )
     def post(self, request):
+        if request.auth is not None:
+            TokenDenylist.revoke_token(request.auth)
+
+        refresh_token = request.data.get('refresh_token')
+        if refresh_token:
+            try:
+                TokenDenylist.revoke_token(RefreshToken(refresh_token))
+            except TokenError:
+                pass # Already invalid or expired, nothing to revoke
+
         return api_response(
             message="Successfully logged out.",
             status_code=status.HTTP_200_OK
@@ -1,15 +1,20 @@
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.exceptions import ValidationError
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 
-from app.dto.requests.booking_request import CreateBookingRequest, UpdateBookingRequest, AdminCreateBookingRequest
+from app.dto.requests.booking_request import CreateBookingRequest, UpdateBookingRequest, AdminCreateBookingRequest, AdminBatchBookingRequest
 from app.dto.responses.booking_response import BookingResponse
 from app.services.booking_service import BookingService
+from app.services.waiting_room_service import WaitingRoomService
 from app.dto.requests.pagination_request import PaginationRequest
 
 from app.utils.api_response import api_response
+from app.utils.pagination import page_response
+from app.utils.idempotency import idempotent
+from app.utils.principal import principal_key
 from app.utils.permissions import CheckPermission
 
 
@@ -33,16 +38,36 @@ class BookingListCreateView(APIView):
         return api_response(data=serializer.data, message="Bookings retrieved successfully.")
 
     @swagger_auto_schema(
-        operation_description="Create a new booking.",
+        operation_description="Create a new booking. Events with a waiting room require the X-Admission-Pass header.",
         request_body=CreateBookingRequest,
+        manual_parameters=[
+            openapi.Parameter('Idempotency-Key', openapi.IN_HEADER, description="Unique key per logical request; retries with the same key replay the first response", type=openapi.TYPE_STRING, required=False),
+            openapi.Parameter('X-Admission-Pass', openapi.IN_HEADER, description="Admission pass from the event's waiting room", type=openapi.TYPE_STRING, required=False),
+        ],
         responses={
             201: BookingResponse,
-            400: "Bad Request"
+            400: "Bad Request",
+            429: "Waiting room admission required"
         }
     )
+    @idempotent('bookings')
     def post(self, request):
+        # Waiting-room gate before any database work; it only reads the cache. Validation
+        # then rejects a ticket that does not belong to this event.
+        try:
+            admission = WaitingRoomService.admit(
+                request.data.get('event'),
+                request.headers.get('X-Admission-Pass'),
+                principal_key(request.user),
+            )
+        except ValueError as e:
+            return api_response(message=str(e), success=False, status_code=status.HTTP_429_TOO_MANY_REQUESTS)
+
         serializer = CreateBookingRequest(data=request.data)
-        serializer.is_valid(raise_exception=True)
+        if not serializer.is_valid():
+            # Let the client retry with the same pass while it is still valid
+            WaitingRoomService.refund(admission)
+            raise ValidationError(serializer.errors)
         validated_data = serializer.validated_data
         
         # Find or create customer for the authenticated user
@@ -65,6 +90,8 @@ class BookingListCreateView(APIView):
                 status_code=status.HTTP_201_CREATED
             )
         except Exception as e:
+            # Let the client retry with the same pass while it is still valid
+            WaitingRoomService.refund(admission)
             return api_response(message=str(e), success=False, status_code=status.HTTP_400_BAD_REQUEST)
 
 
@@ -80,11 +107,15 @@ class AdminBookingCreateView(APIView):
     @swagger_auto_schema(
         operation_description="Create a new booking for any customer (Admin only).",
         request_body=AdminCreateBookingRequest,
+        manual_parameters=[
+            openapi.Parameter('Idempotency-Key', openapi.IN_HEADER, description="Unique key per logical request; retries with the same key replay the first response", type=openapi.TYPE_STRING, required=False),
+        ],
         responses={
             201: BookingResponse,
             400: "Bad Request"
         }
     )
+    @idempotent('admin_bookings')
     def post(self, request):
         serializer = AdminCreateBookingRequest(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -102,6 +133,46 @@ class AdminBookingCreateView(APIView):
             return api_response(message=str(e), success=False, status_code=status.HTTP_400_BAD_REQUEST)
 
 
+class AdminBatchBookingCreateView(APIView):
+    """
+    Handles admin creating many bookings in one call (box office, integrations).
+    """
+    permission_classes = [IsAuthenticated, CheckPermission]
+    method_permissions = {
+        'POST': 'admin_create_bookings',
+    }
+
+    @swagger_auto_schema(
+        operation_description="Create up to BATCH_BOOKING_MAX_LINES bookings at once (Admin only). Each line succeeds or fails on its own; the response lists a result per line in request order.",
+        request_body=AdminBatchBookingRequest,
+        manual_parameters=[
+            openapi.Parameter('Idempotency-Key', openapi.IN_HEADER, description="Unique key per logical request; retries with the same key replay the first response", type=openapi.TYPE_STRING, required=False),
+        ],
+        responses={
+            201: "Per-line results",
+            400: "Bad Request"
+        }
+    )
+    @idempotent('admin_booking_batches')
+    def post(self, request):
+        serializer = AdminBatchBookingRequest(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            results = BookingService.create_bookings_batch(serializer.validated_data['bookings'])
+            for result in results:
+                if result['success']:
+                    result['booking'] = BookingResponse(result['booking']).data
+            created = sum(1 for result in results if result['success'])
+            return api_response(
+                data={'created': created, 'failed': len(results) - created, 'results': results},
+                message=f"{created} of {len(results)} bookings created.",
+                status_code=status.HTTP_201_CREATED
+            )
+        except Exception as e:
+            return api_response(message=str(e), success=False, status_code=status.HTTP_400_BAD_REQUEST)
+
+
 class BookingRetrieveUpdateDestroyView(APIView):
     """
     Handles retrieving, updating, and deleting a single booking by ID.
@@ -205,12 +276,7 @@ class PaginatedBookingListView(APIView):
             response_serializer = BookingResponse(items, many=True)
 
             return api_response(
-                data={
-                    'data': response_serializer.data,
-                    'total': paginated_data['total'],
-                    'page': paginated_data['page'],
-                    'limit': paginated_data['limit']
-                },
+                data=page_response(paginated_data, response_serializer.data),
                 message="Paginated Bookings retrieved successfully."
             )
         except Exception as e:
@@ -1,3 +1,4 @@
+from django.core.exceptions import ObjectDoesNotExist
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated
@@ -8,7 +9,8 @@ from app.dto.requests.checkin_request import (
     CreateCheckinRequest, 
     UpdateCheckinRequest, 
     ValidateTicketRequest, 
-    ConfirmCheckinRequest
+    ConfirmCheckinRequest,
+    ScanTicketRequest
 )
 from app.dto.responses.checkin_response import CheckinResponse
 from app.services.checkin_service import CheckinService
@@ -246,4 +248,99 @@ class ConfirmCheckinView(APIView):
                 message=str(e),
                 success=False,
                 status_code=status.HTTP_400_BAD_REQUEST
-            )
\ No newline at end of file
+            )
+
+
+class ScanTicketView(APIView):
+    """
+    Handles a gate scan: validates a ticket code and checks it in in one call.
+    """
+    permission_classes = [IsAuthenticated, CheckPermission]
+    method_permissions = {
+        'POST': 'create_checkins',
+    }
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Validate and check in a ticket code. Signed codes are verified without a database lookup; "
+            "status is CHECKED_IN, ALREADY_USED, WRONG_EVENT or INVALID."
+        ),
+        request_body=ScanTicketRequest,
+        responses={
+            200: "Ticket scanned",
+            400: "Bad Request"
+        }
+    )
+    def post(self, request):
+        serializer = ScanTicketRequest(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            result = CheckinService.scan_ticket(
+                serializer.validated_data['ticket_code'],
+                event_id=serializer.validated_data.get('event_id'),
+            )
+            return api_response(
+                data=result,
+                message="Ticket scanned successfully."
+            )
+        except Exception as e:
+            return api_response(
+                message=str(e),
+                success=False,
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+
+class GateIndexView(APIView):
+    """
+    Manages the in-memory gate index of an event used by ticket validation and check-in.
+    """
+    permission_classes = [IsAuthenticated, CheckPermission]
+    method_permissions = {
+        'GET': 'all_checkins',
+        'POST': 'create_checkins',
+        'DELETE': 'create_checkins',
+    }
+
+    @swagger_auto_schema(
+        operation_description="Memory and size of this worker's gate index for an event.",
+        responses={
+            200: "Gate index stats",
+            404: "Not Found"
+        }
+    )
+    def get(self, request, event_id):
+        stats = CheckinService.get_gate_index_stats(event_id)
+        if stats is None:
+            return api_response(message="Gate index not loaded.", success=False, status_code=status.HTTP_404_NOT_FOUND)
+        return api_response(data=stats, message="Gate index retrieved successfully.")
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Preload an event's ticket codes into the in-memory gate index. Other workers load "
+            "their copy within GATE_INDEX_SYNC_INTERVAL seconds; posting again re-snapshots it."
+        ),
+        responses={
+            200: "Gate index stats",
+            404: "Not Found"
+        }
+    )
+    def post(self, request, event_id):
+        try:
+            stats = CheckinService.load_gate_index(event_id)
+            return api_response(data=stats, message="Gate index loaded successfully.")
+        except ObjectDoesNotExist as e:
+            return api_response(message=str(e), success=False, status_code=status.HTTP_404_NOT_FOUND)
+
+    @swagger_auto_schema(
+        operation_description="Drop an event's gate index from every worker.",
+        responses={
+            204: "No Content",
+            404: "Not Found"
+        }
+    )
+    def delete(self, request, event_id):
+        if CheckinService.unload_gate_index(event_id):
+            return api_response(message="Gate index unloaded successfully.", status_code=status.HTTP_204_NO_CONTENT)
+        return api_response(message="Gate index not loaded.", success=False, status_code=status.HTTP_404_NOT_FOUND)
@@ -10,6 +10,7 @@ from app.services.event_registration_service import EventRegistrationService
 from app.dto.requests.pagination_request import PaginationRequest
 
 from app.utils.api_response import api_response
+from app.utils.pagination import page_response
 from app.utils.permissions import CheckPermission
 
 
@@ -156,8 +157,9 @@ class PaginatedEventRegistrationListView(APIView):
 
         try:
             paginated_data = EventRegistrationService.get_paginated_event_registrations(validated_data)
+            response_serializer = EventRegistrationResponse(paginated_data['items'], many=True)
             return api_response(
-                data=paginated_data,
+                data=page_response(paginated_data, response_serializer.data),
                 message="Paginated Event Registrations retrieved successfully."
             )
         except Exception as e:
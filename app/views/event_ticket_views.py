@@ -1,6 +1,9 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.http import HttpResponse
 from django.db import transaction
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
@@ -9,6 +12,8 @@ from app.dto.responses.event_ticket_response import EventTicketResponse
 from app.services.event_ticket_service import EventTicketService
 from app.dto.requests.pagination_request import PaginationRequest
 from app.utils.api_response import api_response
+from app.utils.pagination import page_response
+from app.utils.ticket_qr import ticket_qr_key
 
 
 class EventTicketListCreateView(APIView):
@@ -134,12 +139,7 @@ class PaginatedEventTicketListView(APIView):
             response_serializer = EventTicketResponse(items, many=True)
 
             return api_response(
-                data={
-                    'data': response_serializer.data,
-                    'total': paginated_data['total'],
-                    'page': paginated_data['page'],
-                    'limit': paginated_data['limit']
-                },
+                data=page_response(paginated_data, response_serializer.data),
                 message="Paginated event tickets retrieved successfully."
             )
         except Exception as e:
@@ -147,4 +147,66 @@ class PaginatedEventTicketListView(APIView):
                 message=str(e),
                 success=False,
                 status_code=status.HTTP_400_BAD_REQUEST
-            )
\ No newline at end of file
+            )
+
+class BookingTicketIssueView(APIView):
+    """
+    View for issuing all missing EventTickets of a confirmed booking in one call.
+    """
+
+    @swagger_auto_schema(
+        operation_description="Issue the missing event tickets (one per seat) for a confirmed booking. Safe to repeat: tickets already issued are not duplicated.",
+        responses={
+            201: "Issued tickets (id, ticket_code, status)",
+            400: "Bad Request",
+            404: "Not Found"
+        }
+    )
+    def post(self, request, booking_id):
+        try:
+            result = EventTicketService.issue_tickets_for_booking(booking_id)
+        except ObjectDoesNotExist as e:
+            return api_response(message=str(e), success=False, status_code=status.HTTP_404_NOT_FOUND)
+        except ValueError as e:
+            return api_response(message=str(e), success=False, status_code=status.HTTP_400_BAD_REQUEST)
+
+        tickets = result['tickets']
+        return api_response(
+            data={
+                'booking_id': result['booking'].id,
+                'already_issued': result['already_issued'],
+                'issued': len(tickets),
+                'tickets': tickets,
+            },
+            message=f"{len(tickets)} event tickets issued.",
+            status_code=status.HTTP_201_CREATED if tickets else status.HTTP_200_OK
+        )
+
+
+class EventTicketQRImageView(APIView):
+    """
+    View serving an event ticket's QR code as a PNG.
+    """
+
+    @swagger_auto_schema(
+        operation_description=(
+            "QR code image (PNG) of an event ticket, rendered on demand and cached by content hash. "
+            "The URL carries the hash (see qr_image_url), so a replaced ticket code gets a new URL."
+        ),
+        responses={200: "image/png", 304: "Not Modified", 404: "Not Found"}
+    )
+    def get(self, request, pk, key):
+        ticket_code = EventTicketService.get_ticket_code(pk)
+        # An old key belongs to a ticket code that has since been replaced
+        if not ticket_code or ticket_qr_key(ticket_code) != key:
+            return api_response(message="Event ticket not found.", success=False, status_code=status.HTTP_404_NOT_FOUND)
+
+        etag = f'"{key}"'
+        if request.headers.get('If-None-Match') == etag:
+            response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = HttpResponse(EventTicketService.get_ticket_qr_png(ticket_code), content_type='image/png')
+        response['ETag'] = etag
+        # The URL is addressed by content hash, so its image never changes
+        response['Cache-Control'] = f"private, max-age={getattr(settings, 'TICKET_QR_MAX_AGE', 31536000)}, immutable"
+        return response
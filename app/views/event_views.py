@@ -34,9 +34,17 @@ class EventListCreateView(APIView):
         responses={200: EventResponse(many=True)}
     )
     def get(self, request):
-        all_events = EventService.get_all_events()
-        serializer = EventResponse(all_events, many=True)
-        return api_response(data=serializer.data, message="Events retrieved successfully.")
+        catalogue = EventService.get_event_catalogue()
+        etag = catalogue['etag']
+
+        if request.headers.get('If-None-Match') == etag:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = api_response(data=catalogue['data'], message="Events retrieved successfully.")
+
+        response['ETag'] = etag
+        response['Cache-Control'] = 'public, no-cache'
+        return response
 
     @swagger_auto_schema(
         operation_description="Create a new event.",
@@ -121,7 +129,7 @@ class EventRetrieveUpdateDestroyView(APIView):
         }
     )
     def delete(self, request, pk):
-        if EventService.soft_delete_event(pk, request.user):
+        if EventService.soft_delete_event(pk, request.user.get_model()):
             return api_response(message="Event deleted successfully.", status_code=status.HTTP_204_NO_CONTENT)
         return api_response(message="Event not found.", success=False, status_code=status.HTTP_404_NOT_FOUND)
 
@@ -0,0 +1,74 @@
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views import View
+
+from app.dto.responses.payment_response import PaymentResponse
+from app.services.payment_service import PaymentService
+from app.utils.payment_events import get_payment_event_hub
+
+
+def _status_payload(md5: str, use_cache: bool = True) -> dict:
+    result = PaymentService().check_bakong_status(md5, use_cache=use_cache)
+    if 'payment' in result:
+        result = dict(result)
+        result['payment'] = PaymentResponse(result['payment']).data
+    return result
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+class PaymentStatusStreamView(View):
+    """
+    Streams a payment's status as Server-Sent Events.
+    GET /v1/payments/status-stream/?md5=... sends the current status at once and
+    again whenever it changes, then closes after COMPLETED or FAILED. Like
+    check-status it is public: the md5 of the QR payload identifies the payment.
+    Under ASGI a waiting client holds no worker thread and costs no queries
+    until its payment changes; heartbeats re-check the cached status. Under
+    WSGI the stream is only flushed when it ends, so use check-status with
+    `wait` (long-poll) there instead.
+    """
+
+    async def get(self, request):
+        md5 = request.GET.get('md5')
+        if not md5:
+            return JsonResponse({'success': False, 'message': "md5 is required.", 'status_code': 400}, status=400)
+        try:
+            await sync_to_async(_status_payload)(md5)
+        except ObjectDoesNotExist as e:
+            return JsonResponse({'success': False, 'message': str(e), 'status_code': 404}, status=404)
+
+        response = StreamingHttpResponse(self._events(md5), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    async def _events(self, md5: str):
+        hub = get_payment_event_hub()
+        loop = asyncio.get_running_loop()
+        heartbeat = getattr(settings, 'PAYMENT_STREAM_HEARTBEAT', 15)
+        deadline = loop.time() + getattr(settings, 'PAYMENT_STREAM_MAX_SECONDS', 600)
+        # Subscribe before reading the status so a change in between is not missed
+        subscription = await sync_to_async(hub.subscribe)(md5, loop)
+        try:
+            result = await sync_to_async(_status_payload)(md5)
+            yield f"retry: {heartbeat * 1000}\n" + _sse('status', result)
+            while result['status'] == 'PENDING' and loop.time() < deadline:
+                changed = await subscription.aget(timeout=heartbeat)
+                if changed is None:
+                    yield ": keep-alive\n\n"
+                latest = await sync_to_async(_status_payload)(md5, use_cache=changed is None)
+                if latest['status'] != result['status']:
+                    yield _sse('status', latest)
+                result = latest
+        except ObjectDoesNotExist as e:
+            yield _sse('error', {'message': str(e)})
+        finally:
+            hub.unsubscribe(subscription)
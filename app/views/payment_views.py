@@ -3,7 +3,9 @@ from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated,AllowAny
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
+from django.http import HttpResponse
 
 from app.dto.requests.payment_request import CreatePaymentRequest, UpdatePaymentRequest
 from app.dto.responses.payment_response import PaymentResponse
@@ -11,6 +13,9 @@ from app.services.payment_service import PaymentService
 from app.dto.requests.pagination_request import PaginationRequest
 
 from app.utils.api_response import api_response
+from app.utils.bakong_client import BakongUnavailable, get_bakong_client
+from app.utils.idempotency import idempotent
+from app.utils.payment_events import get_payment_event_hub
 from app.utils.permissions import CheckPermission
 
 
@@ -43,11 +48,15 @@ class PaymentListCreateView(APIView):
     @swagger_auto_schema(
         operation_description="Create a new payment.",
         request_body=CreatePaymentRequest,
+        manual_parameters=[
+            openapi.Parameter('Idempotency-Key', openapi.IN_HEADER, description="Unique key per logical request; retries with the same key replay the first response", type=openapi.TYPE_STRING, required=False),
+        ],
         responses={
             201: PaymentResponse,
             400: "Bad Request"
         }
     )
+    @idempotent('payments')
     def post(self, request):
         serializer = CreatePaymentRequest(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -61,9 +70,9 @@ class PaymentListCreateView(APIView):
             message = "Payment created successfully."
 
             # Append Bakong-specific fields if present
-            if result.get('qr_image'):
+            if result.get('qr_image_url'):
                 response_data = dict(response_data)
-                response_data['qr_image'] = result.get('qr_image')
+                response_data['qr_image_url'] = result.get('qr_image_url')
                 response_data['md5'] = result['payment'].md5
                 response_data['qr'] = result['payment'].qr
                 message = "Payment initiated. Please scan the QR code."
@@ -118,7 +127,10 @@ class PaymentRetrieveUpdateDestroyView(APIView):
         serializer.is_valid(raise_exception=True)
         validated_data = serializer.validated_data
 
-        payment = PaymentService.update_payment(pk, validated_data)
+        try:
+            payment = PaymentService.update_payment(pk, validated_data)
+        except ValueError as e:
+            return api_response(message=str(e), success=False, status_code=status.HTTP_400_BAD_REQUEST)
         if payment:
             response_serializer = PaymentResponse(payment)
             return api_response(data=response_serializer.data, message="Payment updated successfully.")
@@ -200,7 +212,10 @@ class GenerateBakongQRView(APIView):
     }
 
     @swagger_auto_schema(
-        operation_description="Generate Bakong KHQR for a payment.",
+        operation_description="Get the Bakong KHQR for a payment. The KHQR is built once and stored; pass refresh=true to build a new one. The PNG is served from qr_image_url.",
+        manual_parameters=[
+            openapi.Parameter('refresh', openapi.IN_QUERY, description="Build a new KHQR (e.g. after it expired)", type=openapi.TYPE_BOOLEAN, required=False),
+        ],
         responses={
             200: openapi.Response(
                 description="Bakong QR data.",
@@ -209,6 +224,7 @@ class GenerateBakongQRView(APIView):
                     properties={
                         "qr_data": openapi.Schema(type=openapi.TYPE_STRING),
                         "md5": openapi.Schema(type=openapi.TYPE_STRING),
+                        "qr_image_url": openapi.Schema(type=openapi.TYPE_STRING),
                         "payment_id": openapi.Schema(type=openapi.TYPE_INTEGER),
                     }
                 )
@@ -218,8 +234,9 @@ class GenerateBakongQRView(APIView):
     )
     def get(self, request, pk):
         try:
-            payment_service = PaymentService() 
-            qr_data = payment_service.generate_bakong_qr(pk)
+            payment_service = PaymentService()
+            refresh = request.query_params.get('refresh', '').lower() in ('1', 'true', 'yes')
+            qr_data = payment_service.generate_bakong_qr(pk, refresh=refresh)
             return api_response(data=qr_data, message="Bakong QR generated successfully.")
         except ObjectDoesNotExist as e:
             return api_response(message=str(e), success=False, status_code=status.HTTP_404_NOT_FOUND)
@@ -227,6 +244,33 @@ class GenerateBakongQRView(APIView):
             return api_response(message=str(e), success=False, status_code=status.HTTP_400_BAD_REQUEST)
 
 
+class KHQRImageView(APIView):
+    """
+    Serves the KHQR of a payment as a PNG, addressed by its md5.
+    Public like check-status: the md5 identifies the payment. Images are rendered
+    on first request and then served from an in-process LRU; as the md5 is a
+    hash of the QR content, clients may cache them indefinitely.
+    """
+    permission_classes = [AllowAny]
+
+    @swagger_auto_schema(
+        operation_description="KHQR image (PNG) for a payment md5.",
+        responses={200: "image/png", 304: "Not Modified", 404: "Not Found"}
+    )
+    def get(self, request, md5):
+        etag = f'"{md5}"'
+        if request.headers.get('If-None-Match') == etag:
+            response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            png = PaymentService.get_khqr_png(md5)
+            if png is None:
+                return api_response(message="Payment not found for the given md5.", success=False, status_code=status.HTTP_404_NOT_FOUND)
+            response = HttpResponse(png, content_type='image/png')
+        response['ETag'] = etag
+        response['Cache-Control'] = f"private, max-age={getattr(settings, 'KHQR_IMAGE_MAX_AGE', 86400)}, immutable"
+        return response
+
+
 class CheckBakongStatusView(APIView):
     """
     Checks Bakong payment status by md5 hash (sent in POST body).
@@ -244,12 +288,13 @@ class CheckBakongStatusView(APIView):
         return super().get_permissions()
 
     @swagger_auto_schema(
-        operation_description="Check Bakong payment status. Sends the md5 hash to the Bakong API gateway.",
+        operation_description="Check Bakong payment status by md5 hash. Answers from local state; payments are confirmed in the background by the Bakong reconciler.",
         request_body=openapi.Schema(
             type=openapi.TYPE_OBJECT,
             required=['md5'],
             properties={
                 'md5': openapi.Schema(type=openapi.TYPE_STRING, description='MD5 hash of the QR payload'),
+                'wait': openapi.Schema(type=openapi.TYPE_INTEGER, description='Long-poll: seconds to hold the request while the payment is pending (max PAYMENT_STATUS_MAX_WAIT)'),
             }
         ),
         responses={
@@ -276,9 +321,19 @@ class CheckBakongStatusView(APIView):
                 status_code=status.HTTP_400_BAD_REQUEST
             )
             
+        try:
+            wait = min(max(float(request.data.get('wait') or 0), 0), getattr(settings, 'PAYMENT_STATUS_MAX_WAIT', 30))
+        except (TypeError, ValueError):
+            return api_response(message="wait must be a number of seconds.", success=False, status_code=status.HTTP_400_BAD_REQUEST)
+
+        hub = get_payment_event_hub()
+        # Subscribe before the first read so a change in between is not missed
+        subscription = hub.subscribe(md5) if wait else None
         try:
             payment_service = PaymentService()
             result = payment_service.check_bakong_status(md5)
+            if subscription and result.get('status') == 'PENDING' and subscription.get(timeout=wait):
+                result = payment_service.check_bakong_status(md5, use_cache=False)
 
             # Serialize payment if present
             if 'payment' in result:
@@ -299,6 +354,9 @@ class CheckBakongStatusView(APIView):
             return api_response(message=str(e), success=False, status_code=status.HTTP_502_BAD_GATEWAY)
         except Exception as e:
             return api_response(message=str(e), success=False, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        finally:
+            if subscription:
+                hub.unsubscribe(subscription)
 
 
 class TestBakongPaymentView(APIView):
@@ -322,18 +380,11 @@ class TestBakongPaymentView(APIView):
         currency = request.data.get('currency', 'USD')
         
         try:
-            from bakong_khqr import KHQR
-            from django.conf import settings
-            import os
-            
-            token = getattr(settings, 'BAKONG_ACCESS_TOKEN', os.getenv('BAKONG_ACCESS_TOKEN'))
-            account_username = getattr(settings, 'BAKONG_ACCOUNT_USERNAME', os.getenv('BAKONG_ACCOUNT_USERNAME'))
-            print('this is bank acc:', account_username)
-            
-            khqr = KHQR(bakong_token=token)
-            
+            client = get_bakong_client()
+            khqr = client.khqr
+
             qr_string = khqr.create_qr(
-                bank_account=account_username,
+                bank_account=client.account,
                 merchant_name="Test Merchant",
                 merchant_city="Phnom Penh",
                 amount=float(amount),
@@ -386,18 +437,10 @@ class TestBakongCheckStatusView(APIView):
             )
 
         try:
-            from bakong_khqr import KHQR
-            from django.conf import settings
-            import os
-            
-            token = getattr(settings, 'BAKONG_ACCESS_TOKEN', os.getenv('BAKONG_ACCESS_TOKEN'))
-            khqr = KHQR(bakong_token=token)
-            
-            # Use the SDK's built-in check payment method
-            status_result = khqr.check_payment(md5)
-            # This SDK method usually returns "PAID" or "UNPAID" based on API response
-            
-            # Since check_payment returns a simple string, we can format it nicely
+            # Same PAID/UNPAID answer as the SDK's check_payment, over the pooled client
+            result = get_bakong_client().check_md5(md5)
+            status_result = "PAID" if result.get('responseCode') == 0 else "UNPAID"
+
             is_success = status_result == "PAID"
             http_status = status.HTTP_200_OK if is_success else status.HTTP_400_BAD_REQUEST
             message = "Payment confirmed" if is_success else "Payment is pending or failed"
@@ -407,5 +450,25 @@ class TestBakongCheckStatusView(APIView):
                 message=message,
                 status_code=http_status
             )
+        except BakongUnavailable as e:
+            return api_response(message=str(e), success=False, status_code=status.HTTP_502_BAD_GATEWAY)
         except Exception as e:
              return api_response(message=str(e), success=False, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class BakongClientStatsView(APIView):
+    """
+    Exposes this worker's Bakong gateway client counters: requests, retries,
+    failures, short-circuited calls, circuit state and latency percentiles.
+    """
+    permission_classes = [IsAuthenticated, CheckPermission]
+    method_permissions = {
+        'GET': 'view_payments',
+    }
+
+    @swagger_auto_schema(
+        operation_description="Bakong gateway client counters for the worker that serves the request.",
+        responses={200: "Client counters"}
+    )
+    def get(self, request):
+        return api_response(data=get_bakong_client().stats(), message="Bakong client stats retrieved successfully.")
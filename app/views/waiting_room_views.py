@@ -0,0 +1,58 @@
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAuthenticated
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+
+from app.services.waiting_room_service import WaitingRoomService
+from app.utils.api_response import api_response
+from app.utils.principal import principal_key
+
+
+class EventQueueJoinView(APIView):
+    """
+    Joins the waiting room of a high-demand event.
+    """
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Join the event's waiting room. Returns a queue token to poll with; joining again "
+            "returns the same place in the queue. Events without a waiting room return status 'open'."
+        ),
+        responses={200: "Queue status", 400: "Bad Request"}
+    )
+    def post(self, request, pk):
+        try:
+            queue_status = WaitingRoomService.join(pk, principal_key(request.user))
+            return api_response(data=queue_status, message="Joined the waiting room.")
+        except Exception as e:
+            return api_response(message=str(e), success=False, status_code=status.HTTP_400_BAD_REQUEST)
+
+
+class EventQueueStatusView(APIView):
+    """
+    Polls a waiting-room position. Served entirely from the cache.
+    """
+    permission_classes = [IsAuthenticated]
+
+    @swagger_auto_schema(
+        operation_description=(
+            "Poll the caller's waiting-room status. Once admitted, the response carries a single-use "
+            "admission_pass to send as the X-Admission-Pass header on POST /v1/bookings/."
+        ),
+        manual_parameters=[
+            openapi.Parameter('token', openapi.IN_QUERY, description="Queue token from the join call", type=openapi.TYPE_STRING, required=True),
+        ],
+        responses={200: "Queue status", 400: "Bad Request"}
+    )
+    def get(self, request, pk):
+        try:
+            queue_status = WaitingRoomService.status(pk, request.query_params.get('token'), principal_key(request.user))
+        except ValueError as e:
+            return api_response(message=str(e), success=False, status_code=status.HTTP_400_BAD_REQUEST)
+
+        response = api_response(data=queue_status, message="Waiting room status retrieved successfully.")
+        if queue_status.get('status') == 'waiting':
+            response['Retry-After'] = str(queue_status['poll_after_seconds'])
+        return response
@@ -14,3 +14,13 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
 
 application = get_asgi_application()
+
+# Optional in-process sweeper for expired seat holds (SEAT_HOLD_SWEEP_INTERVAL)
+from app.services.seat_hold_service import SeatHoldSweeper  # noqa: E402
+
+SeatHoldSweeper.start()
+
+# Background Bakong payment reconciliation (BAKONG_RECONCILE_INTERVAL)
+from app.services.bakong_reconcile_service import BakongReconciler  # noqa: E402
+
+BakongReconciler.start()
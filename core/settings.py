@@ -1,6 +1,7 @@
 from pathlib import Path
 from datetime import timedelta
 from decouple import config
+from corsheaders.defaults import default_headers
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -81,6 +82,13 @@ DATABASES = {
 }
 
 
+# bcrypt work factor for app.utils.bycrypt; stored hashes with a different cost
+# are rehashed on the next successful login.
+BCRYPT_ROUNDS = config('BCRYPT_ROUNDS', default=12, cast=int)
+# Size of the thread pool all password hashing runs on
+BCRYPT_MAX_WORKERS = config('BCRYPT_MAX_WORKERS', default=4, cast=int)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -121,6 +129,76 @@ STATIC_URL = 'static/'
 MEDIA_URL = '/uploads/'
 MEDIA_ROOT = BASE_DIR / 'uploads'
 
+# Cache
+# The default backend is per-process; point CACHE_BACKEND/CACHE_LOCATION at a shared
+# store (e.g. Redis or Memcached) so cache invalidations reach every worker.
+CACHES = {
+    'default': {
+        'BACKEND': config('CACHE_BACKEND', default='django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': config('CACHE_LOCATION', default='ems-default'),
+    }
+}
+
+# Role permission cache (see app.utils.permission_cache)
+PERMISSION_CACHE_TTL = config('PERMISSION_CACHE_TTL', default=3600, cast=int)
+PERMISSION_CACHE_LOCAL_TTL = config('PERMISSION_CACHE_LOCAL_TTL', default=5, cast=float)
+
+# Authenticated principal cache TTL in seconds (see app.utils.principal)
+PRINCIPAL_CACHE_TTL = config('PRINCIPAL_CACHE_TTL', default=60, cast=int)
+
+# Revoked JWT denylist (see app.utils.token_denylist)
+TOKEN_DENYLIST_CAPACITY = config('TOKEN_DENYLIST_CAPACITY', default=1000000, cast=int)
+TOKEN_DENYLIST_SYNC_INTERVAL = config('TOKEN_DENYLIST_SYNC_INTERVAL', default=1, cast=float)
+
+# Rendered public event listing TTL in seconds; writes invalidate it earlier
+EVENT_CATALOGUE_CACHE_TTL = config('EVENT_CATALOGUE_CACHE_TTL', default=300, cast=int)
+
+# Event search backend: 'auto' (FULLTEXT on MySQL, inverted index elsewhere), 'fulltext', 'index' or 'icontains'
+EVENT_SEARCH_BACKEND = config('EVENT_SEARCH_BACKEND', default='auto')
+
+# Seat holds for pending bookings (see app.services.seat_hold_service)
+SEAT_HOLD_MINUTES = config('SEAT_HOLD_MINUTES', default=15, cast=int)
+SEAT_HOLD_SWEEP_BATCH = config('SEAT_HOLD_SWEEP_BATCH', default=1000, cast=int)
+# Seconds between in-process sweeps in each server worker; 0 leaves it to the release_expired_holds command
+SEAT_HOLD_SWEEP_INTERVAL = config('SEAT_HOLD_SWEEP_INTERVAL', default=0, cast=float)
+
+# Event waiting room (see app.services.waiting_room_service); TTLs in seconds
+WAITING_ROOM_TOKEN_TTL = config('WAITING_ROOM_TOKEN_TTL', default=3600, cast=int)
+WAITING_ROOM_PASS_TTL = config('WAITING_ROOM_PASS_TTL', default=120, cast=int)
+
+# Idempotency-Key support on create endpoints (see app.utils.idempotency); seconds
+IDEMPOTENCY_TTL = config('IDEMPOTENCY_TTL', default=86400, cast=int)
+IDEMPOTENCY_LOCK_TIMEOUT = config('IDEMPOTENCY_LOCK_TIMEOUT', default=30, cast=int)
+IDEMPOTENCY_WAIT_TIMEOUT = config('IDEMPOTENCY_WAIT_TIMEOUT', default=10, cast=float)
+
+# Ticket QR images are rendered on demand and cached by content hash (see app.utils.ticket_qr):
+# per process in memory and on disk in TICKET_QR_CACHE_DIR ('' disables the disk cache)
+TICKET_QR_CACHE_DIR = config('TICKET_QR_CACHE_DIR', default=str(BASE_DIR / 'var' / 'ticket_qr'))
+TICKET_QR_MEMORY_CACHE_SIZE = config('TICKET_QR_MEMORY_CACHE_SIZE', default=1024, cast=int)
+TICKET_QR_MAX_AGE = config('TICKET_QR_MAX_AGE', default=31536000, cast=int)
+# Processes pre-rendering the QR codes of bulk issues, and the smallest issue worth sending to them
+TICKET_QR_WORKERS = config('TICKET_QR_WORKERS', default=4, cast=int)
+TICKET_QR_PARALLEL_MIN = config('TICKET_QR_PARALLEL_MIN', default=16, cast=int)
+
+# Signed ticket codes (see app.utils.ticket_codes); an empty key signs with SECRET_KEY.
+# Keep previous keys in TICKET_SIGNING_FALLBACK_KEYS (comma-separated) while rotating
+TICKET_SIGNING_KEY = config('TICKET_SIGNING_KEY', default='')
+TICKET_SIGNING_FALLBACK_KEYS = config('TICKET_SIGNING_FALLBACK_KEYS', default='', cast=lambda v: [k for k in v.split(',') if k])
+# Let gate scans fall back to a database lookup for unsigned codes issued before signing
+TICKET_ACCEPT_UNSIGNED_CODES = config('TICKET_ACCEPT_UNSIGNED_CODES', default=True, cast=bool)
+# Seconds gate workers keep event and ticket type details for scans (see app.utils.scan_info)
+SCAN_INFO_CACHE_TTL = config('SCAN_INFO_CACHE_TTL', default=300, cast=int)
+
+# In-memory gate indexes of event tickets (see app.utils.gate_index); seconds
+GATE_INDEX_SYNC_INTERVAL = config('GATE_INDEX_SYNC_INTERVAL', default=5, cast=int)
+GATE_INDEX_TTL = config('GATE_INDEX_TTL', default=86400, cast=int)
+
+# Maximum lines accepted by the admin batch booking endpoint
+BATCH_BOOKING_MAX_LINES = config('BATCH_BOOKING_MAX_LINES', default=500, cast=int)
+
+# Include the SQL and EXPLAIN output of filtered list queries in paginated responses (see app.utils.filters)
+FILTER_EXPLAIN = config('FILTER_EXPLAIN', default=DEBUG, cast=bool)
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
@@ -145,10 +223,52 @@ REST_FRAMEWORK = {
 # Google OAuth Credentials
 GOOGLE_CLIENT_ID = config('GOOGLE_CLIENT_ID', default='')
 GOOGLE_CLIENT_SECRET = config('GOOGLE_CLIENT_SECRET', default='')
+# Optional: dotted path to a custom cert source class, or a JSON file of {kid: PEM}
+# used instead of fetching Google's certificates (offline testing with self-signed tokens)
+GOOGLE_CERT_SOURCE = config('GOOGLE_CERT_SOURCE', default='')
+GOOGLE_CERTS_FILE = config('GOOGLE_CERTS_FILE', default='')
 
 # Bakong Credentials
 BAKONG_ACCESS_TOKEN = config('BAKONG_ACCESS_TOKEN', default='')
 BAKONG_ACCOUNT_USERNAME = config('BAKONG_ACCOUNT_USERNAME', default='')
+# Point at the fake_bakong_server command for local testing
+BAKONG_PROD_BASE_API_URL = config('BAKONG_PROD_BASE_API_URL', default='https://api-bakong.nbc.gov.kh/v1')
+# Bakong gateway client (see app.utils.bakong_client); timeouts in seconds
+BAKONG_CONNECT_TIMEOUT = config('BAKONG_CONNECT_TIMEOUT', default=3, cast=float)
+BAKONG_HTTP_TIMEOUT = config('BAKONG_HTTP_TIMEOUT', default=10, cast=float)
+BAKONG_HTTP_POOL_SIZE = config('BAKONG_HTTP_POOL_SIZE', default=10, cast=int)
+# Retries for connection errors and 429/5xx, with jittered exponential backoff starting at BAKONG_HTTP_BACKOFF
+BAKONG_HTTP_RETRIES = config('BAKONG_HTTP_RETRIES', default=2, cast=int)
+BAKONG_HTTP_BACKOFF = config('BAKONG_HTTP_BACKOFF', default=0.2, cast=float)
+# Consecutive failed calls that open the circuit, and seconds before a trial call is let through
+BAKONG_BREAKER_THRESHOLD = config('BAKONG_BREAKER_THRESHOLD', default=5, cast=int)
+BAKONG_BREAKER_COOLDOWN = config('BAKONG_BREAKER_COOLDOWN', default=30, cast=float)
+# Optional dotted path to a client class, e.g. app.utils.bakong_client.LocalBakongClient for offline testing
+BAKONG_CLIENT = config('BAKONG_CLIENT', default='')
+
+# Background Bakong reconciliation (see app.services.bakong_reconcile_service)
+# Seconds between in-process runs in each server worker (needs a shared cache); 0 leaves it to the reconcile_bakong_payments command
+BAKONG_RECONCILE_INTERVAL = config('BAKONG_RECONCILE_INTERVAL', default=0, cast=float)
+# Hashes per check_transaction_by_md5_list call (Bakong allows at most 50)
+BAKONG_RECONCILE_BATCH = config('BAKONG_RECONCILE_BATCH', default=50, cast=int)
+# Seconds after a QR expires that its payment is still checked, for late settlements
+BAKONG_RECONCILE_GRACE = config('BAKONG_RECONCILE_GRACE', default=120, cast=int)
+# Seconds a pending status answered to pollers may be reused
+BAKONG_STATUS_CACHE_TTL = config('BAKONG_STATUS_CACHE_TTL', default=10, cast=int)
+
+# Rendered KHQR PNGs kept per process (see app.utils.khqr_images), and their client cache lifetime in seconds
+KHQR_IMAGE_CACHE_SIZE = config('KHQR_IMAGE_CACHE_SIZE', default=512, cast=int)
+KHQR_IMAGE_MAX_AGE = config('KHQR_IMAGE_MAX_AGE', default=86400, cast=int)
+
+# Pushed payment status (see app.utils.payment_events): the backend relays events between
+# processes; the cache backend needs a shared CACHE_BACKEND when running several workers
+PAYMENT_EVENTS_BACKEND = config('PAYMENT_EVENTS_BACKEND', default='app.utils.payment_events.CachePaymentEventBackend')
+PAYMENT_EVENTS_POLL_INTERVAL = config('PAYMENT_EVENTS_POLL_INTERVAL', default=0.5, cast=float)
+PAYMENT_EVENTS_TTL = config('PAYMENT_EVENTS_TTL', default=600, cast=int)
+# Status stream heartbeat and lifetime, and the longest check-status long-poll, in seconds
+PAYMENT_STREAM_HEARTBEAT = config('PAYMENT_STREAM_HEARTBEAT', default=15, cast=int)
+PAYMENT_STREAM_MAX_SECONDS = config('PAYMENT_STREAM_MAX_SECONDS', default=600, cast=int)
+PAYMENT_STATUS_MAX_WAIT = config('PAYMENT_STATUS_MAX_WAIT', default=30, cast=float)
 
 # Simple JWT settings
 SIMPLE_JWT = {
@@ -185,6 +305,8 @@ SIMPLE_JWT = {
 
 # CORS settings
 CORS_ALLOW_ALL_ORIGINS = True # In production, restrict this to specific origins
+CORS_ALLOW_HEADERS = (*default_headers, 'idempotency-key', 'x-admission-pass')
+CORS_EXPOSE_HEADERS = ['Idempotent-Replayed', 'Retry-After', 'ETag']
 
 # drf_yasg settings
 SWAGGER_SETTINGS = {